@@ -1,57 +1,354 @@
-from typing import Optional
+import random
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, TYPE_CHECKING
 from Screen import Screen
 from GameScreen import GameScreen
-from WordList import load_words, choose_random_word
+from Resources import Resources
+from WordList import choose_random_word
+from WordIndex import WordShards
+from MeaningCache import MeaningCache
+from ConstraintIndex import ConstraintIndex
+from PrefixTrie import PrefixTrie
+from Morphology import load_inflections
+from Profiler import Profiler
+from Stats import Stats
+
+# Imported on first use: the first frame never needs them
+if TYPE_CHECKING:
+    from MultiBoardScreen import MultiBoardScreen
+    from ResultScreen import ResultScreen
+    from Difficulty import DifficultySelector
+
+# Longest the idle loop sleeps before checking the screen again
+IDLE_WAIT_MS = 1000
+
+# How often the running game looks at WordList.txt for edits
+WORDS_POLL_SEC = 1.0
 
 class App:
-    def __init__(self):
-        # Load all valid 5 - letter words from file
-        self.words = load_words("WordList.txt")
+    def __init__(self, seed: Optional[int] = None, length: int = 5, boards: int = 1,
+                 tier: Optional[str] = None, stats_path: Optional[str] = "stats.bin"):
+        # Window, fonts and theme first, so the window is up (and painted)
+        # while everything below loads; created once, shared by screens
+        self.resources = Resources((1200, 800))
+
+        # Valid words of each length (4 - 8) through compiled, memory-mapped
+        # per-length indexes (rebuilt automatically when WordList.txt changes).
+        # A shard is only loaded once its length is played; each one is a
+        # sorted sequence of words with O(log n) membership.
+        self.shards = WordShards("WordList.txt")
+
+        # Plurals of known words, precomputed by Morphology.py (optional)
+        self.inflections = load_inflections("Inflections.txt")
+
+        # Bitset indexes for live "N words remaining" tracking and prefix
+        # automata for live "no word starts like this" feedback, per length.
+        # Built on a worker thread (see indexes()); screens attach them when ready
+        self._index_builder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wordle-index")
+        self._indexes: dict[int, Future] = {}
+        self.use_length(length)
+
+        # Dictionary-API verdicts, kept on disk across rounds and restarts
+        self.meaning_cache = MeaningCache("meaning_cache.sqlite3")
+
+        # Answers come from a seeded RNG so recorded sessions replay exactly
+        self.seed = seed if seed is not None else random.randrange(1 << 63)
+        self.rng = random.Random(self.seed)
+
+        # Difficulty tier for answers (None = uniform); selectors per length,
+        # loaded from Difficulty.py's catalog on first use
+        self.tier = tier
+        self._selectors = {}
+        if tier is not None and self.selector() is None:
+            raise ValueError(f"No difficulty catalog for {self.length}-letter words (run Difficulty.py)")
+
+        # Finished rounds: append-only log with running totals (None = memory only)
+        self.stats = Stats(stats_path)
+
+        # Input recorder / replayer (Replay.py), set by run()
+        self.session = None
+
+        # Last look at WordList.txt (see _poll_words)
+        self._words_polled = time.monotonic()
 
         # Store game - wide data in a shared dictionary
         self.context = {
-            "answer": choose_random_word(self.words), # The target word to guess
-            "attempts": [],                           # List of previous guesses
-            "max_attempts": 6,                        # Maximum allowed guesses
-            "result_type": None,                      # "victory" | "defeat"
+            "answer": None,                                     # The target word to guess
+            "answers": [],                                      # One per board (multi-board mode)
+            "boards": boards,                                   # 1 | 2 | 4 | 8
+            "attempts": [],                                     # List of previous guesses
+            "max_attempts": 6,                                  # Maximum allowed guesses
+            "length": self.length,                              # Letters per word
+            "result_type": None,                                # "victory" | "defeat"
         }
 
+        # Frame-time instrumentation (off unless WORDLE_PROFILE is set or F3 is pressed)
+        self.profiler = Profiler.from_env()
+
+        # Screens are pooled and reset between rounds instead of rebuilt
+        self._game_screen: Optional[GameScreen] = None
+        self._multi_screen: Optional["MultiBoardScreen"] = None
+        self._result_screen: Optional["ResultScreen"] = None
+
         # Set the initial screen to the main game screen
         # Optional[Screen] means it can be either a Screen or None
-        self.current: Optional[Screen] = GameScreen(self)   
+        self._draw_answers()
+        self.current: Optional[Screen] = self.game_screen()
+
+    # Pooled screens
+    def game_screen(self) -> GameScreen:
+        if self.context["boards"] > 1:
+            if self._multi_screen is None:
+                from MultiBoardScreen import MultiBoardScreen
+                self._multi_screen = MultiBoardScreen(self)
+            else:
+                self._multi_screen.reset()
+            return self._multi_screen
+        if self._game_screen is None:
+            self._game_screen = GameScreen(self)
+        else:
+            self._game_screen.reset()
+        return self._game_screen
+
+    def result_screen(self, result_type: str, answer: str) -> "ResultScreen":
+        if self._result_screen is None:
+            from ResultScreen import ResultScreen
+            self._result_screen = ResultScreen(self, result_type, answer)
+        else:
+            self._result_screen.reset(result_type, answer)
+        return self._result_screen
 
     # Change to another screen (or None to end the game)
     def set_screen(self, screen: Optional[Screen]):         
         self.current = screen
+        if screen is not None:
+            self._attach(screen)
 
-    # Restart
-    def new_game(self): 
-        from WordList import choose_random_word
-        self.context["answer"] = choose_random_word(self.words)
+    def _attach(self, screen: Screen):
+        if self.session is not None and hasattr(screen, "validator"):
+            screen.validator = self.session.wrap_validator(screen.validator)
+        if self.profiler.enabled:
+            self._instrument(screen)
+
+    def _instrument(self, screen: Screen):
+        self.profiler.instrument(screen)
+        validator = getattr(screen, "validator", None)
+        if validator is not None:
+            # Guess to verdict, network included ("validate" is check() itself)
+            self.profiler.instrument_future(validator, "check", "verdict")
+
+    # Switch the active word list (ValueError if that length has no words)
+    def use_length(self, length: int):
+        self.word_index = self.shards.get(length)
+        self.words = self.word_index
+        if length not in self._indexes:
+            self._indexes[length] = self._index_builder.submit(self._build_indexes, self.words, length)
+        self.length = length
+        if hasattr(self, "context"):
+            self.context["length"] = length
+
+    def _build_indexes(self, words, length: int) -> tuple[ConstraintIndex, PrefixTrie]:
+        # Everything the validator accepts offline: the list and known plurals
+        forms = [w for w in self.inflections if len(w) == length]
+        return ConstraintIndex(words), PrefixTrie(list(words) + forms)
+
+    # (ConstraintIndex, PrefixTrie) for the current length; with wait=False,
+    # None while they are still being built
+    def indexes(self, wait: bool = True) -> Optional[tuple[ConstraintIndex, PrefixTrie]]:
+        future = self._indexes[self.length]
+        if not wait and not future.done():
+            return None
+        return future.result()
+
+    @property
+    def constraint_index(self) -> ConstraintIndex:
+        return self.indexes()[0]
+
+    @property
+    def prefix_trie(self) -> PrefixTrie:
+        return self.indexes()[1]
+
+    # Apply edits to WordList.txt in place: the shards, their indexes and the
+    # selectors change by the difference only. Answers of the round in
+    # progress (keep, by default) stay in the list until the next round.
+    # Returns {length: (added, removed)}.
+    def reload_words(self, keep=None) -> dict:
+        if keep is None:
+            keep = self.context["answers"] if self.context["result_type"] is None else ()
+        # A build still running reads the shard being edited: let it finish
+        for future in self._indexes.values():
+            future.result()
+        changes = self.shards.reload(keep)
+        for length, (added, removed) in changes.items():
+            if length in self._indexes:
+                index, trie = self._indexes[length].result()
+                index.update(added, removed)
+                trie.update(added, removed)
+            if self._selectors.get(length) is not None:
+                self._selectors[length].update(added, removed)
+        if changes.get(self.length) and self.current is not None:
+            self.current.words_changed()
+        return changes
+
+    def _poll_words(self):
+        now = time.monotonic()
+        if now - self._words_polled >= WORDS_POLL_SEC:
+            self._words_polled = now
+            if self.shards.changed():
+                self.reload_words()
+
+    # Tiered answer selector for the current length (None without a catalog)
+    def selector(self) -> Optional["DifficultySelector"]:
+        if self.length not in self._selectors:
+            from Difficulty import DifficultySelector
+            try:
+                sel = DifficultySelector.load("WordList.txt", self.length,
+                                              seed=self.rng.randrange(1 << 63), words=self.words)
+            except (OSError, ValueError):
+                sel = None
+            self._selectors[self.length] = sel
+        return self._selectors[self.length]
+
+    # Distinct answers, one per board (from the tier when one is set); fewer
+    # boards when the tier has fewer words left, ValueError when it has none
+    def _draw_answers(self):
+        sel = self.selector() if self.tier else None
+        left = sel.available(self.tier) if sel is not None else len(self.words)
+        if left == 0:
+            raise ValueError(f"Every {self.tier} word has been removed from the list")
+        n = min(self.context["boards"], left)
+        answers = []
+        while len(answers) < n:
+            word = sel.draw(self.tier) if sel is not None else choose_random_word(self.words, self.rng)
+            if word not in answers:
+                answers.append(word)
+        self.context["answers"] = answers
+        self.context["answer"] = answers[0]
+        self._round_started = time.monotonic()
+
+    # Round over: log it to the stats and show the result
+    def end_game(self, outcome: str, answer: str, guesses: int):
+        self.context["result_type"] = outcome
+        self.stats.record(self.word_index.index_of(self.context["answer"]), self.length,
+                          self.context["boards"], guesses, outcome == "victory",
+                          time.monotonic() - self._round_started)
+        self.set_screen(self.result_screen(outcome, answer))
+
+    # Restart (optionally with another word length or board count)
+    def new_game(self, length: Optional[int] = None, boards: Optional[int] = None): 
+        if length is not None and length != self.length:
+            self.use_length(length)
+        if boards is not None:
+            self.context["boards"] = boards
+        if self.shards.held:
+            # Words dropped during the last round can go now
+            self.reload_words(keep=())
+        self._draw_answers()
         self.context["attempts"].clear()
         self.context["result_type"] = None
-        self.set_screen(GameScreen(self))
+        self.set_screen(self.game_screen())
         
     # Run game
-    def run(self):
+    def run(self, session=None):
+        """
+        Main loop. session is an optional Replay.Recorder (logs input and
+        verdicts) or Replay.Replayer (feeds a log back, unthrottled, and
+        returns when it runs out). Returns the number of frames run.
+        """
         import pygame
 
-        clock = None
-        while self.current is not None:
-            if clock is None:
-                clock = pygame.time.Clock()
+        prof = self.profiler
+        self.session = session
+        replaying = session is not None and hasattr(session, "events")
+        recording = session is not None and not replaying
+        self._attach(self.current)
+        clock = pygame.time.Clock()
+        frame = 0
+        try:
+            while self.current is not None:
+                if session is not None:
+                    session.begin_frame(frame)
+                timed = prof.enabled
+                if timed:
+                    t0 = time.perf_counter()
+                    prof.restore(self.resources.surface)
+                dirty = self.current.render()
+                if timed:
+                    t1 = time.perf_counter()
+                    prof.record("render", t1 - t0)
+                    if prof.overlay:
+                        dirty = list(dirty) + [prof.draw_overlay(self.resources.surface)]
+                if dirty:
+                    pygame.display.update(dirty)
 
-            self.current.render()
+                # Replay: next frame's input at once. Animating: poll at 60 FPS.
+                # Idle: sleep until input arrives.
+                if replaying:
+                    if session.finished:
+                        break
+                    events = session.events(frame)
+                elif self.current.is_animating():
+                    clock.tick(60)
+                    events = pygame.event.get()
+                else:
+                    first = pygame.event.wait(IDLE_WAIT_MS)
+                    events = [] if first.type == pygame.NOEVENT else [first] + pygame.event.get()
+
+                if recording:
+                    session.record(frame, events)
+
+                if timed:
+                    t2 = time.perf_counter()
+                for i, e in enumerate(events):
+                    if e.type == pygame.KEYDOWN and e.key == pygame.K_F3:
+                        self._toggle_overlay()
+                        continue
+                    if e.type == pygame.VIDEORESIZE:
+                        # Dragging queues a burst of sizes: only the last of a run matters
+                        if i + 1 == len(events) or events[i + 1].type != pygame.VIDEORESIZE:
+                            self.resize(e.size)
+                        continue
+                    self.current.handle(e)
+                    if self.current is None:
+                            break
+                if timed:
+                    t3 = time.perf_counter()
+                    prof.record("handle", t3 - t2)
 
-            for e in pygame.event.get():
-                self.current.handle(e)
                 if self.current is None:
-                        break
+                    break
 
-            if self.current is None:
-                break
+                # Recordings replay against the list they were made with
+                if not replaying:
+                    self._poll_words()
+                self.current.update()
+                if timed:
+                    t4 = time.perf_counter()
+                    prof.record("update", t4 - t3)
+                    prof.record("frame", (t1 - t0) + (t4 - t2))
+                frame += 1
+        finally:
+            if session is not None:
+                session.close()
+            self.stats.close()
+            if prof.used:
+                prof.dump()
+        return frame
 
-            self.current.update()
-            clock.tick(60)
-            
+    # New window size: resources first, then the visible screen (pooled
+    # screens pick the size up when they are reset)
+    def resize(self, size):
+        if self.resources.resize(size) and self.current is not None:
+            self.current.relayout()
 
+    def _toggle_overlay(self):
+        prof = self.profiler
+        prof.toggle_overlay()
+        self._instrument(self.current)
+        if not prof.overlay:
+            # Repaint whatever the overlay covered
+            rect = prof.restore(self.resources.surface)
+            if rect is not None:
+                import pygame
+                pygame.display.update(rect)
@@ -0,0 +1,205 @@
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Letter counts are packed in 5-bit fields; bit 4 of each field is a guard
+# so min/max checks for all 26 letters take one subtraction each
+FIELD = 5
+GUARD = sum(16 << (FIELD * l) for l in range(26))
+
+def pack_counts(counts) -> int:
+    return sum(n << (FIELD * l) for l, n in enumerate(counts))
+
+
+class ConstraintIndex:
+    """
+    Static bitset index over a word list (bit i = words[i]).
+    at[p][l]      words with letter l at position p
+    atleast[l][c] words containing letter l at least c times (c = 1..length)
+    pos_sig[i]    word i's letters as one bit per (position, letter)
+    cnt_sig[i]    word i's letter counts packed in 5-bit fields
+    Built once per word list; each game narrows its own Candidates.
+    update() edits it in place: new words get the next bits, removed
+    ones are only dropped from `all` (every tracker starts from it).
+    """
+
+    def __init__(self, words):
+        self.words = list(words)
+        self.length = len(self.words[0]) if self.words else 5
+        self.all = (1 << len(self.words)) - 1
+
+        # Fill byte bitmaps first; OR-ing into big ints per word would be O(n^2)
+        nbytes = (len(self.words) + 7) // 8
+        self.pos_sig = []
+        self.cnt_sig = []
+        at = [[bytearray(nbytes) for _ in range(26)] for _ in range(self.length)]
+        atleast = [[bytearray(nbytes) for _ in range(self.length + 2)] for _ in range(26)]
+        for i, w in enumerate(self.words):
+            byte, bit = i >> 3, 1 << (i & 7)
+            counts = {}
+            for p, ch in enumerate(w):
+                l = ord(ch) - 65
+                at[p][l][byte] |= bit
+                counts[l] = counts.get(l, 0) + 1
+            for l, n in counts.items():
+                for c in range(1, n + 1):
+                    atleast[l][c][byte] |= bit
+            self.pos_sig.append(sum(1 << (p * 26 + ord(ch) - 65) for p, ch in enumerate(w)))
+            self.cnt_sig.append(sum(n << (FIELD * l) for l, n in counts.items()))
+
+        self.at = [[int.from_bytes(b, "little") for b in row] for row in at]
+        self.atleast = [[int.from_bytes(b, "little") for b in row] for row in atleast]
+
+    def tracker(self) -> "Candidates":
+        return Candidates(self)
+
+    def update(self, added=(), removed=()):
+        # Word -> bit, built on the first edit
+        if not hasattr(self, "_bit"):
+            self._bit = {w: i for i, w in enumerate(self.words)}
+
+        # Bits are gathered per bitset and applied with one big-int op each
+        # (new words relative to `first`, so the gathering stays small)
+        gone = 0
+        for w in removed:
+            i = self._bit.get(w)
+            if i is not None:
+                gone |= 1 << i
+        self.all &= ~gone
+
+        first = len(self.words)
+        revived, new = 0, 0
+        at, atleast = {}, {}
+        for w in added:
+            i = self._bit.get(w)
+            if i is not None:
+                revived |= 1 << i
+                continue
+            i = self._bit[w] = len(self.words)
+            bit = 1 << (i - first)
+            new |= bit
+            self.words.append(w)
+            counts = {}
+            for p, ch in enumerate(w):
+                l = ord(ch) - 65
+                at[p, l] = at.get((p, l), 0) | bit
+                counts[l] = counts.get(l, 0) + 1
+            for l, n in counts.items():
+                for c in range(1, n + 1):
+                    atleast[l, c] = atleast.get((l, c), 0) | bit
+            self.pos_sig.append(sum(1 << (p * 26 + ord(ch) - 65) for p, ch in enumerate(w)))
+            self.cnt_sig.append(pack_counts(counts.get(l, 0) for l in range(26)))
+        for (p, l), bits in at.items():
+            self.at[p][l] |= bits << first
+        for (l, c), bits in atleast.items():
+            self.atleast[l][c] |= bits << first
+        self.all |= revived | new << first
+
+
+# Switch to the survivor list below len(words) / SPARSE_RATIO candidates
+SPARSE_RATIO = 256
+
+# Indices of the set bits, lowest first
+def _bit_indices(bits: int) -> list[int]:
+    s = bin(bits)[:1:-1]
+    out, i = [], s.find("1")
+    while i != -1:
+        out.append(i)
+        i = s.find("1", i + 1)
+    return out
+
+
+class Candidates:
+    """
+    Live candidate set for one game.
+    pos_mask[p]  26-bit mask of letters still allowed at position p
+    min_count / max_count per letter, derived from the feedback so far
+    bits         candidate bitset, narrowed in place by apply()
+    Once the set is sparse it switches to a list of surviving indices
+    checked against packed signatures, so later guesses cost O(survivors).
+    """
+
+    def __init__(self, index: ConstraintIndex):
+        self.index = index
+        full = (1 << 26) - 1
+        self.pos_mask = [full] * index.length
+        self.min_count = [0] * 26
+        self.max_count = [index.length] * 26
+        self.bits = index.all
+        self.alive = None  # list[int] once sparse
+
+    def __len__(self) -> int:
+        return self.remaining
+
+    @property
+    def remaining(self) -> int:
+        if self.alive is not None:
+            return len(self.alive)
+        return self.bits.bit_count()
+
+    def words(self) -> list[str]:
+        words = self.index.words
+        alive = self.alive if self.alive is not None else _bit_indices(self.bits)
+        return [words[i] for i in alive]
+
+    def apply(self, guess: str, colors) -> int:
+        # Fold one guess's feedback into the constraints; returns the new count
+        idx = self.index
+        masks = []  # (bitset, keep) pairs to AND into the dense bitset
+
+        seen = {}
+        grayed = set()
+        for p, (ch, col) in enumerate(zip(guess, colors)):
+            l = ord(ch) - 65
+            if col == "green":
+                if self.pos_mask[p] != 1 << l:
+                    self.pos_mask[p] = 1 << l
+                    masks.append((idx.at[p][l], True))
+                seen[l] = seen.get(l, 0) + 1
+            else:
+                if self.pos_mask[p] >> l & 1:
+                    self.pos_mask[p] &= ~(1 << l)
+                    masks.append((idx.at[p][l], False))
+                if col == "yellow":
+                    seen[l] = seen.get(l, 0) + 1
+                else:
+                    grayed.add(l)
+
+        for l, n in seen.items():
+            if n > self.min_count[l]:
+                self.min_count[l] = n
+                masks.append((idx.atleast[l][n], True))
+        for l in grayed:
+            n = seen.get(l, 0)
+            if n < self.max_count[l]:
+                self.max_count[l] = n
+                masks.append((idx.atleast[l][n + 1], False))
+
+        if self.alive is not None:
+            self._filter_alive()
+            return len(self.alive)
+
+        bits = self.bits
+        for mask, keep in masks:
+            bits = bits & mask if keep else bits & ~mask
+        self.bits = bits
+
+        count = bits.bit_count()
+        if count * SPARSE_RATIO <= len(idx.words):
+            self.alive = _bit_indices(bits)
+        return count
+
+    def _filter_alive(self):
+        idx = self.index
+        allowed = 0
+        for p, mask in enumerate(self.pos_mask):
+            allowed |= mask << (p * 26)
+        forbid = ~allowed
+        lo = pack_counts(self.min_count)
+        hi = pack_counts(self.max_count) | GUARD
+
+        pos_sig, cnt_sig = idx.pos_sig, idx.cnt_sig
+        self.alive = [
+            i for i in self.alive
+            if not pos_sig[i] & forbid
+            and ((cnt_sig[i] | GUARD) - lo) & GUARD == GUARD
+            and (hi - cnt_sig[i]) & GUARD == GUARD
+        ]
@@ -0,0 +1,271 @@
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+from array import array
+from pathlib import Path
+
+from WordIndex import pack_word, unpack_word, typecode_for
+from WordList import load_words
+
+# Answer-difficulty catalog: every answer scored by the average guesses a
+# reference strategy needs to solve it, stored next to the word list as
+#   WordList.<length>.dif
+# header (magic "WDIF", version, length, count, trials, strategy name)
+# followed by the packed words (sorted) and their scores in 1/100 guess.
+# Rebuilding only scores words the catalog does not have yet.
+#
+# The default reference is the "random" player from Simulate.py (a random
+# word consistent with the feedback so far) averaged over 16 games: it
+# grades answers more finely than the entropy solver, which needs 3 or 4
+# guesses for nearly every word.
+#
+# DifficultySelector splits the catalog into equal-size tiers and draws
+# from each through a seeded permutation: O(1) per draw, and no answer
+# repeats until its tier has been used up.
+HEADER = struct.Struct("=4sHHIH32s")
+MAGIC = b"WDIF"
+VERSION = 1
+SCALE = 100
+
+TIERS = ("easy", "medium", "hard")
+
+# Strategies whose guesses depend only on the history (safe to memoize)
+DETERMINISTIC = {"solver", "first"}
+
+def catalog_path_for(text_path, length: int = 5) -> Path:
+    return Path(text_path).with_suffix(f".{length}.dif")
+
+
+# ---------------- Catalog file ----------------
+def save_catalog(path, scores: dict, length: int, strategy: str, trials: int):
+    words = sorted(scores)
+    packed = array(typecode_for(length), (pack_word(w) for w in words))
+    values = array("H", (min(0xFFFF, round(scores[w] * SCALE)) for w in words))
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, length, len(words), trials, strategy.encode()[:32]))
+        f.write(packed.tobytes())
+        f.write(values.tobytes())
+    os.replace(tmp, path)
+
+def load_catalog(path) -> tuple[dict, dict]:
+    """
+    (word -> score, info) from a catalog file.
+    Raises OSError / ValueError when missing or unreadable.
+    """
+    data = Path(path).read_bytes()
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is not a difficulty catalog")
+    magic, version, length, count, trials, strategy = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a difficulty catalog")
+
+    packed = array(typecode_for(length))
+    end = HEADER.size + count * packed.itemsize
+    packed.frombytes(data[HEADER.size:end])
+    values = array("H")
+    values.frombytes(data[end:end + count * values.itemsize])
+    if len(packed) != count or len(values) != count:
+        raise ValueError(f"{path} is truncated")
+
+    scores = {unpack_word(p, length): v / SCALE for p, v in zip(packed, values)}
+    info = {"length": length, "trials": trials, "strategy": strategy.rstrip(b"\0").decode()}
+    return scores, info
+
+
+# ---------------- Scoring (worker processes) ----------------
+_guesser = None
+_max_attempts = 6
+
+def _memoized(guesser):
+    from GameEngine import encode
+
+    memo = {}
+
+    def guess(history, rng):
+        key = tuple((g, encode(c)) for g, c in history)
+        if key not in memo:
+            memo[key] = guesser(history, rng)
+        return memo[key]
+    return guess
+
+def _init_worker(words, strategy: str, max_attempts: int):
+    global _guesser, _max_attempts
+    from Simulate import resolve_strategy
+
+    _guesser = resolve_strategy(strategy)(words)
+    if strategy in DETERMINISTIC:
+        _guesser = _memoized(_guesser)
+    _max_attempts = max_attempts
+
+def _score_chunk(args):
+    from Simulate import play_game
+
+    answers, trials, seed = args
+    out = []
+    for answer in answers:
+        rng = random.Random(f"{seed}:{answer}")
+        total = 0
+        for _ in range(trials):
+            # A loss counts as one guess past the limit
+            total += play_game(answer, _guesser, rng, _max_attempts) or _max_attempts + 1
+        out.append((answer, total / trials))
+    return out
+
+def score_answers(words, answers, strategy: str = "random", trials: int = 16, processes=None,
+                  max_attempts: int = 6, seed: int = 0, chunk: int = 64) -> dict:
+    answers = list(answers)
+    processes = processes or os.cpu_count() or 1
+    # Neighbouring answers share solver branches, so keep chunks contiguous
+    jobs = [(answers[i:i + chunk], trials, seed) for i in range(0, len(answers), chunk)]
+    if strategy == "solver":
+        # Build the feedback matrix and opening scores once, before forking
+        from Solver import Solver
+        Solver(words).opening_scores(processes)
+
+    scores = {}
+    if processes > 1 and len(jobs) > 1:
+        with multiprocessing.Pool(processes, initializer=_init_worker,
+                                  initargs=(words, strategy, max_attempts)) as pool:
+            for part in pool.imap_unordered(_score_chunk, jobs):
+                scores.update(part)
+    else:
+        _init_worker(words, strategy, max_attempts)
+        for job in jobs:
+            scores.update(_score_chunk(job))
+    return scores
+
+def build_catalog(text_path="WordList.txt", length: int = 5, strategy: str = "random", trials: int = 16,
+                  processes=None, out_path=None, full: bool = False) -> dict:
+    words = load_words(text_path, length)
+    path = Path(out_path) if out_path else catalog_path_for(text_path, length)
+
+    old = {}
+    if not full and path.exists():
+        try:
+            old, info = load_catalog(path)
+            if (info["strategy"], info["trials"], info["length"]) != (strategy, trials, length):
+                old = {}    # scored another way: start over
+        except (OSError, ValueError):
+            old = {}
+
+    current = set(words)
+    kept = {w: s for w, s in old.items() if w in current}
+    todo = [w for w in words if w not in kept]
+
+    t0 = time.perf_counter()
+    new = score_answers(words, todo, strategy, trials, processes) if todo else {}
+    elapsed = time.perf_counter() - t0
+    kept.update(new)
+    save_catalog(path, kept, length, strategy, trials)
+
+    values = sorted(kept.values())
+    return {
+        "catalog": str(path),
+        "words": len(kept),
+        "scored": len(new),
+        "reused": len(kept) - len(new),
+        "removed": len(old) - (len(kept) - len(new)),
+        "elapsed_sec": round(elapsed, 2),
+        "mean_score": round(sum(values) / len(values), 3) if values else None,
+        "tier_bounds": tier_bounds(values),
+    }
+
+# Highest score in each tier (equal-size tiers over the sorted scores)
+def tier_bounds(sorted_scores, tiers=TIERS) -> dict:
+    n = len(sorted_scores)
+    if not n:
+        return {}
+    return {name: sorted_scores[min(n - 1, (i + 1) * n // len(tiers) - 1)] for i, name in enumerate(tiers)}
+
+
+class DifficultySelector:
+    """
+    Tiered answer draws over a catalog.
+    Words are sorted by score and cut into len(tiers) equal tiers; each
+    tier is consumed through its own seeded permutation. Words removed
+    from the list later are skipped (update()); added ones have no score
+    until the catalog is rebuilt.
+    """
+
+    def __init__(self, scores: dict, seed=None, tiers=TIERS, words=None):
+        # words: restrict to this list (e.g. the playable shard)
+        if words is not None:
+            allowed = set(words)
+            scores = {w: s for w, s in scores.items() if w in allowed}
+        if len(scores) < len(tiers):
+            raise ValueError("Not enough scored words for the tiers")
+
+        # Equal scores are ordered by a fixed hash, not alphabetically, so a
+        # tier boundary inside a run of ties does not split it by first letter
+        ranked = sorted(scores, key=lambda w: (scores[w], zlib.crc32(w.encode())))
+        n = len(ranked)
+        self.tiers = tuple(tiers)
+        self.scores = scores
+        self.pools = {name: ranked[i * n // len(tiers):(i + 1) * n // len(tiers)]
+                      for i, name in enumerate(self.tiers)}
+        self.rng = random.Random(seed)
+        self.excluded = set()
+        self._order = {}
+        self._pos = {}
+        for name in self.tiers:
+            self._shuffle(name)
+
+    @classmethod
+    def load(cls, text_path="WordList.txt", length: int = 5, seed=None, words=None) -> "DifficultySelector":
+        scores, _ = load_catalog(catalog_path_for(text_path, length))
+        return cls(scores, seed, words=words)
+
+    def _shuffle(self, tier: str):
+        order = list(self.pools[tier])
+        self.rng.shuffle(order)
+        self._order[tier] = order
+        self._pos[tier] = 0
+
+    def update(self, added=(), removed=()):
+        self.excluded.update(removed)
+        self.excluded.difference_update(added)
+
+    # Words of the tier that can still be drawn
+    def available(self, tier: str) -> int:
+        pool = self.pools[tier]
+        return len(pool) - len(self.excluded.intersection(pool))
+
+    def draw(self, tier: str) -> str:
+        if tier not in self.pools:
+            raise ValueError(f"Unknown tier: {tier} (use one of {', '.join(self.tiers)})")
+        for _ in range(len(self._order[tier]) + 1):
+            if self._pos[tier] >= len(self._order[tier]):
+                self._shuffle(tier)   # whole tier used: start a new cycle
+            word = self._order[tier][self._pos[tier]]
+            self._pos[tier] += 1
+            if word not in self.excluded:
+                return word
+        raise ValueError(f"Every {tier} word has been removed from the list")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score every answer's difficulty into a catalog next to the word list")
+    parser.add_argument("words", nargs="?", default="WordList.txt")
+    parser.add_argument("--length", type=int, default=5)
+    parser.add_argument("-s", "--strategy", default="random", help="reference strategy (see Simulate.py)")
+    parser.add_argument("--trials", type=int, default=16, help="games per answer (1 is enough for solver / first)")
+    parser.add_argument("-j", "--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("-o", "--output", help="catalog path (default: <words>.<length>.dif)")
+    parser.add_argument("--full", action="store_true", help="rescore every word, not just new ones")
+    args = parser.parse_args()
+
+    report = build_catalog(args.words, args.length, args.strategy, args.trials,
+                           args.processes, args.output, args.full)
+    print(json.dumps(report, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+
+from GameEngine import DIGIT, all_green, decode, encode, evaluate_guess
+
+# Per-tile digits of a packed pattern: pattern = sum(digit[i] * 3**i)
+GRAY, YELLOW, GREEN = DIGIT["gray"], DIGIT["yellow"], DIGIT["green"]
+
+# Smallest dtype that holds every pattern of a length (3**L values)
+def pattern_dtype(length: int):
+    return np.uint8 if 3 ** length <= 256 else np.uint16
+
+# (n, length) uint8 array of letter codes 0..25
+def to_codes(words, length: int = 5) -> np.ndarray:
+    if not words:
+        return np.zeros((0, length), dtype=np.uint8)
+    buf = "".join(words).encode("ascii")
+    arr = np.frombuffer(buf, dtype=np.uint8).reshape(len(words), length)
+    return arr - ord("A")
+
+
+def evaluate_codes(guesses: np.ndarray, answers: np.ndarray) -> np.ndarray:
+    """
+    Vectorized evaluate_guess for letter-code arrays.
+    guesses (g, L) x answers (a, L) -> (g, a) packed patterns
+    (uint8 up to 5 letters, uint16 above).
+    A tile is yellow when it is not green and fewer earlier non-green
+    copies of its letter exist in the guess than unmatched copies in
+    the answer, which reproduces the left-to-right double-letter rule.
+    """
+    length = guesses.shape[1]
+    gcols = [guesses[:, k][:, None] for k in range(length)]   # (g, 1)
+    acols = [answers[:, k][None, :] for k in range(length)]   # (1, a)
+    green = [gcols[k] == acols[k] for k in range(length)]     # (g, a) each
+
+    dtype = pattern_dtype(length)
+    out = np.zeros((len(guesses), len(answers)), dtype=dtype)
+    for k in range(length):
+        # unmatched copies in the answer of the letter at guess position k
+        avail = np.zeros(out.shape, dtype=np.uint8)
+        for m in range(length):
+            avail += (gcols[k] == acols[m]) & ~green[m]
+        # earlier non-green copies in the guess of the same letter
+        used = np.zeros(out.shape, dtype=np.uint8)
+        for j in range(k):
+            used += (gcols[k] == gcols[j]) & ~green[j]
+        yellow = ~green[k] & (used < avail)
+        out += (green[k] * (GREEN * 3 ** k) + yellow * (YELLOW * 3 ** k)).astype(dtype)
+    return out
+
+
+class FeedbackMatrix:
+    """
+    Packed guess x answer pattern matrix for a word list.
+    Built once with NumPy and cached on disk as <cache_dir>/feedback_<hash>.npy,
+    where the hash covers the word list, then memory-mapped on later runs.
+    """
+
+    def __init__(self, words, cache_dir="cache", chunk: int = 256):
+        self.words = list(words)
+        self.length = len(self.words[0]) if self.words else 5
+        self.index = {w: i for i, w in enumerate(self.words)}
+        self.codes = to_codes(self.words, self.length)
+        self.key = hashlib.sha1("\n".join(self.words).encode("ascii")).hexdigest()[:16]
+        self.path = Path(cache_dir) / f"feedback_{self.key}.npy" if cache_dir else None
+        self.matrix = self._load_or_build(chunk)
+
+    def _load_or_build(self, chunk: int) -> np.ndarray:
+        if self.path is not None and self.path.exists():
+            try:
+                m = np.load(self.path, mmap_mode="r")
+                if m.shape == (len(self.words), len(self.words)):
+                    return m
+            except (OSError, ValueError):
+                pass
+
+        m = self.build(self.codes, chunk)
+        if self.path is not None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".tmp.npy")
+                np.save(tmp, m)
+                os.replace(tmp, self.path)
+                return np.load(self.path, mmap_mode="r")
+            except OSError:
+                pass
+        return m
+
+    @staticmethod
+    def build(codes: np.ndarray, chunk: int = 256) -> np.ndarray:
+        n = len(codes)
+        m = np.empty((n, n), dtype=pattern_dtype(codes.shape[1]))
+        for start in range(0, n, chunk):
+            m[start:start + chunk] = evaluate_codes(codes[start:start + chunk], codes)
+        return m
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    # ---------------- Lookups ----------------
+    def pattern(self, guess: str, answer: str) -> int:
+        gi, ai = self.index.get(guess), self.index.get(answer)
+        if gi is None or ai is None:
+            return encode(evaluate_guess(guess, answer))
+        return int(self.matrix[gi, ai])
+
+    def row(self, guess_idx: int) -> np.ndarray:
+        # Patterns of one guess against every answer
+        return self.matrix[guess_idx]
+
+    def lookup(self, guess_idx, answer_idx) -> np.ndarray:
+        # Element-wise patterns for paired index arrays
+        return self.matrix[np.asarray(guess_idx), np.asarray(answer_idx)]
+
+    def block(self, guess_idx, answer_idx) -> np.ndarray:
+        # Patterns of every guess in guess_idx against every answer in answer_idx
+        return self.matrix[np.ix_(np.asarray(guess_idx), np.asarray(answer_idx))]
+
+    def evaluate_many(self, guess: str, answers) -> np.ndarray:
+        # Patterns of an arbitrary guess (in the list or not) against answers
+        return evaluate_codes(to_codes([guess], len(guess)), to_codes(list(answers), len(guess)))[0]
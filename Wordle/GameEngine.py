@@ -0,0 +1,271 @@
+from typing import Optional
+
+# Tile / key states as small ints (also the key upgrade rank)
+UNUSED, GRAY, YELLOW, GREEN = 0, 1, 2, 3
+STATE_NAMES = ("unused", "gray", "yellow", "green")
+STATE_CODE = {name: code for code, name in enumerate(STATE_NAMES)}
+
+# Packed feedback digits: pattern = sum(digit[i] * 3**i)
+DIGIT = {"gray": 0, "yellow": 1, "green": 2}
+COLOR = ("gray", "yellow", "green")
+
+PLAYING, VICTORY, DEFEAT = 0, 1, 2
+RESULT_NAMES = (None, "victory", "defeat")
+
+
+# Proper Wordle evaluation w/ double letters
+def evaluate_guess(guess: str, answer: str) -> list[str]:
+    cols = len(answer)
+    res = ["gray"] * cols
+    counts = {}
+    for a in answer:
+        counts[a] = counts.get(a, 0) + 1
+
+    # greens
+    for i in range(cols):
+        if guess[i] == answer[i]:
+            res[i] = "green"
+            counts[guess[i]] -= 1
+
+    # yellows
+    for i in range(cols):
+        if res[i] == "gray":
+            g = guess[i]
+            if counts.get(g, 0) > 0:
+                res[i] = "yellow"
+                counts[g] -= 1
+    return res
+
+# Pack a list of colors into a base-3 integer
+def encode(colors) -> int:
+    code = 0
+    for i, c in enumerate(colors):
+        code += DIGIT[c] * 3 ** i
+    return code
+
+# Unpack a base-3 pattern back into colors
+def decode(code: int, length: int = 5) -> list[str]:
+    out = []
+    for _ in range(length):
+        code, d = divmod(code, 3)
+        out.append(COLOR[d])
+    return out
+
+# Packed pattern for a guess that is all green
+def all_green(length: int = 5) -> int:
+    return sum(DIGIT["green"] * 3 ** i for i in range(length))
+
+
+class GameEngine:
+    """
+    Pygame-free rules and state for one game.
+    Board letters (0 = empty, 1..26 = A..Z), tile colors and key states
+    are stored as bytes, so an active game takes a few hundred bytes.
+    """
+
+    __slots__ = ("answer", "rows", "cols", "letters", "colors", "keys",
+                 "cur_row", "cur_col", "result")
+
+    def __init__(self, answer: str, rows: int = 6, cols: int = 5):
+        self.rows = rows
+        self.cols = cols
+        self.letters = bytearray(rows * cols)
+        self.colors = bytearray(rows * cols)
+        self.keys = bytearray(26)
+        self.reset(answer)
+
+    def reset(self, answer: str):
+        self.answer = answer
+        if len(answer) != self.cols:
+            # New word length: resize the board
+            self.cols = len(answer)
+            self.letters = bytearray(self.rows * self.cols)
+            self.colors = bytearray(self.rows * self.cols)
+        self.letters[:] = bytes(len(self.letters))
+        self.colors[:] = bytes(len(self.colors))
+        self.keys[:] = bytes(26)
+        self.cur_row = 0
+        self.cur_col = 0
+        self.result = PLAYING
+
+    # ---------------- Queries ----------------
+    @property
+    def outcome(self) -> Optional[str]:
+        return RESULT_NAMES[self.result]
+
+    @property
+    def finished(self) -> bool:
+        return self.result != PLAYING or self.cur_row >= self.rows
+
+    # Rows used so far (a winning row is not advanced past)
+    @property
+    def guess_count(self) -> int:
+        return self.cur_row + (self.result == VICTORY)
+
+    def letter(self, r: int, c: int) -> str:
+        v = self.letters[r * self.cols + c]
+        return chr(64 + v) if v else ""
+
+    def color(self, r: int, c: int) -> Optional[str]:
+        v = self.colors[r * self.cols + c]
+        return STATE_NAMES[v] if v else None
+
+    def key_state(self, ch: str) -> str:
+        return STATE_NAMES[self.keys[ord(ch) - 65]]
+
+    def row_full(self) -> bool:
+        return self.cur_col >= self.cols
+
+    def current_guess(self) -> str:
+        start = self.cur_row * self.cols
+        return "".join(chr(64 + v) for v in self.letters[start:start + self.cols] if v)
+
+    def guesses(self) -> list[str]:
+        return ["".join(self.letter(r, c) for c in range(self.cols)) for r in range(self.cur_row)]
+
+    # ---------------- Input ops ----------------
+    def push_char(self, ch: str) -> bool:
+        if self.finished or self.cur_col >= self.cols:
+            return False
+        self.letters[self.cur_row * self.cols + self.cur_col] = ord(ch) - 64
+        self.cur_col += 1
+        return True
+
+    def backspace(self) -> bool:
+        if self.finished or self.cur_col == 0:
+            return False
+        self.cur_col -= 1
+        self.letters[self.cur_row * self.cols + self.cur_col] = 0
+        return True
+
+    def upgrade_key(self, ch: str, state: str):
+        i = ord(ch) - 65
+        if not 0 <= i < 26:
+            return
+        code = STATE_CODE[state]
+        if code > self.keys[i]:
+            self.keys[i] = code
+
+    # Score the (already validated) current row and advance
+    def apply_guess(self, guess: Optional[str] = None) -> list[str]:
+        guess = guess or self.current_guess()
+        return self.apply_colors(guess, evaluate_guess(guess, self.answer))
+
+    # Record a row whose colors were computed elsewhere (e.g. batched) and advance
+    def apply_colors(self, guess: str, row_colors: list[str]) -> list[str]:
+        start = self.cur_row * self.cols
+        for i, (ch, col) in enumerate(zip(guess, row_colors)):
+            self.letters[start + i] = ord(ch) - 64
+            self.colors[start + i] = STATE_CODE[col]
+            self.upgrade_key(ch, col)
+
+        if guess == self.answer:
+            self.result = VICTORY
+            return row_colors
+
+        self.cur_row += 1
+        self.cur_col = 0
+        if self.cur_row >= self.rows:
+            self.result = DEFEAT
+        return row_colors
+
+
+class MultiBoardEngine:
+    """
+    Several answers played with the same guesses (2/4/8 boards).
+    Each board is a GameEngine; typing goes to every unsolved board and
+    a guess is scored against all of them in one batched evaluation.
+    Keys are merged by the caller (best state across boards).
+    """
+
+    def __init__(self, answers, rows: int, cols: int):
+        self.rows = rows
+        self.cols = cols
+        self.boards = [GameEngine(a, rows, cols) for a in answers]
+        self.keys = bytearray(26)
+        self.reset(answers)
+
+    def reset(self, answers, rows: Optional[int] = None):
+        from Feedback import to_codes
+
+        if rows is not None and rows != self.rows:
+            self.rows = rows
+            self.boards = []
+        if len(answers) != len(self.boards):
+            self.boards = [GameEngine(a, self.rows, len(a)) for a in answers]
+        for board, answer in zip(self.boards, answers):
+            board.reset(answer)
+        self.answers = list(answers)
+        self.cols = len(self.answers[0])
+        self.codes = to_codes(self.answers, self.cols)
+        self.keys[:] = bytes(26)
+        self.cur_row = 0
+
+    # ---------------- Queries ----------------
+    def _open(self) -> list[int]:
+        return [i for i, b in enumerate(self.boards) if not b.finished]
+
+    @property
+    def outcome(self) -> Optional[str]:
+        if all(b.result == VICTORY for b in self.boards):
+            return "victory"
+        return "defeat" if self.cur_row >= self.rows else None
+
+    @property
+    def finished(self) -> bool:
+        return self.outcome is not None
+
+    @property
+    def cur_col(self) -> int:
+        open_ = self._open()
+        return self.boards[open_[0]].cur_col if open_ else 0
+
+    def key_state(self, ch: str) -> str:
+        return STATE_NAMES[self.keys[ord(ch) - 65]]
+
+    def row_full(self) -> bool:
+        return self.cur_col >= self.cols
+
+    @property
+    def guess_count(self) -> int:
+        return self.cur_row
+
+    def current_guess(self) -> str:
+        open_ = self._open()
+        return self.boards[open_[0]].current_guess() if open_ else ""
+
+    # ---------------- Input ops ----------------
+    def push_char(self, ch: str) -> bool:
+        if self.finished:
+            return False
+        return any([self.boards[i].push_char(ch) for i in self._open()])
+
+    def backspace(self) -> bool:
+        if self.finished:
+            return False
+        return any([self.boards[i].backspace() for i in self._open()])
+
+    def upgrade_key(self, ch: str, state: str):
+        i = ord(ch) - 65
+        if not 0 <= i < 26:
+            return
+        code = STATE_CODE[state]
+        if code > self.keys[i]:
+            self.keys[i] = code
+
+    def apply_guess(self, guess: Optional[str] = None) -> list:
+        """
+        Score guess against every unsolved board at once.
+        Returns one color list per board (None for boards already solved).
+        """
+        from Feedback import evaluate_codes, to_codes
+
+        guess = guess or self.current_guess()
+        open_ = self._open()
+        out = [None] * len(self.boards)
+        if open_:
+            patterns = evaluate_codes(to_codes([guess], self.cols), self.codes[open_])[0]
+            for i, code in zip(open_, patterns):
+                out[i] = self.boards[i].apply_colors(guess, decode(int(code), self.cols))
+        self.cur_row += 1
+        return out
@@ -1,236 +1,156 @@
 ﻿import os
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
 
+import time
 import pygame
 from Screen import Screen
-from ResultScreen import ResultScreen
-
-COLOR_RANK = {"unused": 0, "gray": 1, "yellow": 2, "green": 3}
+from GameEngine import GameEngine
+from GlyphCache import glyph_cache
+from Layout import game_layout
+from Validator import WordValidator
 
 class GameScreen(Screen):
+    # "N words remaining" line under the grid
+    tracks_remaining = True
+
     def __init__(self, app):
         self.app = app
         self.answer = app.context["answer"]
         self.rows   = app.context["max_attempts"]
-        self.cols   = 5
+        self.cols   = len(self.answer)
 
-        # Local dictionary (optional)
-        self.words_set = set(app.words) if hasattr(app, "words") else set()
+        # Local dictionary (optional): the app's compiled word index
+        self.words_set = self._local_words()
 
-        # API validation + cache
+        # API validation + cache (persistent, shared across rounds)
         self.use_api_validate = True
-        self.meaning_cache: dict[str, bool] = {}
+        self.meaning_cache = app.meaning_cache if hasattr(app, "meaning_cache") else {}
+        self.pending = None  # (guess, Future) while the row is being checked
 
-        # Pygame
-        pygame.init()
-        self.W, self.H = 1200, 800
-        self.surface = pygame.display.set_mode((self.W, self.H))
-        pygame.display.set_caption("Wordle")
+        # Pygame resources are owned by App and shared by every screen
+        res = app.resources
+        self.W, self.H = res.W, res.H
+        self.surface = res.surface
 
         # Theme 
-        self.background          = (18, 18, 19)
-        self.grid_empty  = (58, 58, 60)
-        self.text_color  = (232, 232, 232)
-        self.clr_green   = (83, 141, 78)
-        self.clr_yellow  = (181, 159, 59)
-        self.clr_gray    = (58, 58, 60)
-        self.clr_keycap  = (129, 131, 132)
-        self.clr_keytext = (255, 255, 255)
-
-        # Fonts
-        font_name = pygame.font.match_font("Consolas")
-        self.font_cell = pygame.font.Font(None, 64)
-        self.font_key  = pygame.font.Font(font_name or None, 40)
-        self.font_key_small = pygame.font.Font(font_name or None, 26)
-        self.font_msg  = pygame.font.Font(None, 32)
-
-        # Normalize word list (UPPER) + hold key to delete smoothly
-        self.words_set = ({w.strip().upper() for w in app.words} if hasattr(app, "words") else set())
-        pygame.key.set_repeat(300, 35)
-
-        # Board state
-        self.board  = [[""] * self.cols for _ in range(self.rows)]
-        self.colors = [[None] * self.cols for _ in range(self.rows)]  # None|gray|yellow|green
-        self.cur_row = 0
-        self.cur_col = 0
+        self.background  = res.theme["background"]
+        self.grid_empty  = res.theme["grid_empty"]
+        self.text_color  = res.theme["text"]
+        self.clr_green   = res.theme["green"]
+        self.clr_yellow  = res.theme["yellow"]
+        self.clr_gray    = res.theme["gray"]
+        self.clr_keycap  = res.theme["keycap"]
+        self.clr_keytext = res.theme["keytext"]
+
+        # Grid, keyboard and fonts for the window size (see relayout)
+        self._layout_grid()
+        self.bksp_label = "←" if self._font_supports("←") else "BKSP"
+
+        self.validator = self._make_validator()
+
+        # Board state (rules live in the engine; this screen only draws it)
+        self.engine = GameEngine(self.answer, self.rows, self.cols)
         self.message = ""
 
-        # Grid layout
-        self.grid_top   = 80
-        self.cell_size  = 64
-        self.cell_gap   = 10
-        grid_w = self.cols * self.cell_size + (self.cols - 1) * self.cell_gap
-        self.grid_left  = (self.W - grid_w) // 2
-
-        # Keyboard layout
-        self.kb_top    = 560
-        self.kb_rows   = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]
-        self.key_rects = []  # list[(pygame.Rect, label)]
-        self.key_state = {c: "unused" for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"}
-        self._build_keyboard_layout()
+        # Dirty regions: ("row", r) | "keyboard" | "message" | "remaining"
+        self._dirty = set()
+        self._full_redraw = True
+
+        # Words still consistent with the feedback so far, and the position of
+        # the row being typed in the prefix automaton (see _attach_indexes)
+        self._reset_indexes()
+
+    def _local_words(self):
+        if hasattr(self.app, "word_index"):
+            return self.app.word_index
+        if hasattr(self.app, "words"):
+            return {w.strip().upper() for w in self.app.words}
+        return set()
+
+    def _reset_indexes(self):
+        self.candidates = None
+        self.prefix = None
+        self._indexes_pending = hasattr(self.app, "indexes")
+        self._attach_indexes()
+
+    # App builds its constraint index and prefix trie in the background; the
+    # round starts without them and catches up on whatever was played meanwhile
+    def _attach_indexes(self):
+        if not self._indexes_pending:
+            return
+        indexes = self.app.indexes(wait=False)
+        if indexes is None:
+            return
+        self._indexes_pending = False
+        index, trie = indexes
+        if self.tracks_remaining:
+            self.candidates = index.tracker()
+            for r, guess in enumerate(self.engine.guesses()):
+                self.candidates.apply(guess, [self.engine.color(r, c) for c in range(self.cols)])
+            self._invalidate("remaining")
+        self.prefix = trie.cursor()
+        for ch in self.engine.current_guess():
+            self.prefix.push(ch)
+        if not self.prefix.alive:
+            self._set_message(self._prefix_message())
+
+    def _make_validator(self) -> WordValidator:
+        inflections = self.app.inflections if hasattr(self.app, "inflections") else None
+        return WordValidator(self.words_set, self.meaning_cache, inflections=inflections)
+
+    def _board_count(self) -> int:
+        return 1
+
+    def _layout_grid(self):
+        # Geometry is memoized per window size / board shape (Layout.py);
+        # fonts come from Resources at the window's scale
+        res = self.app.resources
+        lay = self.layout = game_layout(self.W, self.H, self.rows, self.cols, self._board_count())
+        self.grid_top, self.grid_left, self.grid_w = lay.grid_top, lay.grid_left, lay.grid_w
+        self.cell_size, self.cell_gap = lay.cell_size, lay.cell_gap
+        self.kb_top = lay.kb_top
+        self.key_rects = lay.key_rects      # list[(pygame.Rect, label)], also used for hit-testing
+        self.font_cell = res.font(self.cell_size)
+        self.font_key  = res.fonts["key"]
+        self.font_key_small = res.fonts["key_small"]
+        self.font_msg  = res.fonts["msg"]
+
+    # Window resized (or pooled screen shown again): new surface and geometry
+    def relayout(self):
+        res = self.app.resources
+        self.W, self.H, self.surface = res.W, res.H, res.surface
+        self._layout_grid()
+        self._full_redraw = True
+
+    # Start a new round on this screen (screens are pooled by App)
+    def reset(self):
+        self.answer = self.app.context["answer"]
+        if len(self.answer) != self.cols:
+            # Word length changed: new dictionary and validator
+            self.cols = len(self.answer)
+            self.words_set = self._local_words()
+            self.validator = self._make_validator()
+        self.relayout()
+        self.engine.reset(self.answer)
+        self.pending = None
+        self.message = ""
+        self._dirty.clear()
+        self._full_redraw = True
+        self._reset_indexes()
+
+    # Indexes were edited in place: rebuild the tracker and cursor from the
+    # board (the answer stays; App holds it in the list until the round ends)
+    def words_changed(self):
+        self._indexes_pending = hasattr(self.app, "indexes")
+        self._attach_indexes()
+        if not self.pending:
+            self._set_message(self._prefix_message())
 
     def _font_supports(self, ch: str) -> bool:
         # returns True if current font has metrics for this glyph
         m = self.font_key.metrics(ch)
         return bool(m and m[0] is not None)
 
-    # -------------- Check Meaning Word --------------
-    def _has_meaning(self, word: str, timeout: float = 3.5) -> bool:
-        try:
-            import requests  
-        except Exception:
-            return False
-        try:
-            url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word.lower()}"
-            r = requests.get(url, timeout=timeout)
-            if r.status_code != 200:
-                return False
-            data = r.json()
-            if not isinstance(data, list) or not data:
-                return False
-            meanings = data[0].get("meanings", [])
-            return bool(meanings)
-        except Exception:
-            return False
-
-    def _plural_singular_candidates(self, w: str) -> list[str]:
-        # Return possible singular bases for a plural word
-        w = w.lower()
-        cands = set()
-
-        if w.endswith("ies") and len(w) > 3:
-            cands.add(w[:-3] + "y")
-
-        if w.endswith("es"):
-            if w[:-2].endswith(("ch", "sh")) or w[-3] in "sxz":
-                cands.add(w[:-2])
-
-        if w.endswith("s") and not w.endswith("ss"):
-            cands.add(w[:-1])
-
-        if w.endswith("ves") and len(w) > 3:
-            cands.add(w[:-3] + "f")
-            cands.add(w[:-3] + "fe")
-
-        return [c.upper() for c in cands if c]
-
-    def _is_valid_word(self, word: str) -> bool:
-        # Check local list → API; if not found, try singular candidates
-        # Local list
-        if self.words_set and word in self.words_set:
-            return True
-
-        # API for the word
-        ok = self.meaning_cache.get(word)
-
-        if ok is None and self.use_api_validate:
-            ok = self._has_meaning(word)
-            self.meaning_cache[word] = ok
-
-        if ok:
-            return True
-
-        # Try singular/plural bases
-        for base in self._plural_singular_candidates(word):
-            if self.words_set and base in self.words_set:
-                return True
-
-            okb = self.meaning_cache.get(base)
-
-            if okb is None and self.use_api_validate:
-                okb = self._has_meaning(base)
-                self.meaning_cache[base] = okb
-
-            if okb:
-                return True
-
-        return False
-
-    # ---------------- Keyboard Layout ----------------
-    def _build_keyboard_layout(self):
-        """
-        Build 3 rows:
-          Row0: 10 letters
-          Row1:  9 letters (centered)
-          Row2: [ENTER] + 7 letters + [BKSP], centered as a whole.
-        """
-
-        key_w, key_h = 48, 58
-        gap = 8
-        margin_x = 24  # left / right padding
-
-        self.key_rects.clear()
-
-        # Row 0
-        row0 = "QWERTYUIOP"
-        row0_width = len(row0) * key_w + (len(row0) - 1) * gap
-        x = (self.W - row0_width) // 2
-        y = self.kb_top + 0 * (key_h + 10)
-        for i, ch in enumerate(row0):
-            rect = pygame.Rect(x + i * (key_w + gap), y, key_w, key_h)
-            self.key_rects.append((rect, ch))
-
-        # Row 1
-        row1 = "ASDFGHJKL"
-        row1_width = len(row1) * key_w + (len(row1) - 1) * gap
-        x = (self.W - row1_width) // 2
-        y = self.kb_top + 1 * (key_h + 10)
-        for i, ch in enumerate(row1):
-            rect = pygame.Rect(x + i * (key_w + gap), y, key_w, key_h)
-            self.key_rects.append((rect, ch))
-
-        # Row 2: ENTER + letters + BKSP
-        row2_letters = "ZXCVBNM"
-        enter_w = key_w + 26
-        bksp_w  = key_w + 26
-        row2_width = enter_w + gap + len(row2_letters)*key_w + (len(row2_letters)-1)*gap + gap + bksp_w
-
-        max_width = self.W - 2 * margin_x
-        if row2_width > max_width:
-            # scale everything down proportionally
-            scale   = max_width / row2_width
-            key_w   = int(key_w * scale)
-            key_h   = int(key_h * scale)
-            enter_w = int(enter_w * scale)
-            bksp_w  = int(bksp_w * scale)
-            # recompute row widths for rows 0 & 1 since key_w changed
-            row0_width = len(row0) * key_w + (len(row0) - 1) * gap
-            row1_width = len(row1) * key_w + (len(row1) - 1) * gap
-
-            # rebuild rows 0 & 1 with new size
-            self.key_rects = []
-            # Row 0
-            x = (self.W - row0_width) // 2
-            y = self.kb_top + 0 * (key_h + 10)
-            for i, ch in enumerate(row0):
-                rect = pygame.Rect(x + i * (key_w + gap), y, key_w, key_h)
-                self.key_rects.append((rect, ch))
-            # Row 1
-            x = (self.W - row1_width) // 2
-            y = self.kb_top + 1 * (key_h + 10)
-            for i, ch in enumerate(row1):
-                rect = pygame.Rect(x + i * (key_w + gap), y, key_w, key_h)
-                self.key_rects.append((rect, ch))
-
-            # recompute row2 width with scaled sizes
-            row2_width = enter_w + gap + len(row2_letters)*key_w + (len(row2_letters)-1)*gap + gap + bksp_w
-
-        # Finally place row 2 centered
-        y = self.kb_top + 2 * (key_h + 10)
-        x = (self.W - row2_width) // 2
-        # ENTER
-        rect_enter = pygame.Rect(x, y, enter_w, key_h)
-        self.key_rects.append((rect_enter, "ENTER"))
-        # 7 letters
-        x = rect_enter.right + gap
-        for i, ch in enumerate(row2_letters):
-            rect = pygame.Rect(x + i * (key_w + gap), y, key_w, key_h)
-            self.key_rects.append((rect, ch))
-        # BKSP
-        x = self.key_rects[-1][0].right + gap
-        rect_bk = pygame.Rect(x, y, bksp_w, key_h)
-        self.key_rects.append((rect_bk, "BKSP"))
-
     # ---------------- Events ----------------
     def handle(self, event):
         if event is None:
@@ -239,8 +159,16 @@ class GameScreen(Screen):
             self.app.set_screen(None)
             return
 
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self._full_redraw = True
+            return
+
         if event.type == pygame.KEYDOWN:
-            if pygame.K_a <= event.key <= pygame.K_z:
+            if pygame.K_4 <= event.key <= pygame.K_8:
+                self._change_length(event.key - pygame.K_0)
+            elif event.key == pygame.K_TAB:
+                self._change_boards()
+            elif pygame.K_a <= event.key <= pygame.K_z:
                 self._push_char(chr(event.key).upper())
             elif event.key == pygame.K_BACKSPACE:
                 self._backspace()
@@ -259,172 +187,250 @@ class GameScreen(Screen):
                     break
 
     # ---------------- Input ops ----------------
+    def _untouched(self) -> bool:
+        return not (self.pending or self.engine.cur_row or self.engine.cur_col)
+
+    def _change_length(self, length: int):
+        # Only on an untouched board: 4 - 8 starts a new round of that length
+        if not self._untouched() or length == self.cols:
+            return
+        try:
+            self.app.new_game(length)
+        except ValueError:
+            self._set_message(f"No {length}-letter words available.")
+
+    def _change_boards(self):
+        # Only on an untouched board: Tab cycles 1 / 2 / 4 / 8 simultaneous answers
+        if not self._untouched():
+            return
+        modes = (1, 2, 4, 8)
+        current = self.app.context.get("boards", 1)
+        self.app.new_game(boards=modes[(modes.index(current) + 1) % len(modes)])
+
     def _push_char(self, ch: str):
-        if self.cur_row >= self.rows:
+        if self.pending:
             return
-        if self.message:
-            self._set_message("")
-        if self.cur_col < self.cols:
-            self.board[self.cur_row][self.cur_col] = ch
-        self.cur_col += 1
+        if self.engine.push_char(ch):
+            self._invalidate(("row", self.engine.cur_row))
+            if self.prefix is not None:
+                self.prefix.push(ch)
+        # Flag the row as soon as no listed word can start with it
+        self._set_message(self._prefix_message())
 
     def _backspace(self):
-        if self.cur_row >= self.rows:
+        if self.pending:
             return
-        if self.message:
-            self._set_message("")
-        if self.cur_col > 0:
-            self.cur_col -= 1
-            self.board[self.cur_row][self.cur_col] = ""
+        if self.engine.backspace():
+            self._invalidate(("row", self.engine.cur_row))
+            if self.prefix is not None:
+                self.prefix.pop()
+        self._set_message(self._prefix_message())
+
+    def _prefix_message(self) -> str:
+        if self.prefix is None or self.prefix.alive:
+            return ""
+        # Shortest dead prefix: the letter that broke the row
+        return f"No word starts with {self.engine.current_guess()[:self.prefix.dead_at]}."
 
     def _submit_guess(self):
-        if self.cur_col < self.cols:
-            self._set_message("Word must be 5 letters.")
+        if self.pending or self.engine.finished:
+            return
+        if not self.engine.row_full():
+            self._set_message(f"Word must be {self.cols} letters.")
             return
 
-        guess = "".join(self.board[self.cur_row])
-        valid = self._is_valid_word(guess)
-
+        guess = self.engine.current_guess()
+
+        # Validate in the background; update() picks up the verdict
+        self.validator.use_api = self.use_api_validate
+        prof = self.app.profiler
+        if prof.enabled:
+            t0 = time.perf_counter()
+            future = self.validator.check(guess)
+            prof.record("validate", time.perf_counter() - t0)
+        else:
+            future = self.validator.check(guess)
+        if future.done():
+            self._finish_guess(guess, future.result())
+        else:
+            self.pending = (guess, future)
+            self._set_message("Checking...")
+            self._invalidate(("row", self.engine.cur_row))
+
+    def _finish_guess(self, guess: str, valid: bool):
+        self._invalidate(("row", self.engine.cur_row))
         if not valid:
             self._set_message("Not in dictionary.")
             return
+        if self.message:
+            self._set_message("")
 
-        # Evaluate colors 
-        row_colors = self._evaluate_guess(guess, self.answer)
-        self.colors[self.cur_row] = row_colors
+        # Evaluate colors, upgrade keys, advance
+        row_colors = self._apply_guess(guess)
+        self._invalidate("keyboard", "remaining")
+        if self.prefix is not None:
+            self.prefix.reset()
 
-        for c, col in zip(guess, row_colors):
-            self._upgrade_key_state(c, {"green": "green", "yellow": "yellow", "gray": "gray"}[col])
+        if self.candidates is not None:
+            self.candidates.apply(guess, row_colors)
 
         # Win / Lose / Next 
-        if guess == self.answer:
-            self.app.context["result_type"] = "victory"
-            self.app.set_screen(ResultScreen(self.app, "victory", self.answer))
-            return
-
-        self.cur_row += 1
-        self.cur_col = 0
-
-        if self.cur_row >= self.rows:
-            self.app.context["result_type"] = "defeat"
-            self.app.set_screen(ResultScreen(self.app, "defeat", self.answer))
+        outcome = self.engine.outcome
+        if outcome:
+            self.app.end_game(outcome, self.answer, self.engine.guess_count)
+
+    # engine.apply_guess, timed as "evaluate" while profiling
+    def _apply_guess(self, guess: str):
+        prof = self.app.profiler
+        if not prof.enabled:
+            return self.engine.apply_guess(guess)
+        t0 = time.perf_counter()
+        try:
+            return self.engine.apply_guess(guess)
+        finally:
+            prof.record("evaluate", time.perf_counter() - t0)
 
     def _set_message(self, msg: str):
+        if msg != self.message:
+            self._invalidate("message")
         self.message = msg
 
     def _upgrade_key_state(self, ch: str, new_state: str):
-        if ch not in self.key_state:
-            return
-        if COLOR_RANK[new_state] > COLOR_RANK[self.key_state[ch]]:
-            self.key_state[ch] = new_state
-
-    # Proper Wordle evaluation w/ double letters
-    def _evaluate_guess(self, guess: str, answer: str):
-        res = ["gray"] * self.cols
-        counts = {}
-        for a in answer:
-            counts[a] = counts.get(a, 0) + 1
-
-        # greens
-        for i in range(self.cols):
-            if guess[i] == answer[i]:
-                res[i] = "green"
-                counts[guess[i]] -= 1
-
-        # yellows
-        for i in range(self.cols):
-            if res[i] == "gray":
-                g = guess[i]
-                if counts.get(g, 0) > 0:
-                    res[i] = "yellow"
-                    counts[g] -= 1
-        return res
+        self.engine.upgrade_key(ch, new_state)
 
     # ---------------- Update/Render ----------------
     def update(self):
-        pass
+        self._attach_indexes()
+        if self.pending and self.pending[1].done():
+            guess, future = self.pending
+            self.pending = None
+            self._finish_guess(guess, future.result())
+
+    def is_animating(self) -> bool:
+        # Also poll while the indexes are still building
+        return self.pending is not None or self._indexes_pending
+
+    def _invalidate(self, *regions):
+        self._dirty.update(regions)
+
+    def _region_rect(self, region) -> pygame.Rect:
+        step = self.cell_size + self.cell_gap
+        grid_w = self.cols * step - self.cell_gap
+        grid_bottom = self.grid_top + self.rows * step - self.cell_gap
+        if region == "message":
+            return self.layout.message_rect
+        if region == "remaining":
+            return pygame.Rect(0, grid_bottom + 1, self.W, self.kb_top - grid_bottom - 2)
+        if region == "keyboard":
+            return self.key_rects[0][0].unionall([r for r, _ in self.key_rects])
+        _, r = region
+        return pygame.Rect(self.grid_left, self.grid_top + r * step, grid_w, self.cell_size)
 
     def render(self):
-        self.surface.fill(self.background)
-        self._draw_board()
-        self._draw_keyboard()
-        self._draw_message()
-        pygame.display.flip()
+        if self._full_redraw:
+            self._full_redraw = False
+            self._dirty.clear()
+            self.surface.fill(self.background)
+            self._draw_board()
+            self._draw_keyboard()
+            self._draw_message()
+            self._draw_remaining()
+            return [self.surface.get_rect()]
+
+        # Only repaint the regions that changed since the last frame
+        rects = []
+        for region in self._dirty:
+            rect = self._region_rect(region)
+            self.surface.fill(self.background, rect)
+            if region == "message":
+                self._draw_message()
+            elif region == "remaining":
+                self._draw_remaining()
+            elif region == "keyboard":
+                self._draw_keyboard()
+            else:
+                self._draw_row(region[1])
+            rects.append(rect)
+        self._dirty.clear()
+        return rects
+
+    # ---------------- Cached tiles ----------------
+    def _state_fill(self, state):
+        return {"green": self.clr_green, "yellow": self.clr_yellow, "gray": self.clr_gray}.get(state)
+
+    def _cell_tile(self, state, ch: str):
+        # state: None | gray | yellow | green | "checking"
+        size = self.cell_size
+
+        def build():
+            tile = pygame.Surface((size, size), pygame.SRCALPHA)
+            rect = tile.get_rect()
+            fill = self._state_fill(state)
+            if fill:
+                pygame.draw.rect(tile, fill, rect, border_radius=6)
+            elif state == "checking":
+                # Row is being checked against the dictionary
+                pygame.draw.rect(tile, self.clr_keycap, rect, width=3, border_radius=6)
+            else:
+                pygame.draw.rect(tile, self.grid_empty, rect, width=3, border_radius=6)
+            if ch:
+                surf = glyph_cache.text(self.font_cell, ch, self.text_color)
+                tile.blit(surf, surf.get_rect(center=rect.center))
+            return tile
+
+        return glyph_cache.get(("cell", self.font_cell, size, state, ch), build)
+
+    def _key_tile(self, rect: pygame.Rect, label: str, state: str):
+        fill = self._state_fill(state) or self.clr_keycap
+
+        # Choose label & font 
+        draw_label = label
+        font_to_use = self.font_key
+        if label == "BKSP":
+            draw_label = self.bksp_label
+        elif label == "ENTER":
+            font_to_use = self.font_key_small
+
+        def build():
+            tile = pygame.Surface(rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(tile, fill, tile.get_rect(), border_radius=8)
+            txt = glyph_cache.text(font_to_use, draw_label, self.clr_keytext)
+            tile.blit(txt, txt.get_rect(center=tile.get_rect().center))
+            return tile
+
+        return glyph_cache.get(("key", font_to_use, rect.size, fill, draw_label), build)
 
     def _draw_board(self):
         for r in range(self.rows):
-            for c in range(self.cols):
-                x = self.grid_left + c * (self.cell_size + self.cell_gap)
-                y = self.grid_top  + r * (self.cell_size + self.cell_gap)
-                rect = pygame.Rect(x, y, self.cell_size, self.cell_size)
-
-                col = self.colors[r][c]
-                if col == "green":
-                    fill = self.clr_green
-                elif col == "yellow":
-                    fill = self.clr_yellow
-                elif col == "gray":
-                    fill = self.clr_gray
-                else:
-                    fill = None
-
-                if fill:
-                    pygame.draw.rect(self.surface, fill, rect, border_radius=6)
-                else:
-                    pygame.draw.rect(self.surface, self.grid_empty, rect, width=3, border_radius=6)
-
-                ch = self.board[r][c]
-                if ch:
-                    surf = self.font_cell.render(ch, True, self.text_color)
-                    self.surface.blit(surf, surf.get_rect(center=rect.center))
+            self._draw_row(r)
+
+    def _draw_row(self, r: int):
+        checking = self.pending is not None and r == self.engine.cur_row
+        y = self.grid_top + r * (self.cell_size + self.cell_gap)
+        for c in range(self.cols):
+            x = self.grid_left + c * (self.cell_size + self.cell_gap)
+            state = self.engine.color(r, c) or ("checking" if checking else None)
+            self.surface.blit(self._cell_tile(state, self.engine.letter(r, c)), (x, y))
 
     def _draw_keyboard(self):
         for rect, label in self.key_rects:
-            # Fill color by state
-            if label in self.key_state:
-                st = self.key_state[label]
-                if st == "green":
-                    fill = self.clr_green
-                elif st == "yellow":
-                    fill = self.clr_yellow
-                elif st == "gray":
-                    fill = self.clr_gray
-                else:
-                    fill = self.clr_keycap
-            else:
-                fill = self.clr_keycap
-
-            pygame.draw.rect(self.surface, fill, rect, border_radius=8)
-
-            # Choose label & font 
-            draw_label = label
-            font_to_use = self.font_key   
-
-            if label == "BKSP":
-                arrow = "←"
-                if hasattr(self, "_font_supports") and self._font_supports(arrow):
-                    draw_label = arrow
-                else:
-                    draw_label = "BKSP"
-
-            elif label == "ENTER":
-                draw_label = "ENTER"
-                font_to_use = self.font_key_small   
-
-            # Render with chosen font 
-            txt = font_to_use.render(draw_label, True, self.clr_keytext)
-            self.surface.blit(txt, txt.get_rect(center=rect.center))
+            state = self.engine.key_state(label) if len(label) == 1 else "unused"
+            self.surface.blit(self._key_tile(rect, label, state), rect.topleft)
 
     def _draw_message(self):
         if not self.message:
             return
 
-        surf = self.font_msg.render(self.message, True, (250, 250, 250))
-        rect = surf.get_rect(center=(self.W // 2, 36))
+        surf = glyph_cache.text(self.font_msg, self.message, (250, 250, 250))
+        rect = surf.get_rect(center=(self.W // 2, self.layout.message_y))
         self.surface.blit(surf, rect)
 
+    def _draw_remaining(self):
+        if self.candidates is None or self.engine.cur_row == 0:
+            return
 
-
-
-
-
+        n = self.candidates.remaining
+        text = f"{n} word remaining" if n == 1 else f"{n} words remaining"
+        grid_bottom = self.grid_top + self.rows * (self.cell_size + self.cell_gap) - self.cell_gap
+        surf = glyph_cache.text(self.font_msg, text, self.clr_keycap)
+        self.surface.blit(surf, surf.get_rect(center=(self.W // 2, (grid_bottom + self.kb_top) // 2)))
@@ -0,0 +1,63 @@
+import os
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
+
+from collections import OrderedDict
+
+import pygame
+
+
+class GlyphCache:
+    """
+    Bounded LRU cache of pre-rendered surfaces shared by all screens.
+    text() caches font.render() results by (font, text, color);
+    get() caches any surface (e.g. a whole tile) under a caller key.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._items: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, factory):
+        surf = self._items.get(key)
+        if surf is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = factory()
+        self._items[key] = surf
+        if len(self._items) > self.max_entries:
+            self._items.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    def text(self, font: pygame.font.Font, text: str, color, antialias: bool = True):
+        return self.get(("text", font, text, tuple(color), antialias),
+                        lambda: font.render(text, antialias, color))
+
+    def clear(self):
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._items),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate(), 4),
+        }
+
+
+# Shared by GameScreen and ResultScreen
+glyph_cache = GlyphCache()
@@ -0,0 +1,152 @@
+import os
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
+
+from functools import lru_cache
+from typing import NamedTuple
+
+import pygame
+
+# Window geometry for every screen, derived from the window size alone.
+# Coordinates are designed for a 1200x800 window and scaled uniformly
+# (by the smaller of the two ratios) and centred in whatever size the
+# window is dragged to. Results are memoized per size, so a resize costs
+# one computation and every later frame / hit-test reads cached rects.
+BASE_W, BASE_H = 1200, 800
+
+KB_ROWS = ("QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM")
+
+# Remembered sizes (a drag passes through many; old ones age out)
+CACHE_SIZE = 64
+
+
+def scale_for(w: int, h: int) -> float:
+    return min(w / BASE_W, h / BASE_H)
+
+
+class GameLayout(NamedTuple):
+    scale: float
+    message_rect: pygame.Rect
+    message_y: int              # centre of the message line
+    grid_top: int
+    grid_left: int
+    grid_w: int
+    cell_size: int
+    cell_gap: int
+    board_w: int
+    board_h: int
+    board_origins: tuple        # (x, y) per board
+    kb_top: int
+    key_rects: tuple            # (pygame.Rect, label) per key
+
+
+class ResultLayout(NamedTuple):
+    scale: float
+    title_y: int
+    answer_y: int
+    stats_y: int
+    dist_y: int
+    button_restart: pygame.Rect
+    button_quit: pygame.Rect
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def game_layout(w: int, h: int, rows: int, cols: int, boards: int = 1) -> GameLayout:
+    s = scale_for(w, h)
+    top = (h - round(BASE_H * s)) // 2      # letterbox tall windows
+
+    def px(v):
+        return max(1, round(v * s))
+
+    grid_top = top + px(80)
+    kb_top = top + px(560)
+    if boards == 1:
+        # Cells shrink for long words so the grid keeps a margin
+        cell_gap = px(10)
+        max_w = w - 2 * px(160)
+        cell_size = min(px(64), (max_w - (cols - 1) * cell_gap) // cols)
+        board_gap = 0
+    else:
+        # Boards side by side between the message line and the keyboard
+        cell_gap = px(6 if boards <= 2 else 4)
+        board_gap = px(24)
+        board_w = (w - px(80) - (boards - 1) * board_gap) // boards
+        cell_w = (board_w - (cols - 1) * cell_gap) // cols
+        cell_h = (top + px(550) - grid_top - (rows - 1) * cell_gap) // rows
+        cell_size = max(1, min(px(64), cell_w, cell_h))
+
+    step = cell_size + cell_gap
+    board_w = cols * step - cell_gap
+    board_h = rows * step - cell_gap
+    grid_w = boards * board_w + (boards - 1) * board_gap
+    grid_left = (w - grid_w) // 2
+    origins = tuple((grid_left + i * (board_w + board_gap), grid_top) for i in range(boards))
+
+    return GameLayout(
+        scale=s,
+        message_rect=pygame.Rect(0, top, w, grid_top - top - 2),
+        message_y=top + px(36),
+        grid_top=grid_top,
+        grid_left=grid_left,
+        grid_w=grid_w,
+        cell_size=cell_size,
+        cell_gap=cell_gap,
+        board_w=board_w,
+        board_h=board_h,
+        board_origins=origins,
+        kb_top=kb_top,
+        key_rects=keyboard_layout(w, kb_top, s),
+    )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def keyboard_layout(w: int, kb_top: int, s: float = 1.0) -> tuple:
+    """
+    Three centred rows:
+      Row0: 10 letters
+      Row1:  9 letters
+      Row2: [ENTER] + 7 letters + [BKSP]
+    Keys shrink further if the widest row would not fit between the margins.
+    """
+    key_w, key_h, wide_w = 48 * s, 58 * s, (48 + 26) * s
+    gap, row_gap, margin = max(1, round(8 * s)), 10 * s, 24 * s
+
+    row2_w = 2 * wide_w + len(KB_ROWS[2]) * key_w + (len(KB_ROWS[2]) + 1) * gap
+    fit = min(1.0, (w - 2 * margin) / row2_w)
+    key_w, key_h, wide_w = int(key_w * fit), int(key_h * fit), int(wide_w * fit)
+
+    rects = []
+    for r, letters in enumerate(KB_ROWS):
+        labels = list(letters)
+        widths = [key_w] * len(labels)
+        if r == 2:
+            labels = ["ENTER"] + labels + ["BKSP"]
+            widths = [wide_w] + widths + [wide_w]
+        x = (w - (sum(widths) + (len(widths) - 1) * gap)) // 2
+        y = kb_top + round(r * (key_h + row_gap))
+        for label, kw in zip(labels, widths):
+            rects.append((pygame.Rect(x, y, kw, key_h), label))
+            x += kw + gap
+    return tuple(rects)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def result_layout(w: int, h: int) -> ResultLayout:
+    s = scale_for(w, h)
+    cy = h // 2
+
+    def px(v):
+        return round(v * s)
+
+    # Two buttons, centred horizontally, slightly below centre
+    button_w, button_h, gap = px(160), px(60), px(40)
+    x = (w - (2 * button_w + gap)) // 2
+    y = cy + px(100)
+    return ResultLayout(
+        scale=s,
+        title_y=cy - px(120),
+        answer_y=cy - px(10),
+        stats_y=cy + px(30),
+        dist_y=cy + px(62),
+        button_restart=pygame.Rect(x, y, button_w, button_h),
+        button_quit=pygame.Rect(x + button_w + gap, y, button_w, button_h),
+    )
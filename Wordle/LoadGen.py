@@ -0,0 +1,125 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from WordList import load_words
+
+# Load generator for Server.py: N virtual players, each on its own
+# keep-alive connection, playing random-guess games back to back.
+# Reports p50/p99 guess latency and completed sessions per second.
+
+
+class Client:
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method: str, path: str, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            k, _, v = line.decode("latin-1").partition(":")
+            if k.strip().lower() == "content-length":
+                length = int(v)
+        data = await self.reader.readexactly(length) if length else b"{}"
+        return status, json.loads(data)
+
+    async def close(self):
+        if self.writer:
+            self.writer.close()
+
+
+async def player(client: Client, words, games: int, rng: random.Random, latencies: list, stats: dict):
+    await client.connect()
+    try:
+        for _ in range(games):
+            _, game = await client.request("POST", "/new")
+            while True:
+                t0 = time.perf_counter()
+                status, res = await client.request("POST", "/guess", {"id": game["id"], "guess": rng.choice(words)})
+                latencies.append(time.perf_counter() - t0)
+                stats["guesses"] += 1
+                if status != 200 or res.get("result"):
+                    break
+            stats["sessions"] += 1
+            if res.get("result") == "victory":
+                stats["wins"] += 1
+    finally:
+        await client.close()
+
+def percentile(sorted_values, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    i = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[i]
+
+async def run(host: str, port: int, words, players: int, games: int, seed: int = 0) -> dict:
+    latencies = []
+    stats = {"guesses": 0, "sessions": 0, "wins": 0}
+    t0 = time.perf_counter()
+    await asyncio.gather(*(
+        player(Client(host, port), words, games, random.Random(seed + i), latencies, stats)
+        for i in range(players)
+    ))
+    elapsed = time.perf_counter() - t0
+
+    latencies.sort()
+    return {
+        "players": players,
+        "sessions": stats["sessions"],
+        "guesses": stats["guesses"],
+        "elapsed_sec": round(elapsed, 3),
+        "sessions_per_sec": round(stats["sessions"] / elapsed, 1),
+        "guesses_per_sec": round(stats["guesses"] / elapsed, 1),
+        "guess_p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "guess_p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+async def run_local(words, players: int, games: int, seed: int = 0) -> dict:
+    # Start an offline server in this process and load it
+    from Server import WordleServer
+    from Validator import WordValidator
+
+    server = WordleServer(words, WordValidator(set(words), use_api=False))
+    port = await server.start("127.0.0.1", 0)
+    try:
+        return await run("127.0.0.1", port, words, players, games, seed)
+    finally:
+        await server.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for the Wordle server")
+    parser.add_argument("--host", default=None, help="server host (default: start a local offline server)")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--players", type=int, default=200, help="concurrent connections")
+    parser.add_argument("--games", type=int, default=5, help="games per player")
+    parser.add_argument("--words", default="WordList.txt")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    words = load_words(args.words)
+    if args.host:
+        report = asyncio.run(run(args.host, args.port, words, args.players, args.games, args.seed))
+    else:
+        report = asyncio.run(run_local(words, args.players, args.games, args.seed))
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,91 @@
-from App import App
+import argparse
+import json
+import os
+import sys
+import time
+
+# Process start, for --startup-report (Main imports nothing heavy above this)
+STARTED = time.perf_counter()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Wordle")
+    parser.add_argument("--record", metavar="LOG", help="record input and verdicts to a binary log")
+    parser.add_argument("--replay", metavar="LOG", help="replay a recorded log headlessly at full speed")
+    parser.add_argument("--show", action="store_true", help="open a real window while replaying")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed for answers")
+    parser.add_argument("--length", type=int, default=5, help="letters per word (4-8)")
+    parser.add_argument("--boards", type=int, default=1, choices=(1, 2, 4, 8), help="simultaneous answers")
+    parser.add_argument("--tier", choices=("easy", "medium", "hard"), default=None,
+                        help="draw answers from a difficulty tier (needs Difficulty.py's catalog)")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print startup timings (ms since launch) after the first frame and exit")
+    args = parser.parse_args()
+    if args.record and args.replay:
+        parser.error("--record and --replay are exclusive")
+
+    if args.replay and not args.show:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    t_import = time.perf_counter()
+    from App import App
+    t_imported = time.perf_counter()
+
+    if args.replay:
+        from Replay import Replayer
+
+        session = Replayer(args.replay)
+        # Replays must not count towards the player's statistics
+        app = App(seed=session.seed, stats_path=None, **session.options)
+        if session.words_crc and session.words_crc != app.word_index.crc:
+            print("warning: word list differs from the recorded one", file=sys.stderr)
+
+        t0 = time.perf_counter()
+        frames = app.run(session)
+        elapsed = time.perf_counter() - t0
+        print(json.dumps({
+            "frames": frames,
+            "elapsed_sec": round(elapsed, 3),
+            "frames_per_sec": round(frames / elapsed, 1) if elapsed else None,
+            "answer": app.context["answer"],
+            "result": app.context["result_type"],
+            "screen": type(app.current).__name__ if app.current else None,
+        }, indent=2))
+        return 0
+
+    options = {"length": args.length, "boards": args.boards, "tier": args.tier}
+    try:
+        app = App(seed=args.seed, **options)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.startup_report:
+        import pygame
+
+        t_app = time.perf_counter()
+        pygame.display.update(app.current.render())
+        t_frame = time.perf_counter()
+        app.indexes()
+        t_indexes = time.perf_counter()
+
+        def ms(t):
+            return round((t - STARTED) * 1000, 1)
+
+        print(json.dumps({
+            "imports_ms": round((t_imported - t_import) * 1000, 1),
+            "app_ms": ms(t_app),
+            "first_frame_ms": ms(t_frame),
+            "indexes_ready_ms": ms(t_indexes),
+            "modules": len(sys.modules),
+        }, indent=2))
+        return 0
+    session = None
+    if args.record:
+        from Replay import Recorder
+
+        session = Recorder(args.record, app.seed, app.word_index.crc, options)
+    app.run(session)
+    return 0
 
 if __name__ == "__main__":
-    app = App()
-    app.new_game()
-    app.run()
+    sys.exit(main())
@@ -0,0 +1,199 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+DAY = 24 * 60 * 60
+
+# Size cap of a store that never had one set (see MeaningCache.resize)
+DEFAULT_MAX_ENTRIES = 50_000
+
+# Cache hits buffered before their "used" stamps are written in one go
+TOUCH_BATCH = 256
+
+
+class MeaningCache:
+    """
+    Persistent cache of dictionary-API verdicts (word -> bool).
+    Backed by SQLite so verdicts survive new rounds and restarts.
+    Positive and negative verdicts expire separately, and the least
+    recently used entries are evicted once max_entries is exceeded.
+    The cap is kept in the store itself (resize()), so a store warmed
+    past the default keeps its size when the game reopens it.
+    Works as a drop-in for the old dict: cache.get(word) / cache[word] = ok.
+    """
+
+    def __init__(self, path="meaning_cache.sqlite3", max_entries: Optional[int] = None,
+                 ttl_positive: float = 180 * DAY, ttl_negative: float = 2 * DAY):
+        self.path = str(path)
+        self.ttl_positive = ttl_positive
+        self.ttl_negative = ttl_negative
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # word -> last hit time, not yet written (a hit is a read, not a write)
+        self._touched: dict[str, float] = {}
+        self._lock = threading.Lock()
+        try:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+        except (OSError, sqlite3.Error):
+            # Read-only install: keep working with an in-memory cache
+            self._db = sqlite3.connect(":memory:", check_same_thread=False)
+
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts ("
+            " word TEXT PRIMARY KEY,"
+            " ok INTEGER NOT NULL,"
+            " stored REAL NOT NULL,"
+            " used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS verdicts_used ON verdicts(used)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self._db.commit()
+
+        # Explicit cap for this connection only; otherwise the store's own
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'max_entries'").fetchone()
+        if max_entries is None:
+            max_entries = row[0] if row else DEFAULT_MAX_ENTRIES
+        self.max_entries = max_entries
+        self._count = self._db.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+    # Return the cached verdict, or default if missing / expired
+    def get(self, word: str, default=None) -> Optional[bool]:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT ok, stored FROM verdicts WHERE word = ?", (word,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return default
+
+            ok, stored = bool(row[0]), row[1]
+            ttl = self.ttl_positive if ok else self.ttl_negative
+            if now - stored > ttl:
+                self._db.execute("DELETE FROM verdicts WHERE word = ?", (word,))
+                self._db.commit()
+                self._count -= 1
+                self.misses += 1
+                return default
+
+            self._touched[word] = now
+            if len(self._touched) >= TOUCH_BATCH:
+                self._flush_touched()
+                self._db.commit()
+            self.hits += 1
+            return ok
+
+    # Write buffered "used" stamps (caller holds the lock and commits)
+    def _flush_touched(self):
+        if self._touched:
+            self._db.executemany(
+                "UPDATE verdicts SET used = ? WHERE word = ?",
+                [(t, w) for w, t in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def set(self, word: str, ok: bool):
+        now = time.time()
+        with self._lock:
+            exists = self._db.execute(
+                "SELECT 1 FROM verdicts WHERE word = ?", (word,)
+            ).fetchone() is not None
+            self._db.execute(
+                "INSERT OR REPLACE INTO verdicts (word, ok, stored, used) VALUES (?, ?, ?, ?)",
+                (word, int(bool(ok)), now, now),
+            )
+            self._touched.pop(word, None)
+            if not exists:
+                self._count += 1
+                if self._count > self.max_entries:
+                    self._evict()
+            self._db.commit()
+
+    # Store many verdicts in one transaction (bulk warm-up); with
+    # replace=False words already stored keep their verdict and age
+    def set_many(self, items, replace: bool = True):
+        now = time.time()
+        rows = [(w, int(bool(ok)), now, now) for w, ok in items]
+        if not rows:
+            return
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        with self._lock:
+            self._db.executemany(
+                f"{verb} INTO verdicts (word, ok, stored, used) VALUES (?, ?, ?, ?)", rows
+            )
+            self._count = self._db.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+            if self._count > self.max_entries:
+                self._evict()
+            self._db.commit()
+
+    # Change the cap and store it with the verdicts (evicts if now over it)
+    def resize(self, max_entries: int):
+        with self._lock:
+            self.max_entries = max_entries
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('max_entries', ?)", (max_entries,)
+            )
+            if self._count > self.max_entries:
+                self._evict()
+            self._db.commit()
+
+    # Words with an unexpired positive verdict
+    def positives(self) -> list[str]:
+        cutoff = time.time() - self.ttl_positive
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT word FROM verdicts WHERE ok = 1 AND stored >= ?", (cutoff,)
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def __setitem__(self, word: str, ok: bool):
+        self.set(word, ok)
+
+    def __contains__(self, word: str) -> bool:
+        return self.get(word) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    # Drop the least recently used rows (10% slack so eviction is amortized)
+    def _evict(self):
+        target = int(self.max_entries * 0.9)
+        excess = self._count - target
+        if excess <= 0:
+            return
+        self._flush_touched()   # recent hits must count as recent
+        self._db.execute(
+            "DELETE FROM verdicts WHERE word IN "
+            "(SELECT word FROM verdicts ORDER BY used ASC LIMIT ?)", (excess,)
+        )
+        self._count = self._db.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+        self.evictions += excess
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "entries": self._count,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate(), 4),
+        }
+
+    def close(self):
+        with self._lock:
+            if self._touched:
+                self._flush_touched()
+                self._db.commit()
+            self._db.close()
@@ -0,0 +1,129 @@
+import json
+import sys
+import time
+from pathlib import Path
+
+from Validator import singular_candidates
+
+# Offline plural expansion: every inflected form the plural rules in
+# Validator.singular_candidates accept (-s, -es, -ies -> y, -ves -> f/fe),
+# generated from known base words and stored as "FORM BASE" lines, so a
+# plural of a known word validates locally instead of over the network.
+
+DEFAULT_OUTPUT = "Inflections.txt"
+
+# Every plural of base that singular_candidates maps back to base
+def inflect(base: str) -> list[str]:
+    b = base.lower()
+    forms = {b + "s", b + "es"}
+    if b.endswith("y"):
+        forms.add(b[:-1] + "ies")
+    if b.endswith("f"):
+        forms.add(b[:-1] + "ves")
+    if b.endswith("fe"):
+        forms.add(b[:-2] + "ves")
+    upper = base.upper()
+    return sorted(f.upper() for f in forms if upper in singular_candidates(f))
+
+# All alphabetic lines of a word file, any length
+def read_bases(path) -> set[str]:
+    out = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            w = line.strip().upper()
+            if w.isalpha() and w.isascii():
+                out.add(w)
+    return out
+
+def build_inflections(bases, lengths=(5,), known=()) -> dict[str, str]:
+    """
+    form -> base for every inflection of the given lengths.
+    Forms already in `known` (the playable list) are skipped: they
+    validate locally anyway.
+    """
+    known = set(known)
+    out = {}
+    for base in sorted(bases):
+        # A plural adds 1-3 letters, so skip bases that cannot reach a target length
+        if not any(1 <= n - len(base) <= 3 for n in lengths):
+            continue
+        for form in inflect(base):
+            if len(form) in lengths and form not in known:
+                out.setdefault(form, base)
+    return out
+
+def save_inflections(mapping: dict, path=DEFAULT_OUTPUT):
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        for form in sorted(mapping):
+            f.write(f"{form} {mapping[form]}\n")
+    tmp.replace(path)
+
+# form -> base lookup used by the validator (empty if never generated)
+def load_inflections(path=DEFAULT_OUTPUT) -> dict[str, str]:
+    out = {}
+    path = Path(path)
+    if not path.exists():
+        return out
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 2:
+                out[parts[0]] = parts[1]
+    return out
+
+
+def main():
+    import argparse     # CLI only: kept off the game's startup path
+
+    parser = argparse.ArgumentParser(
+        description="Precompute plural forms of known words for offline validation",
+        epilog="A plural is 1-3 letters longer than its base, so 5-letter forms need "
+               "2-4 letter bases: pass word files with shorter words (the default "
+               "all-5-letter WordList.txt only yields forms for --length 6 and up).")
+    parser.add_argument("bases", nargs="*", default=["WordList.txt"],
+                        help="word files to take base words from (any lengths; default WordList.txt)")
+    parser.add_argument("--cache", default="meaning_cache.sqlite3",
+                        help="also use words the dictionary API confirmed (empty string to skip)")
+    parser.add_argument("--words", default="WordList.txt", help="playable list; forms already in it are skipped")
+    parser.add_argument("--length", type=int, nargs="+", default=[5], help="word lengths to generate")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    bases = set()
+    for path in args.bases:
+        bases |= read_bases(path)
+    from_cache = 0
+    confirmed = set()
+    if args.cache and Path(args.cache).exists():
+        from MeaningCache import MeaningCache
+        cache = MeaningCache(args.cache)
+        confirmed = set(cache.positives())
+        cache.close()
+        from_cache = len(confirmed - bases)
+        bases |= confirmed
+
+    known = read_bases(args.words) if Path(args.words).exists() else set()
+    mapping = build_inflections(bases, tuple(args.length), known)
+    save_inflections(mapping, args.output)
+
+    # Forms that used to need the API: no singular base is playable or
+    # already cached as a word (those validated locally before)
+    local = known | confirmed
+    removed = sum(1 for form in mapping if not any(b in local for b in singular_candidates(form)))
+    print(json.dumps({
+        "bases": len(bases),
+        "bases_from_cache": from_cache,
+        "forms": len(mapping),
+        "network_lookups_removed": removed,
+        "output": args.output,
+        "elapsed_ms": round((time.perf_counter() - t0) * 1000, 1),
+    }, indent=2))
+    if not mapping:
+        print("No forms generated: no base is 1-3 letters shorter than --length "
+              "(pass a word file with shorter words)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
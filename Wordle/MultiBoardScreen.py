@@ -0,0 +1,132 @@
+import os
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
+
+import pygame
+from GameEngine import MultiBoardEngine
+from GameScreen import GameScreen
+
+class MultiBoardScreen(GameScreen):
+    """
+    Quordle-style round: every guess is scored against N answers at once.
+    Input, validation, keyboard and messages come from GameScreen; each
+    board is kept in its own cached surface, so a full frame is one blit
+    per board and a keystroke repaints a single row strip.
+    """
+
+    # No "N words remaining" line with several answers
+    tracks_remaining = False
+
+    def __init__(self, app):
+        self.answers = list(app.context["answers"])
+        super().__init__(app)
+
+        self.engine = MultiBoardEngine(self.answers, self.rows, self.cols)
+        self._paint_boards()
+
+    # Extra guesses for extra boards (6 / 7 / 9 / 13 rows for 1 / 2 / 4 / 8)
+    def _rows_for(self, boards: int) -> int:
+        return self.app.context["max_attempts"] + boards - 1
+
+    def _board_count(self) -> int:
+        return len(self.answers)
+
+    def _layout_grid(self):
+        self.rows = self._rows_for(len(self.answers))
+        super()._layout_grid()
+        lay = self.layout
+        self.board_w, self.board_h = lay.board_w, lay.board_h
+        self.board_origins = lay.board_origins
+        # Board surfaces are kept while the board shape and window size stay the same
+        surfs = getattr(self, "_board_surfs", [])
+        if len(surfs) != len(self.answers) or surfs[0].get_size() != (self.board_w, self.board_h):
+            self._board_surfs = [pygame.Surface((self.board_w, self.board_h)) for _ in self.answers]
+            for surf in self._board_surfs:
+                surf.fill(self.background)
+
+    def relayout(self):
+        super().relayout()
+        self._paint_boards()
+
+    def reset(self):
+        answers = list(self.app.context["answers"])
+        self.answers = answers
+        self.answer = answers[0]
+        if len(self.answer) != self.cols:
+            self.cols = len(self.answer)
+            self.words_set = self._local_words()
+            self.validator = self._make_validator()
+        super().relayout()      # boards are painted below, once the engine is reset
+        self.engine.reset(self.answers, self.rows)
+        self.pending = None
+        self.message = ""
+        self._dirty.clear()
+        self._full_redraw = True
+        self._reset_indexes()
+        self._paint_boards()
+
+    # ---------------- Guess ----------------
+    def _finish_guess(self, guess: str, valid: bool):
+        row = self.engine.cur_row
+        self._invalidate(("row", row))
+        if not valid:
+            self._set_message("Not in dictionary.")
+            return
+        if self.message:
+            self._set_message("")
+
+        # One batched evaluation for every open board; keys keep the best state
+        for row_colors in self._apply_guess(guess):
+            if row_colors:
+                for ch, col in zip(guess, row_colors):
+                    self._upgrade_key_state(ch, col)
+        self._invalidate("keyboard")
+        if self.prefix is not None:
+            self.prefix.reset()
+
+        outcome = self.engine.outcome
+        if outcome:
+            self.app.end_game(outcome, ", ".join(self.answers), self.engine.guess_count)
+
+    # ---------------- Cached boards ----------------
+    def _region_rect(self, region) -> pygame.Rect:
+        if isinstance(region, tuple) and region[0] == "row":
+            step = self.cell_size + self.cell_gap
+            return pygame.Rect(self.grid_left, self.grid_top + region[1] * step, self.grid_w, self.cell_size)
+        return super()._region_rect(region)
+
+    def render(self):
+        if self._full_redraw:
+            # The full redraw blits the cached boards: bring changed rows up to date first
+            for region in self._dirty:
+                if isinstance(region, tuple) and region[0] == "row":
+                    for i in range(len(self._board_surfs)):
+                        self._paint_row(i, region[1])
+        return super().render()
+
+    def _paint_boards(self):
+        for i in range(len(self._board_surfs)):
+            for r in range(self.rows):
+                self._paint_row(i, r)
+
+    def _paint_row(self, i: int, r: int):
+        board = self.engine.boards[i]
+        surf = self._board_surfs[i]
+        step = self.cell_size + self.cell_gap
+        checking = self.pending is not None and not board.finished and r == board.cur_row
+        y = r * step
+        surf.fill(self.background, (0, y, self.board_w, self.cell_size))
+        for c in range(self.cols):
+            state = board.color(r, c) or ("checking" if checking else None)
+            surf.blit(self._cell_tile(state, board.letter(r, c)), (c * step, y))
+
+    def _draw_board(self):
+        for surf, origin in zip(self._board_surfs, self.board_origins):
+            self.surface.blit(surf, origin)
+
+    def _draw_row(self, r: int):
+        # Repaint the row on each board's surface and copy just that strip
+        step = self.cell_size + self.cell_gap
+        strip = pygame.Rect(0, r * step, self.board_w, self.cell_size)
+        for i, (x, y) in enumerate(self.board_origins):
+            self._paint_row(i, r)
+            self.surface.blit(self._board_surfs[i], (x, y + r * step), strip)
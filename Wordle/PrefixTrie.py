@@ -0,0 +1,253 @@
+from array import array
+
+# Prefix automaton (a DAWG: a trie with identical subtrees merged) for
+# live "can this row still become a word?" feedback while typing.
+#
+# Nodes live in two flat arrays:
+#   mask[n]   bit l set if node n has an edge for letter l (A = 0),
+#             bit 26 set if the path to n spells a whole word
+#   first[n]  offset of n's first outgoing edge in edges
+# and edges[] holds child node ids, each node's children contiguous and
+# in letter order. The child for letter l is
+#   edges[first[n] + popcount(mask[n] & ((1 << l) - 1))]
+# so one step is a mask test and a popcount, whatever the list size.
+#
+# The arrays are never rebuilt after a word list edit (update()): words
+# added later go into a small dict trie next to them, removed ones into
+# a set with a count per prefix, and lookups consult both. A prefix with
+# no removed word below it is decided by the automaton alone.
+TERMINAL = 1 << 26
+DEAD = -1
+
+
+class PrefixTrie:
+    def __init__(self, words):
+        # Plain nested-dict trie first ("" marks a word end); sorted input
+        # means every node's children are already in letter order...
+        root = {}
+        for w in sorted({w.strip().upper() for w in words}):
+            if not w.isalpha() or not w.isascii():
+                continue
+            node = root
+            for ch in w:
+                node = node.setdefault(ch, {})
+            node[""] = True
+
+        # ...then freeze it bottom-up, sharing nodes with equal (mask, children)
+        self.mask = array("I")
+        first = []
+        edges = []
+        registry = {}
+
+        def freeze(node) -> int:
+            mask = 0
+            ids = []
+            for ch, child in node.items():
+                if ch:
+                    mask |= 1 << (ord(ch) - 65)
+                    ids.append(freeze(child))
+                else:
+                    mask |= TERMINAL
+            key = (mask, *ids)
+            nid = registry.get(key)
+            if nid is None:
+                nid = registry[key] = len(self.mask)
+                self.mask.append(mask)
+                first.append(len(edges))
+                edges.extend(ids)
+            return nid
+
+        self.root = freeze(root)
+        # 16-bit offsets and ids while they fit
+        small = max(len(self.mask), len(edges)) <= 0xFFFF
+        self.first = array("H" if small else "I", first)
+        self.edges = array("H" if small else "I", edges)
+
+        self._extra = {}                # added words, nested dicts as above
+        self._removed = set()
+        self._removed_prefixes = {}     # prefix -> removed words starting with it
+
+    def __len__(self) -> int:
+        return len(self.mask)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(a) * a.itemsize for a in (self.mask, self.first, self.edges))
+
+    def child(self, node: int, ch: str) -> int:
+        bit = 1 << (ord(ch) - 65)
+        mask = self.mask[node]
+        if not (0 < bit < TERMINAL and mask & bit):
+            return DEAD
+        return self.edges[self.first[node] + (mask & (bit - 1)).bit_count()]
+
+    def walk(self, prefix: str) -> int:
+        node = self.root
+        for ch in prefix:
+            node = self.child(node, ch)
+            if node == DEAD:
+                break
+        return node
+
+    def _extra_node(self, prefix: str):
+        node = self._extra
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                break
+        return node
+
+    def _in_automaton(self, word: str) -> bool:
+        node = self.walk(word)
+        return node != DEAD and bool(self.mask[node] & TERMINAL)
+
+    def _live(self, node: int, prefix: str) -> bool:
+        # Does a word that was not removed continue prefix below node?
+        # Only branches leading to removed words need a look
+        if node == DEAD:
+            return False
+        stack = [(node, prefix)]
+        while stack:
+            n, p = stack.pop()
+            if p not in self._removed_prefixes:
+                return True
+            mask = self.mask[n]
+            if mask & TERMINAL and p not in self._removed:
+                return True
+            bits, k = mask & (TERMINAL - 1), self.first[n]
+            while bits:
+                low = bits & -bits
+                stack.append((self.edges[k], p + chr(64 + low.bit_length())))
+                bits ^= low
+                k += 1
+        return False
+
+    def has_prefix(self, prefix: str) -> bool:
+        return self._live(self.walk(prefix), prefix) or self._extra_node(prefix) is not None
+
+    def __contains__(self, word) -> bool:
+        if self._in_automaton(word):
+            return word not in self._removed
+        node = self._extra_node(word)
+        return node is not None and "" in node
+
+    # ---------------- Edits ----------------
+    def update(self, added=(), removed=()):
+        # O(length) per word, whatever the list size
+        for w in removed:
+            if self._in_automaton(w):
+                if w not in self._removed:
+                    self._removed.add(w)
+                    for i in range(len(w) + 1):
+                        self._removed_prefixes[w[:i]] = self._removed_prefixes.get(w[:i], 0) + 1
+            else:
+                self._discard_extra(w)
+        for w in added:
+            if w in self._removed:
+                self._removed.discard(w)
+                for i in range(len(w) + 1):
+                    left = self._removed_prefixes.pop(w[:i]) - 1
+                    if left:
+                        self._removed_prefixes[w[:i]] = left
+            elif not self._in_automaton(w):
+                node = self._extra
+                for ch in w:
+                    node = node.setdefault(ch, {})
+                node[""] = True
+
+    def _discard_extra(self, word: str):
+        path = [self._extra]
+        for ch in word:
+            node = path[-1].get(ch)
+            if node is None:
+                return
+            path.append(node)
+        if path[-1].pop("", None) is None:
+            return
+        # Prune the branches left empty
+        for depth in range(len(word), 0, -1):
+            if path[depth]:
+                break
+            del path[depth - 1][word[depth - 1]]
+
+    def cursor(self) -> "PrefixCursor":
+        if self._extra or self._removed:
+            return EditedPrefixCursor(self)
+        return PrefixCursor(self)
+
+
+class PrefixCursor:
+    """
+    Follows the row being typed: push() per letter, pop() per backspace.
+    Keeps the node reached after every letter, so both are O(1); once a
+    letter falls off the automaton every deeper entry is DEAD.
+    A cursor reflects the trie as it was when created: take a new one
+    after update().
+    """
+
+    __slots__ = ("trie", "stack")
+
+    def __init__(self, trie: PrefixTrie):
+        self.trie = trie
+        self.stack = [trie.root]
+
+    def push(self, ch: str) -> bool:
+        node = self.stack[-1]
+        if node != DEAD:
+            node = self.trie.child(node, ch)
+        self.stack.append(node)
+        return node != DEAD
+
+    def pop(self):
+        if len(self.stack) > 1:
+            self.stack.pop()
+
+    def reset(self):
+        del self.stack[1:]
+
+    @property
+    def alive(self) -> bool:
+        return self.stack[-1] != DEAD
+
+    # Letters in the shortest dead prefix (the one that broke the row)
+    @property
+    def dead_at(self) -> int:
+        return self.stack.index(DEAD)
+
+    @property
+    def depth(self) -> int:
+        return len(self.stack) - 1
+
+
+class EditedPrefixCursor(PrefixCursor):
+    """
+    Cursor over an edited trie: keeps (automaton node, added-words node,
+    prefix, alive) per letter. Still O(1) a step unless a removed word
+    shares the prefix.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, trie: PrefixTrie):
+        self.trie = trie
+        self.stack = [(trie.root, trie._extra, "", True)]
+
+    def push(self, ch: str) -> bool:
+        trie = self.trie
+        node, extra, prefix, alive = self.stack[-1]
+        if node != DEAD:
+            node = trie.child(node, ch)
+        extra = extra.get(ch) if extra else None
+        prefix += ch
+        if alive:
+            alive = extra is not None or trie._live(node, prefix)
+        self.stack.append((node, extra, prefix, alive))
+        return alive
+
+    @property
+    def alive(self) -> bool:
+        return self.stack[-1][3]
+
+    @property
+    def dead_at(self) -> int:
+        return next(i for i, entry in enumerate(self.stack) if not entry[3])
@@ -0,0 +1,185 @@
+import os
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
+
+import json
+import time
+from array import array
+
+import pygame
+
+# Optional frame-time instrumentation. Off by default and free when off:
+# App only checks one flag per frame, and screen methods are wrapped with
+# timers (instance attributes shadowing the class methods) only while
+# profiling is enabled. Set WORDLE_PROFILE=1 to start enabled; F3 toggles
+# the overlay (and enables profiling on first use).
+
+# Screen methods timed as sub-phases when present (GameScreen also records
+# "validate" around validator.check() and "evaluate" around apply_guess)
+SCREEN_SECTIONS = (
+    "_draw_board", "_draw_row", "_draw_keyboard", "_draw_message", "_draw_remaining",
+    "_finish_guess",
+)
+
+# Histogram buckets: bucket i counts samples under 2**i microseconds
+BUCKETS = 24
+
+
+class Section:
+    """Fixed-size ring buffer of recent samples plus an all-time log2 histogram."""
+
+    __slots__ = ("samples", "pos", "count", "total", "max", "hist")
+
+    def __init__(self, capacity: int):
+        self.samples = array("d", [0.0]) * capacity
+        self.pos = 0
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.hist = array("L", [0]) * BUCKETS
+
+    def add(self, seconds: float):
+        self.samples[self.pos] = seconds
+        self.pos = (self.pos + 1) % len(self.samples)
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.hist[min(BUCKETS - 1, int(seconds * 1e6).bit_length())] += 1
+
+    def recent(self) -> list[float]:
+        return sorted(self.samples[:min(self.count, len(self.samples))])
+
+    def summary(self) -> dict:
+        recent = self.recent()
+
+        def pct(q):
+            return round(recent[min(len(recent) - 1, int(q * len(recent)))] * 1000, 3) if recent else 0.0
+
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": pct(0.50),
+            "p95_ms": pct(0.95),
+            "p99_ms": pct(0.99),
+            "max_ms": round(self.max * 1000, 3),
+            "histogram_us": {f"<{1 << i}": n for i, n in enumerate(self.hist) if n},
+        }
+
+
+class Profiler:
+    def __init__(self, enabled: bool = False, capacity: int = 600, output: str = "profile.json"):
+        self.enabled = False
+        self.capacity = capacity
+        self.output = output
+        self.overlay = False
+        self.sections: dict[str, Section] = {}
+        self.used = False           # dump on exit only if something was recorded
+        self._wrapped = []          # (obj, name) pairs to restore on disable
+        self._patch = None          # (rect, pixels) under the overlay
+        self._font = None
+        if enabled:
+            self.enable()
+
+    @classmethod
+    def from_env(cls) -> "Profiler":
+        return cls(enabled=os.environ.get("WORDLE_PROFILE", "") not in ("", "0"),
+                   output=os.environ.get("WORDLE_PROFILE_OUT", "profile.json"))
+
+    def enable(self):
+        self.enabled = True
+        self.used = True
+
+    def disable(self):
+        self.enabled = False
+        self.overlay = False
+        for obj, name in self._wrapped:
+            obj.__dict__.pop(name, None)
+        self._wrapped.clear()
+
+    def record(self, name: str, seconds: float):
+        sec = self.sections.get(name)
+        if sec is None:
+            sec = self.sections[name] = Section(self.capacity)
+        sec.add(seconds)
+
+    # ---------------- Method wrapping ----------------
+    def instrument(self, obj, names=SCREEN_SECTIONS):
+        # Shadow obj.name with a timed wrapper (once per object)
+        if not self.enabled:
+            return
+        for name in names:
+            if name in obj.__dict__ or not hasattr(obj, name):
+                continue
+            setattr(obj, name, self._timed(name, getattr(obj, name)))
+            self._wrapped.append((obj, name))
+
+    def instrument_future(self, obj, name: str, section: str):
+        # Time a method that returns a Future from call until completion
+        if not self.enabled or name in obj.__dict__:
+            return
+        fn = getattr(obj, name)
+        record = self.record
+
+        def wrapper(*args, **kwargs):
+            t0 = time.perf_counter()
+            fut = fn(*args, **kwargs)
+            fut.add_done_callback(lambda _: record(section, time.perf_counter() - t0))
+            return fut
+
+        setattr(obj, name, wrapper)
+        self._wrapped.append((obj, name))
+
+    def _timed(self, name, fn):
+        record = self.record
+
+        def wrapper(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - t0)
+        return wrapper
+
+    # ---------------- Overlay ----------------
+    def toggle_overlay(self):
+        if not self.enabled:
+            self.enable()
+        self.overlay = not self.overlay
+
+    def restore(self, surface: pygame.Surface):
+        # Put back the pixels the overlay covered, before the screen repaints
+        if self._patch is None:
+            return None
+        rect, pixels = self._patch
+        self._patch = None
+        surface.blit(pixels, rect)
+        return rect
+
+    def draw_overlay(self, surface: pygame.Surface):
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+        lines = ["section        p50 ms   p95 ms   max ms      n"]
+        for name in sorted(self.sections):
+            s = self.sections[name].summary()
+            lines.append(f"{name[:14]:<14}{s['p50_ms']:>7.2f}  {s['p95_ms']:>7.2f}  "
+                         f"{s['max_ms']:>7.2f}  {s['count']:>5}")
+
+        surfs = [self._font.render(line, True, (230, 230, 120)) for line in lines]
+        rect = pygame.Rect(6, 6, max(s.get_width() for s in surfs) + 12, 16 * len(surfs) + 10)
+        rect = rect.clip(surface.get_rect())
+        self._patch = (rect, surface.subsurface(rect).copy())
+
+        surface.fill((0, 0, 0), rect)
+        for i, s in enumerate(surfs):
+            surface.blit(s, (rect.x + 6, rect.y + 5 + 16 * i))
+        return rect
+
+    # ---------------- Export ----------------
+    def report(self) -> dict:
+        return {name: sec.summary() for name, sec in sorted(self.sections.items())}
+
+    def dump(self, path=None):
+        path = path or self.output
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        return path
@@ -0,0 +1,191 @@
+import os
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
+
+import json
+import struct
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+import pygame
+
+# Input recording and deterministic replay for App.run.
+#
+# Log layout (little-endian):
+#   header  magic "WREC", version, RNG seed (u64), word index crc32,
+#           options size (u16) + JSON App options (length, boards, tier)
+#   records frame (u32), kind (u8), code (u32), x (i16), y (i16)
+#           (window resizes: x, y = new width, height)
+#
+# Besides input, the log holds every dictionary verdict and the frame it
+# reached the game on. Validator futures only complete at frame
+# boundaries (both while recording and replaying), so a replay takes the
+# same path through GameScreen.update as the original session without
+# touching the network.
+HEADER = struct.Struct("<4sHQIH")
+RECORD = struct.Struct("<IBIhh")
+MAGIC = b"WREC"
+VERSION = 5
+
+KEYDOWN, MOUSEDOWN, MOUSEUP, QUIT, VERDICT, VERDICT_NOW, RESIZE = range(1, 8)
+
+
+class _SessionValidator:
+    """Stands in for a screen's WordValidator; verdicts go through the session."""
+
+    def __init__(self, inner, session):
+        self.inner = inner
+        self.session = session
+
+    @property
+    def use_api(self):
+        return self.inner.use_api
+
+    @use_api.setter
+    def use_api(self, value):
+        self.inner.use_api = value
+
+    def check(self, word: str) -> Future:
+        return self.session.check(self.inner, word)
+
+    def is_valid(self, word: str) -> bool:
+        return self.inner.is_valid(word)
+
+
+class Session:
+    def __init__(self, seed: int, options=None):
+        self.seed = seed
+        self.options = dict(options or {})   # App keyword arguments besides the seed
+
+    def wrap_validator(self, validator):
+        if isinstance(validator, _SessionValidator):
+            # Pooled screen from an earlier run: point it at this session
+            validator.session = self
+            return validator
+        return _SessionValidator(validator, self)
+
+    def begin_frame(self, frame: int):
+        pass
+
+    def close(self):
+        pass
+
+
+class Recorder(Session):
+    def __init__(self, path, seed: int, words_crc: int = 0, options=None):
+        super().__init__(seed, options)
+        self.path = path
+        self.frame = 0
+        blob = json.dumps(self.options, sort_keys=True).encode()
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, seed, words_crc, len(blob)) + blob)
+        self._pending = []          # (inner future, proxy future)
+        self._lock = threading.Lock()
+
+    def _write(self, frame: int, kind: int, code: int = 0, x: int = 0, y: int = 0):
+        self._file.write(RECORD.pack(frame, kind, code, x, y))
+
+    def check(self, validator, word: str) -> Future:
+        inner = validator.check(word)
+        if inner.done():
+            ok = bool(inner.result())
+            self._write(self.frame, VERDICT_NOW, int(ok))
+            return inner
+        proxy = Future()
+        with self._lock:
+            self._pending.append((inner, proxy))
+        return proxy
+
+    def begin_frame(self, frame: int):
+        self.frame = frame
+        if not self._pending:
+            return
+        # Hand finished lookups to the game only now, at a frame boundary
+        with self._lock:
+            ready = [p for p in self._pending if p[0].done()]
+            self._pending = [p for p in self._pending if not p[0].done()]
+        for inner, proxy in ready:
+            ok = bool(inner.result())
+            self._write(frame, VERDICT, int(ok))
+            proxy.set_result(ok)
+
+    def record(self, frame: int, events):
+        wrote = False
+        for e in events:
+            if e.type == pygame.KEYDOWN:
+                self._write(frame, KEYDOWN, e.key)
+            elif e.type == pygame.MOUSEBUTTONDOWN:
+                self._write(frame, MOUSEDOWN, e.button, *e.pos)
+            elif e.type == pygame.MOUSEBUTTONUP:
+                self._write(frame, MOUSEUP, e.button, *e.pos)
+            elif e.type == pygame.QUIT:
+                self._write(frame, QUIT)
+            elif e.type == pygame.VIDEORESIZE:
+                self._write(frame, RESIZE, 0, *e.size)
+            else:
+                continue
+            wrote = True
+        if wrote:
+            # Keep the log usable if the game crashes later
+            self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class Replayer(Session):
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is not a Wordle input log")
+        magic, version, seed, self.words_crc, size = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a Wordle input log")
+        start = HEADER.size + size
+        super().__init__(seed, json.loads(data[HEADER.size:start] or b"{}"))
+
+        self.inputs = deque()
+        self.verdicts = deque()
+        usable = start + (len(data) - start) // RECORD.size * RECORD.size
+        for rec in RECORD.iter_unpack(data[start:usable]):
+            (self.verdicts if rec[1] in (VERDICT, VERDICT_NOW) else self.inputs).append(rec)
+        self._pending = deque()     # proxies waiting for their recorded frame
+
+    @property
+    def finished(self) -> bool:
+        return not self.inputs and not self._pending
+
+    def check(self, validator, word: str) -> Future:
+        fut = Future()
+        if not self.verdicts:
+            # Log ends before the verdict arrived: leave it pending
+            return fut
+        frame, kind, ok, _, _ = self.verdicts.popleft()
+        if kind == VERDICT_NOW:
+            fut.set_result(bool(ok))
+        else:
+            self._pending.append((frame, fut, bool(ok)))
+        return fut
+
+    def begin_frame(self, frame: int):
+        while self._pending and self._pending[0][0] <= frame:
+            _, fut, ok = self._pending.popleft()
+            fut.set_result(ok)
+
+    def events(self, frame: int) -> list:
+        out = []
+        while self.inputs and self.inputs[0][0] <= frame:
+            _, kind, code, x, y = self.inputs.popleft()
+            if kind == KEYDOWN:
+                out.append(pygame.event.Event(pygame.KEYDOWN, key=code, mod=0, unicode=""))
+            elif kind == MOUSEDOWN:
+                out.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=code, pos=(x, y)))
+            elif kind == MOUSEUP:
+                out.append(pygame.event.Event(pygame.MOUSEBUTTONUP, button=code, pos=(x, y)))
+            elif kind == QUIT:
+                out.append(pygame.event.Event(pygame.QUIT))
+            elif kind == RESIZE:
+                out.append(pygame.event.Event(pygame.VIDEORESIZE, size=(x, y), w=x, h=y))
+        return out
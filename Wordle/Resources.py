@@ -0,0 +1,85 @@
+import os
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
+
+from collections import OrderedDict
+
+import pygame
+from Layout import CACHE_SIZE, scale_for
+
+
+class Resources:
+    """
+    Display, fonts and theme, created once by App and borrowed by every
+    screen (so restarts never rebuild them). The window is resizable:
+    resize() re-creates the display surface and picks fonts for the new
+    scale; geometry lives in Layout.py.
+    """
+
+    def __init__(self, size=(1200, 800), caption: str = "Wordle"):
+        # Pygame
+        pygame.init()
+        self.W, self.H = size
+        self.surface = pygame.display.set_mode(size, pygame.RESIZABLE)
+        pygame.display.set_caption(caption)
+        pygame.key.set_repeat(300, 35)  # hold key to delete smoothly
+
+        # Theme
+        self.theme = {
+            "background":  (18, 18, 19),
+            "grid_empty":  (58, 58, 60),
+            "text":        (232, 232, 232),
+            "green":       (83, 141, 78),
+            "yellow":      (181, 159, 59),
+            "gray":        (58, 58, 60),
+            "keycap":      (129, 131, 132),
+            "keytext":     (255, 255, 255),
+        }
+
+        # Show the (empty) window at once; the first screen draws over it
+        self.surface.fill(self.theme["background"])
+        pygame.display.flip()
+
+        # Fonts (sizes for a 1200x800 window; scaled with it)
+        self.key_font_name = pygame.font.match_font("Consolas")
+        self._sized_fonts: OrderedDict = OrderedDict()    # LRU, like Layout's caches
+        self._use_scale(scale_for(self.W, self.H))
+
+    # Font at an arbitrary size (default face unless named), created once per
+    # size; the least recently used go once CACHE_SIZE sizes are held
+    def font(self, size: int, name=None) -> pygame.font.Font:
+        key = (name, size)
+        font = self._sized_fonts.get(key)
+        if font is None:
+            font = self._sized_fonts[key] = pygame.font.Font(name, size)
+            if len(self._sized_fonts) > CACHE_SIZE:
+                self._sized_fonts.popitem(last=False)
+        else:
+            self._sized_fonts.move_to_end(key)
+        return font
+
+    def _use_scale(self, scale: float):
+        self.scale = scale
+
+        def px(v):
+            return max(8, round(v * scale))
+
+        self.fonts = {
+            "cell":      self.font(px(64)),
+            "key":       self.font(px(40), self.key_font_name),
+            "key_small": self.font(px(26), self.key_font_name),
+            "msg":       self.font(px(32)),
+            "title":     self.font(px(72)),
+            "text":      self.font(px(36)),
+        }
+
+    # New window size (from VIDEORESIZE); False if nothing changed
+    def resize(self, size) -> bool:
+        size = (max(320, size[0]), max(240, size[1]))
+        if size == (self.W, self.H):
+            return False
+        self.W, self.H = size
+        if pygame.display.get_surface() is None or pygame.display.get_surface().get_size() != size:
+            pygame.display.set_mode(size, pygame.RESIZABLE)
+        self.surface = pygame.display.get_surface()
+        self._use_scale(scale_for(self.W, self.H))
+        return True
@@ -3,44 +3,48 @@ os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
 
 import pygame
 from Screen import Screen
+from GlyphCache import glyph_cache
+from Layout import result_layout
+
+THEMES = {
+    "victory": {"title": "YOU WIN!",  "color": (80,200,120), "background": (240,255,240)},
+    "defeat":  {"title": "YOU LOSE!", "color": (220,80,80),  "background": (255,240,240)},
+}
 
 class ResultScreen(Screen):
     def __init__(self, app, result_type: str, answer: str):
         self.app = app
+
+        # Redraw tracking: full frame first, then only buttons whose look changed
+        self._button_looks = {}
+        self.reset(result_type, answer)
+
+    # ---------------- Window Setup ----------------
+    # Display and fonts are owned by App; positions and button rects come
+    # from Layout.py, memoized per window size (also used for hit-testing)
+    def relayout(self):
+        res = self.app.resources
+        self.W, self.H = res.W, res.H
+        self.surface = res.surface
+        self.font_title = res.fonts["title"]
+        self.font_text  = res.fonts["text"]
+        self.font_stats = res.fonts["msg"]
+        self.layout = result_layout(self.W, self.H)
+        self.button_restart = self.layout.button_restart
+        self.button_quit = self.layout.button_quit
+        self._button_looks.clear()
+        self._full_redraw = True
+
+    # Show a new result on this screen (screens are pooled by App)
+    def reset(self, result_type: str, answer: str):
         self.result_type = result_type
         self.answer = answer
         self.mouse_down = False
 
-        # Initialize pygame modules
-        pygame.init() 
-
-        # ---------------- Window Setup ----------------
-        self.W, self.H = 1200, 800
-        self.surface = pygame.display.set_mode((self.W, self.H))
-        pygame.display.set_caption("Wordle")
-
-        # ---------------- Fonts ----------------
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_text  = pygame.font.Font(None, 36)
-
         # ---------------- Theme ----------------
         # Choose colors and text based on the result type
-        self.theme = {
-            "victory": {"title": "YOU WIN!",  "color": (80,200,120), "background": (240,255,240)},
-            "defeat":  {"title": "YOU LOSE!", "color": (220,80,80),  "background": (255,240,240)},
-        }[self.result_type]
-
-        # ---------------- Buttons Layout ----------------
-        # Define two buttons, centered horizontally
-        button_w, button_h = 160, 60
-        gap = 40  # space between buttons
-        total_w = button_w * 2 + gap
-        start_x = (self.W - total_w) // 2
-        y = self.H // 2 + 100  # slightly below center
-
-        # Create rectangle areas for the buttons
-        self.button_restart = pygame.Rect(start_x, y, button_w, button_h)
-        self.button_quit = pygame.Rect(start_x + button_w + gap, y, button_w, button_h)
+        self.theme = THEMES[self.result_type]
+        self.relayout()
 
     def handle(self, event):
         if event is None:
@@ -49,6 +53,9 @@ class ResultScreen(Screen):
         if event.type == pygame.QUIT:
             self.app.set_screen(None)
 
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self._full_redraw = True
+
         # If user clicks with mouse
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             self.mouse_down = True
@@ -65,51 +72,86 @@ class ResultScreen(Screen):
         pass
 
     def render(self):
-        # ---------------- Background ----------------
-        self.surface.fill((18, 18, 19))  # Dark theme background
-
-        # ---------------- Title ----------------
-        title = self.font_title.render(self.theme["title"], True, self.theme["color"])
-        self.surface.blit(title, title.get_rect(center=(self.W // 2, self.H // 2 - 120)))
-
-        # ---------------- Answer ----------------
-        ans = self.font_text.render(f"Answer: {self.answer}", True, (220, 220, 220))
-        self.surface.blit(ans, ans.get_rect(center=(self.W // 2, self.H // 2 - 10)))
-
         # ---------------- Hover detection ----------------
         mouse_pos = pygame.mouse.get_pos()
         mouse_down = pygame.mouse.get_pressed()[0]  # Left mouse button pressed?
 
-        # Helper function to draw a scaling button
-        def draw_button(base_rect, color, text):
-            # Determine if mouse is over this button
-            hovering = base_rect.collidepoint(mouse_pos)
+        buttons = [
+            (self.button_restart, (100, 200, 250), "Restart"),
+            (self.button_quit, (200, 100, 100), "Quit"),
+        ]
 
-            # Scale factor (grow on hover, shrink when pressed)
+        # Scale factor (grow on hover, shrink when pressed)
+        def button_scale(base_rect):
+            hovering = base_rect.collidepoint(mouse_pos)
             if hovering and mouse_down:
-                scale = 0.93   # pressed
+                return 0.93   # pressed
             elif hovering:
-                scale = 1.08   # hover
-            else:
-                scale = 1.0    # normal
-
-            # Compute new scaled rect (centered around original center)
-            new_w = int(base_rect.width * scale)
-            new_h = int(base_rect.height * scale)
-            scaled_rect = pygame.Rect(0, 0, new_w, new_h)
-            scaled_rect.center = base_rect.center
-
-            # Draw button background
-            pygame.draw.rect(self.surface, color, scaled_rect, border_radius=12)
-
-            # Draw text centered
-            txt = self.font_text.render(text, True, (255, 255, 255))
-            self.surface.blit(txt, txt.get_rect(center=scaled_rect.center))
+                return 1.08   # hover
+            return 1.0        # normal
+
+        if self._full_redraw:
+            self._full_redraw = False
+            self._draw_static()
+            for base_rect, color, text in buttons:
+                scale = button_scale(base_rect)
+                self._button_looks[text] = scale
+                self._draw_button(base_rect, color, text, scale)
+            return [self.surface.get_rect()]
+
+        # Only buttons whose hover / pressed look changed
+        rects = []
+        for base_rect, color, text in buttons:
+            scale = button_scale(base_rect)
+            if self._button_looks.get(text) == scale:
+                continue
+            self._button_looks[text] = scale
+            area = base_rect.inflate(base_rect.width // 5, base_rect.height // 5)
+            self.surface.fill((18, 18, 19), area)
+            self._draw_button(base_rect, color, text, scale)
+            rects.append(area)
+        return rects
+
+    def _draw_static(self):
+        # ---------------- Background ----------------
+        self.surface.fill((18, 18, 19))  # Dark theme background
 
-        # ---------------- Draw Buttons ----------------
-        draw_button(self.button_restart, (100, 200, 250), "Restart")
-        draw_button(self.button_quit, (200, 100, 100), "Quit")
+        # ---------------- Title ----------------
+        title = glyph_cache.text(self.font_title, self.theme["title"], self.theme["color"])
+        self.surface.blit(title, title.get_rect(center=(self.W // 2, self.layout.title_y)))
 
-        # ---------------- Display Update ----------------
-        pygame.display.flip()
+        # ---------------- Answer ----------------
+        ans = glyph_cache.text(self.font_text, f"Answer: {self.answer}", (220, 220, 220))
+        self.surface.blit(ans, ans.get_rect(center=(self.W // 2, self.layout.answer_y)))
 
+        # ---------------- Statistics ----------------
+        # Running totals kept by App.stats: nothing here walks the history
+        stats = getattr(self.app, "stats", None)
+        if stats is None or not stats.played:
+            return
+        summary = (f"Played {stats.played}    Win {stats.win_rate:.0%}    "
+                   f"Streak {stats.streak}    Best {stats.max_streak}")
+        # New text every round: rendered directly rather than through the glyph cache
+        line = self.font_stats.render(summary, True, (200, 200, 200))
+        self.surface.blit(line, line.get_rect(center=(self.W // 2, self.layout.stats_y)))
+
+        # Winning guess counts, 1 .. max_attempts (or further if ever used)
+        last = max([self.app.context["max_attempts"]] + [i + 1 for i, n in enumerate(stats.dist) if n])
+        dist = "   ".join(f"{i + 1}: {stats.dist[i]}" for i in range(last))
+        line = self.font_stats.render(dist, True, (160, 160, 160))
+        self.surface.blit(line, line.get_rect(center=(self.W // 2, self.layout.dist_y)))
+
+    # Draw a button scaled around its center
+    def _draw_button(self, base_rect, color, text, scale):
+        # Compute new scaled rect (centered around original center)
+        new_w = int(base_rect.width * scale)
+        new_h = int(base_rect.height * scale)
+        scaled_rect = pygame.Rect(0, 0, new_w, new_h)
+        scaled_rect.center = base_rect.center
+
+        # Draw button background
+        pygame.draw.rect(self.surface, color, scaled_rect, border_radius=12)
+
+        # Draw text centered
+        txt = glyph_cache.text(self.font_text, text, (255, 255, 255))
+        self.surface.blit(txt, txt.get_rect(center=scaled_rect.center))
@@ -7,9 +7,18 @@ class Screen(ABC):
     @abstractmethod
     def update(self): pass
     
+    # Draw what changed and return the dirty rects ([] when nothing did)
     @abstractmethod
     def render(self): pass
 
+    # True while the screen needs frames without input (e.g. a pending check)
+    def is_animating(self) -> bool:
+        return False
 
+    # The window was resized: re-read the surface and geometry, redraw fully
+    def relayout(self):
+        pass
 
-
+    # The word list changed under a running round (App.reload_words)
+    def words_changed(self):
+        pass
@@ -0,0 +1,263 @@
+import argparse
+import asyncio
+import json
+import secrets
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlsplit
+
+from GameEngine import GameEngine
+from MeaningCache import MeaningCache
+from Validator import WordValidator
+from WordList import load_words, choose_random_word
+
+# Minimal HTTP/1.1 + JSON front end for many concurrent games.
+#   POST /new                      -> {"id", "rows", "cols"}
+#   POST /guess {"id", "guess"}    -> {"valid", "colors", "result", ...}
+#   GET  /state?id=...             -> board so far
+# Connections are kept alive; the whole server runs on one event loop.
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Content Too Large"}
+
+# Largest request body accepted (a guess is a few dozen bytes)
+MAX_BODY = 16 * 1024
+
+
+class Session:
+    __slots__ = ("engine", "last_seen")
+
+    def __init__(self, engine: GameEngine):
+        self.engine = engine
+        self.last_seen = time.monotonic()
+
+
+class WordleServer:
+    def __init__(self, words, validator=None, max_attempts: int = 6,
+                 idle_timeout: float = 600.0, max_sessions: int = 200_000):
+        self.words = words
+        self.words_set = set(words)
+        self.validator = validator or WordValidator(self.words_set)
+        self.max_attempts = max_attempts
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        # Least recently used first: touched sessions move to the end
+        self.sessions: "OrderedDict[str, Session]" = OrderedDict()
+
+        self.created = 0
+        self.evicted = 0
+        self._server = None
+        self._reaper = None
+
+    # ---------------- Lifecycle ----------------
+    async def start(self, host: str = "127.0.0.1", port: int = 8080):
+        self._server = await asyncio.start_server(self._serve_client, host, port)
+        self._reaper = asyncio.create_task(self._evict_loop())
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._reaper:
+            self._reaper.cancel()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _evict_loop(self):
+        while True:
+            await asyncio.sleep(max(1.0, self.idle_timeout / 4))
+            self.evict_idle()
+
+    def evict_idle(self, now=None) -> int:
+        now = time.monotonic() if now is None else now
+        # Oldest first, so stop at the first session still in use
+        count = 0
+        while self.sessions:
+            sid, s = next(iter(self.sessions.items()))
+            if now - s.last_seen <= self.idle_timeout:
+                break
+            del self.sessions[sid]
+            count += 1
+        self.evicted += count
+        return count
+
+    def _touch(self, sid: str):
+        session = self.sessions.get(sid)
+        if session is not None:
+            session.last_seen = time.monotonic()
+            self.sessions.move_to_end(sid)
+        return session
+
+    # ---------------- Game API ----------------
+    def new_game(self) -> dict:
+        if len(self.sessions) >= self.max_sessions:
+            # Drop the least recently used session to stay bounded
+            self.sessions.popitem(last=False)
+            self.evicted += 1
+
+        sid = secrets.token_hex(8)
+        engine = GameEngine(choose_random_word(self.words), self.max_attempts, 5)
+        self.sessions[sid] = Session(engine)
+        self.created += 1
+        return {"id": sid, "rows": engine.rows, "cols": engine.cols}
+
+    async def is_valid(self, word: str) -> bool:
+        if word in self.words_set:
+            return True
+        # Network lookups run on the validator's own pool; await its verdict
+        return await asyncio.wrap_future(self.validator.check(word))
+
+    async def guess(self, sid: str, word: str):
+        session = self._touch(sid)
+        if session is None:
+            return 404, {"error": "unknown session"}
+        engine = session.engine
+
+        word = (word or "").strip().upper()
+        if engine.finished:
+            return 400, {"error": "game is over", **self._state(engine)}
+        if len(word) != engine.cols or not word.isalpha() or not word.isascii():
+            return 400, {"error": f"guess must be {engine.cols} letters"}
+
+        if not await self.is_valid(word):
+            return 200, {"valid": False}
+
+        # The session may have been evicted or finished while we awaited
+        if self.sessions.get(sid) is not session or engine.finished:
+            return 404, {"error": "unknown session"}
+
+        colors = engine.apply_guess(word)
+        return 200, {"valid": True, "colors": colors, **self._state(engine, board=False)}
+
+    def state(self, sid: str):
+        session = self._touch(sid)
+        if session is None:
+            return 404, {"error": "unknown session"}
+        return 200, self._state(session.engine)
+
+    def _state(self, engine: GameEngine, board: bool = True) -> dict:
+        out = {"row": engine.cur_row, "result": engine.outcome}
+        if engine.outcome:
+            out["answer"] = engine.answer
+        if board:
+            rows = engine.cur_row + (1 if engine.outcome == "victory" else 0)
+            out["guesses"] = [
+                {"word": "".join(engine.letter(r, c) for c in range(engine.cols)),
+                 "colors": [engine.color(r, c) for c in range(engine.cols)]}
+                for r in range(min(rows, engine.rows))
+            ]
+        return out
+
+    # ---------------- HTTP ----------------
+    async def _route(self, method: str, target: str, body: bytes):
+        url = urlsplit(target)
+        if url.path == "/new":
+            if method != "POST":
+                return 405, {"error": "use POST"}
+            return 200, self.new_game()
+
+        if url.path == "/guess":
+            if method != "POST":
+                return 405, {"error": "use POST"}
+            try:
+                data = json.loads(body or b"{}")
+            except ValueError:
+                return 400, {"error": "invalid JSON"}
+            if not isinstance(data, dict):
+                return 400, {"error": "expected a JSON object"}
+            if not isinstance(data.get("id", ""), str) or not isinstance(data.get("guess", ""), str):
+                return 400, {"error": "id and guess must be strings"}
+            return await self.guess(data.get("id", ""), data.get("guess", ""))
+
+        if url.path == "/state":
+            sid = parse_qs(url.query).get("id", [""])[0]
+            return self.state(sid)
+
+        if url.path == "/stats":
+            return 200, {"sessions": len(self.sessions), "created": self.created, "evicted": self.evicted}
+
+        return 404, {"error": "not found"}
+
+    async def _serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    method, target, _ = line.decode("latin-1").split(" ", 2)
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    h = await reader.readline()
+                    if h in (b"\r\n", b"\n", b""):
+                        break
+                    k, _, v = h.decode("latin-1").partition(":")
+                    headers[k.strip().lower()] = v.strip()
+
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    # The body can't be framed: answer and drop the connection
+                    await self._respond(writer, 400, {"error": "invalid Content-Length"}, False)
+                    break
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, {"error": f"body over {MAX_BODY} bytes"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self._route(method.upper(), target, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            # Peer gone, or a line over the stream limit (readline raises ValueError)
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, payload, keep_alive: bool):
+        data = json.dumps(payload).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+        )
+        await writer.drain()
+
+
+async def serve(args):
+    words = load_words(args.words)
+    # Verdicts go to the bounded (LRU-evicted) on-disk cache the game uses
+    cache = MeaningCache(args.cache)
+    validator = WordValidator(set(words), cache=cache, use_api=not args.offline)
+    server = WordleServer(words, validator, idle_timeout=args.idle_timeout)
+    port = await server.start(args.host, args.port)
+    print(f"Wordle server on http://{args.host}:{port} ({len(words)} words)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+        cache.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-session Wordle server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--words", default="WordList.txt")
+    parser.add_argument("--cache", default="meaning_cache.sqlite3", help="dictionary verdict cache (SQLite)")
+    parser.add_argument("--idle-timeout", type=float, default=600.0, help="seconds before an idle session is dropped")
+    parser.add_argument("--offline", action="store_true", help="validate against the local word list only")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+from GameEngine import GameEngine
+from WordList import load_words, choose_random_word
+
+# Headless batch simulator: plays N games with a guessing strategy,
+# spread over a process pool, and prints a JSON report.
+#
+# A strategy is a factory: make(words) -> guess(history, rng) -> str,
+# where history is a list of (guess, colors). Register new ones in
+# STRATEGIES or pass --strategy module:function.
+
+# ---------------- Strategies ----------------
+def random_candidate(words):
+    # Guess a random word that is still consistent with the feedback
+    from ConstraintIndex import ConstraintIndex
+    index = ConstraintIndex(words)
+
+    def guess(history, rng):
+        tracker = index.tracker()
+        for g, colors in history:
+            tracker.apply(g, colors)
+        pool = tracker.words() or words
+        return rng.choice(pool)
+    return guess
+
+def first_candidate(words):
+    # Deterministic: the first consistent word in list order
+    from ConstraintIndex import ConstraintIndex
+    index = ConstraintIndex(words)
+
+    def guess(history, rng):
+        tracker = index.tracker()
+        for g, colors in history:
+            tracker.apply(g, colors)
+        pool = tracker.words()
+        return pool[0] if pool else words[0]
+    return guess
+
+def entropy_solver(words):
+    from Solver import Solver
+    solver = Solver(words)
+
+    def guess(history, rng):
+        return solver.hint(history, budget_ms=float("inf"))
+    return guess
+
+STRATEGIES = {
+    "random": random_candidate,
+    "first": first_candidate,
+    "solver": entropy_solver,
+}
+
+def resolve_strategy(name: str):
+    if name in STRATEGIES:
+        return STRATEGIES[name]
+    module, _, func = name.partition(":")
+    if not func:
+        raise ValueError(f"Unknown strategy: {name} (use one of {', '.join(STRATEGIES)} or module:function)")
+    return getattr(importlib.import_module(module), func)
+
+
+# ---------------- Playing ----------------
+def play_game(answer: str, guesser, rng: random.Random, max_attempts: int = 6) -> int:
+    # Number of guesses used on a win, 0 on a loss
+    engine = GameEngine(answer, max_attempts, len(answer))
+    history = []
+    while not engine.finished:
+        guess = guesser(history, rng)
+        history.append((guess, engine.apply_guess(guess)))
+    return len(history) if engine.outcome == "victory" else 0
+
+# Per-process state, built once by the pool initializer
+_words = None
+_guesser = None
+
+def _init_worker(words_path: str, strategy: str):
+    global _words, _guesser
+    _words = load_words(words_path)
+    _guesser = resolve_strategy(strategy)(_words)
+
+def _play_chunk(args):
+    seed, count, max_attempts = args
+    random.seed(seed)               # answers come from choose_random_word
+    rng = random.Random(seed ^ 0x5EED)
+    return [play_game(choose_random_word(_words), _guesser, rng, max_attempts) for _ in range(count)]
+
+def simulate(words_path: str, games: int, strategy: str = "random", processes=None,
+             seed: int = 0, max_attempts: int = 6, chunk: int = 50) -> dict:
+    processes = processes or os.cpu_count() or 1
+    jobs = [(seed * 1_000_003 + i, min(chunk, games - start), max_attempts)
+            for i, start in enumerate(range(0, games, chunk))]
+
+    t0 = time.perf_counter()
+    if processes > 1 and len(jobs) > 1:
+        with multiprocessing.Pool(processes, initializer=_init_worker, initargs=(words_path, strategy)) as pool:
+            results = [r for part in pool.imap(_play_chunk, jobs) for r in part]
+    else:
+        _init_worker(words_path, strategy)
+        results = [r for job in jobs for r in _play_chunk(job)]
+    elapsed = time.perf_counter() - t0
+
+    dist = {str(i): 0 for i in range(1, max_attempts + 1)}
+    dist["X"] = 0
+    for r in results:
+        dist[str(r) if r else "X"] += 1
+    wins = len(results) - dist["X"]
+
+    return {
+        "strategy": strategy,
+        "games": len(results),
+        "processes": processes,
+        "seed": seed,
+        "elapsed_sec": round(elapsed, 3),
+        "games_per_sec": round(len(results) / elapsed, 1) if elapsed else None,
+        "win_rate": round(wins / len(results), 4) if results else 0.0,
+        "mean_guesses": round(sum(r for r in results if r) / wins, 3) if wins else None,
+        "distribution": dist,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Play Wordle games headlessly and report stats as JSON")
+    parser.add_argument("-n", "--games", type=int, default=1000)
+    parser.add_argument("-s", "--strategy", default="random", help=f"{', '.join(STRATEGIES)} or module:function")
+    parser.add_argument("-j", "--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--words", default="WordList.txt")
+    parser.add_argument("--max-attempts", type=int, default=6)
+    parser.add_argument("-o", "--output", help="also write the report to this file")
+    args = parser.parse_args()
+
+    try:
+        resolve_strategy(args.strategy)
+    except (ValueError, ImportError, AttributeError) as e:
+        parser.error(str(e))
+
+    report = simulate(args.words, args.games, args.strategy, args.processes, args.seed, args.max_attempts)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+import argparse
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+from Feedback import FeedbackMatrix, all_green, encode
+from WordList import load_words
+
+METRICS = ("entropy", "remaining")
+
+# ---------------- Scoring ----------------
+def score_block(patterns: np.ndarray, npatterns: int, metric: str = "entropy") -> np.ndarray:
+    """
+    patterns: (guesses, candidates) packed feedback.
+    entropy   -> expected information gain in bits (higher is better)
+    remaining -> expected number of candidates left (lower is better)
+    """
+    g, m = patterns.shape
+    if g == 0 or m == 0:
+        return np.zeros(g)
+    offsets = (np.arange(g, dtype=np.int64) * npatterns)[:, None]
+    counts = np.bincount((patterns + offsets).ravel(), minlength=g * npatterns)
+    counts = counts.reshape(g, npatterns).astype(np.float64)
+    if metric == "remaining":
+        return (counts * counts).sum(axis=1) / m
+    p = counts / m
+    with np.errstate(divide="ignore", invalid="ignore"):
+        logs = np.where(p > 0, np.log2(p), 0.0)
+    return -(p * logs).sum(axis=1)
+
+# Worker side of the opening pool: the matrix is memory-mapped once per process
+_worker_matrix = None
+
+def _init_worker(matrix_path, matrix):
+    global _worker_matrix
+    _worker_matrix = np.load(matrix_path, mmap_mode="r") if matrix_path else matrix
+
+def _score_rows(args):
+    start, stop, npatterns, metric = args
+    return start, score_block(np.asarray(_worker_matrix[start:stop]), npatterns, metric)
+
+
+class Solver:
+    """
+    Best-next-guess engine over a word list.
+    Ranks guesses by expected information gain ("entropy") or expected
+    candidates left ("remaining"), using the packed feedback matrix.
+    Opening scores are computed on a process pool and cached on disk.
+    """
+
+    def __init__(self, words, cache_dir="cache", metric: str = "entropy", matrix=None):
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        self.metric = metric
+        self.cache_dir = cache_dir
+        self.fm = matrix if matrix is not None else FeedbackMatrix(words, cache_dir)
+        self.words = self.fm.words
+        self.npatterns = 3 ** self.fm.length
+        self.win_pattern = all_green(self.fm.length)
+        self._opening = None
+
+    # ---------------- Candidates ----------------
+    def candidates(self, history=()) -> np.ndarray:
+        """
+        history: iterable of (guess, colors) where colors is a list of
+        "gray"/"yellow"/"green" or an already packed pattern.
+        Returns indices of the words consistent with every entry.
+        """
+        alive = np.arange(len(self.words))
+        for guess, colors in history:
+            code = colors if isinstance(colors, (int, np.integer)) else encode(colors)
+            gi = self.fm.index.get(guess)
+            if gi is not None:
+                row = self.fm.matrix[gi, alive]
+            else:
+                row = self.fm.evaluate_many(guess, [self.words[i] for i in alive])
+            alive = alive[row == code]
+        return alive
+
+    def _order(self, scores: np.ndarray) -> np.ndarray:
+        return np.argsort(-scores if self.metric == "entropy" else scores, kind="stable")
+
+    # ---------------- Opening ----------------
+    def opening_scores(self, processes=None) -> np.ndarray:
+        # O(n^2): every guess against every answer, spread over all cores
+        if self._opening is not None:
+            return self._opening
+
+        path = None
+        if self.cache_dir:
+            path = os.path.join(self.cache_dir, f"opening_{self.fm.key}_{self.metric}.npy")
+            if os.path.exists(path):
+                scores = np.load(path)
+                if len(scores) == len(self.words):
+                    self._opening = scores
+                    return scores
+
+        n = len(self.words)
+        processes = processes or os.cpu_count() or 1
+        step = max(1, -(-n // (processes * 4)))
+        jobs = [(s, min(s + step, n), self.npatterns, self.metric) for s in range(0, n, step)]
+        scores = np.empty(n)
+
+        matrix_path = str(self.fm.path) if self.fm.path is not None and self.fm.path.exists() else None
+        if processes > 1 and len(jobs) > 1:
+            init_args = (matrix_path, None if matrix_path else np.asarray(self.fm.matrix))
+            with multiprocessing.Pool(processes, initializer=_init_worker, initargs=init_args) as pool:
+                for start, part in pool.imap_unordered(_score_rows, jobs):
+                    scores[start:start + len(part)] = part
+        else:
+            full = np.asarray(self.fm.matrix)
+            for start, stop, npat, metric in jobs:
+                scores[start:stop] = score_block(full[start:stop], npat, metric)
+
+        if path:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                np.save(path, scores)
+            except OSError:
+                pass
+        self._opening = scores
+        return scores
+
+    # ---------------- Ranking ----------------
+    def best_guesses(self, history=(), k: int = 5, budget_ms: float = 80.0, chunk: int = 256):
+        """
+        Top-k (word, score) for the next guess.
+        Candidates are scored first, then the rest of the list in chunks
+        until budget_ms runs out; the best seen so far is returned.
+        """
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        history = list(history)
+
+        if not history:
+            scores = self.opening_scores()
+            order = self._order(scores)[:k]
+            return [(self.words[i], float(scores[i])) for i in order]
+
+        alive = self.candidates(history)
+        if len(alive) <= 2:
+            # Any candidate is as good as it gets
+            return [(self.words[i], 0.0) for i in alive[:k]]
+
+        is_alive = np.zeros(len(self.words), dtype=bool)
+        is_alive[alive] = True
+        pool = np.concatenate([alive, np.flatnonzero(~is_alive)])
+
+        scored_idx, scored = [], []
+        for start in range(0, len(pool), chunk):
+            idx = pool[start:start + chunk]
+            block = self.fm.block(idx, alive)
+            s = score_block(block, self.npatterns, self.metric)
+            scored_idx.append(idx)
+            scored.append(s)
+            if time.perf_counter() >= deadline:
+                break
+
+        idx = np.concatenate(scored_idx)
+        s = np.concatenate(scored)
+        # Prefer guesses that could still be the answer on ties
+        bonus = is_alive[idx] * 1e-9
+        order = self._order(s + bonus if self.metric == "entropy" else s - bonus)[:k]
+        return [(self.words[idx[i]], float(s[i])) for i in order]
+
+    def hint(self, history=(), budget_ms: float = 80.0) -> str:
+        best = self.best_guesses(history, k=1, budget_ms=budget_ms)
+        return best[0][0] if best else ""
+
+
+# History on the command line: WORD:PATTERN with g = green, y = yellow, x = gray
+def _parse_history(items):
+    names = {"g": "green", "y": "yellow", "x": "gray"}
+    history = []
+    for item in items:
+        word, pat = item.split(":")
+        history.append((word.upper(), [names[c] for c in pat.lower()]))
+    return history
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank next Wordle guesses")
+    parser.add_argument("history", nargs="*", help="guesses so far, e.g. CRANE:xgyxx")
+    parser.add_argument("--words", default="WordList.txt")
+    parser.add_argument("--metric", choices=METRICS, default="entropy")
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=80.0)
+    args = parser.parse_args()
+
+    solver = Solver(load_words(args.words), metric=args.metric)
+    history = _parse_history(args.history)
+    t0 = time.perf_counter()
+    best = solver.best_guesses(history, k=args.k, budget_ms=args.budget_ms)
+    elapsed = (time.perf_counter() - t0) * 1000
+    print(f"{len(solver.candidates(history))} candidates, ranked in {elapsed:.1f} ms")
+    for word, score in best:
+        print(f"  {word}  {score:.4f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import os
+import struct
+from pathlib import Path
+from typing import Optional
+
+# Player statistics: an append-only log of finished rounds plus running
+# totals, so nothing ever rescans the history.
+#
+# File layout (little-endian):
+#   header   magic "WSTA", version
+#   snapshot played, wins, current streak, max streak (u64 each) and the
+#            winning guess distribution (DIST_SLOTS x u32; last slot = more)
+#   records  answer index (u32), length (u8), boards (u8), guesses (u8),
+#            outcome (u8: 1 win, 0 loss), duration in ms (u32)
+#
+# Loading reads the snapshot and folds in the records after it. Every
+# COMPACT_EVERY rounds the totals are written back as a fresh snapshot
+# and the records dropped, so the file stays under ~COMPACT_EVERY * 12
+# bytes however many rounds a kiosk plays.
+HEADER = struct.Struct("<4sH")
+MAGIC = b"WSTA"
+VERSION = 1
+DIST_SLOTS = 16
+SNAPSHOT = struct.Struct(f"<4Q{DIST_SLOTS}I")
+RECORD = struct.Struct("<IBBBBI")
+
+COMPACT_EVERY = 10_000
+
+
+class Stats:
+    """Running totals over every finished round; O(1) to read and to update."""
+
+    def __init__(self, path: Optional[str] = "stats.bin", compact_every: int = COMPACT_EVERY):
+        # path None: keep totals in memory only (e.g. while replaying)
+        self.path = Path(path) if path else None
+        self.compact_every = compact_every
+        self.played = 0
+        self.wins = 0
+        self.streak = 0
+        self.max_streak = 0
+        self.dist = [0] * DIST_SLOTS
+        self.pending = 0        # records after the snapshot
+        self._file = None
+        if self.path is not None:
+            self._load()
+
+    # ---------------- Aggregates ----------------
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.played if self.played else 0.0
+
+    def _fold(self, guesses: int, won: bool):
+        self.played += 1
+        if won:
+            self.wins += 1
+            self.streak += 1
+            self.max_streak = max(self.max_streak, self.streak)
+            self.dist[min(max(guesses, 1), DIST_SLOTS) - 1] += 1
+        else:
+            self.streak = 0
+
+    def summary(self) -> dict:
+        return {
+            "played": self.played,
+            "win_rate": round(self.win_rate, 4),
+            "streak": self.streak,
+            "max_streak": self.max_streak,
+            "distribution": {i + 1: n for i, n in enumerate(self.dist) if n},
+        }
+
+    # ---------------- Log ----------------
+    def record(self, answer_index: int, length: int, boards: int, guesses: int,
+               won: bool, duration: float):
+        self._fold(guesses, won)
+        if self.path is None:
+            return
+        try:
+            if self._file is None:
+                self._file = open(self.path, "ab")
+            self._file.write(RECORD.pack(max(answer_index, 0) & 0xFFFFFFFF, length, boards,
+                                         min(guesses, 255), int(won),
+                                         min(int(duration * 1000), 0xFFFFFFFF)))
+            self._file.flush()
+            self.pending += 1
+            if self.pending >= self.compact_every:
+                self.compact()
+        except OSError:
+            # Read-only install or full disk: keep counting in memory
+            try:
+                self.close()
+            except OSError:
+                pass    # the handle is closed all the same
+            self.path = None
+
+    def _load(self):
+        try:
+            data = self.path.read_bytes()
+        except FileNotFoundError:
+            data = b""
+        except OSError:
+            self.path = None
+            return
+
+        start = HEADER.size + SNAPSHOT.size
+        ok = len(data) >= start
+        if ok:
+            magic, version = HEADER.unpack_from(data, 0)
+            ok = magic == MAGIC and version == VERSION
+        if not ok:
+            if data:
+                # Not ours (or another version): keep it as stats.bin.bak
+                # instead of overwriting it, then start afresh
+                try:
+                    os.replace(self.path, self.path.with_suffix(self.path.suffix + ".bak"))
+                except OSError:
+                    self.path = None    # can't move it aside: count in memory only
+                    return
+            self._write_snapshot()
+            return
+
+        self.played, self.wins, self.streak, self.max_streak, *dist = SNAPSHOT.unpack_from(data, HEADER.size)
+        self.dist = list(dist)
+
+        # Records after the snapshot (a torn last record is dropped)
+        usable = start + (len(data) - start) // RECORD.size * RECORD.size
+        for _, _, _, guesses, won, _ in RECORD.iter_unpack(data[start:usable]):
+            self._fold(guesses, bool(won))
+            self.pending += 1
+        if usable != len(data) or self.pending >= self.compact_every:
+            self.compact()
+
+    def _write_snapshot(self):
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        try:
+            with open(tmp, "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION))
+                f.write(SNAPSHOT.pack(self.played, self.wins, self.streak, self.max_streak, *self.dist))
+            os.replace(tmp, self.path)
+        except OSError:
+            self.path = None
+            return
+        self.pending = 0
+
+    def compact(self):
+        # Fold the records into a new snapshot; the per-round history goes
+        if self.path is None:
+            return
+        self.close()
+        self._write_snapshot()
+
+    def close(self):
+        if self._file is not None:
+            f, self._file = self._file, None
+            f.close()
+
@@ -0,0 +1,164 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Dictionary endpoint; {word} is replaced with the lower-case guess
+API_URL = "https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
+
+# Shared worker pool for network lookups (created on first use)
+_executor = None
+_executor_lock = threading.Lock()
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="wordle-validate")
+        return _executor
+
+# One pooled HTTP session shared by all lookups (keeps connections alive)
+_session = None
+_session_lock = threading.Lock()
+
+def _get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+# -------------- Check Meaning Word --------------
+def lookup_meaning(word: str, timeout: float = 3.5, url: str = API_URL, session=None):
+    """
+    True / False for a definitive answer from the dictionary endpoint,
+    None when the lookup failed (timeout, rate limit, server error) and
+    is worth retrying.
+    """
+    try:
+        session = session or _get_session()
+    except Exception:
+        return None
+    try:
+        r = session.get(url.format(word=word.lower()), timeout=timeout)
+        if r.status_code == 429 or r.status_code >= 500:
+            return None
+        if r.status_code != 200:
+            return False
+        data = r.json()
+        if not isinstance(data, list) or not data:
+            return False
+        meanings = data[0].get("meanings", [])
+        return bool(meanings)
+    except Exception:
+        return None
+
+def singular_candidates(w: str) -> list[str]:
+    # Return possible singular bases for a plural word
+    w = w.lower()
+    cands = set()
+
+    if w.endswith("ies") and len(w) > 3:
+        cands.add(w[:-3] + "y")
+
+    if w.endswith("es"):
+        if w[:-2].endswith(("ch", "sh")) or w[-3] in "sxz":
+            cands.add(w[:-2])
+
+    if w.endswith("s") and not w.endswith("ss"):
+        cands.add(w[:-1])
+
+    if w.endswith("ves") and len(w) > 3:
+        cands.add(w[:-3] + "f")
+        cands.add(w[:-3] + "fe")
+
+    return [c.upper() for c in cands if c]
+
+
+class WordValidator:
+    """
+    Validate guesses off the render thread.
+    check() answers from the local list / precomputed plurals / cache
+    right away when it can;
+    otherwise the word and its singular bases are looked up concurrently
+    and the first positive answer wins (queued lookups are cancelled).
+    """
+
+    def __init__(self, words_set=None, cache=None, use_api=True,
+                 url: str = API_URL, timeout: float = 3.5, inflections=None):
+        self.words_set = words_set if words_set is not None else set()
+        self.cache = cache if cache is not None else {}
+        self.inflections = inflections if inflections is not None else {}  # form -> base
+        self.use_api = use_api
+        self.url = url
+        self.timeout = timeout
+        self._lock = threading.Lock()
+
+    def _lookup(self, word: str) -> bool:
+        ok = lookup_meaning(word, self.timeout, self.url)
+        if ok is None:
+            # Failed lookup (offline, timeout, 429 / 5xx): reject this
+            # attempt but cache nothing, so the word is asked again later
+            return False
+        with self._lock:
+            self.cache[word] = ok
+        return ok
+
+    def check(self, word: str) -> Future:
+        result = Future()
+
+        # Precomputed plurals of known words (see Morphology.py)
+        if word in self.inflections:
+            result.set_result(True)
+            return result
+
+        words = [word] + singular_candidates(word)
+
+        # Local list / cached verdicts first
+        pending = []
+        for w in words:
+            if self.words_set and w in self.words_set:
+                result.set_result(True)
+                return result
+            with self._lock:
+                ok = self.cache.get(w)
+            if ok:
+                result.set_result(True)
+                return result
+            if ok is None:
+                pending.append(w)
+
+        if not pending or not self.use_api:
+            result.set_result(False)
+            return result
+
+        # Network lookups, first success wins
+        executor = _get_executor()
+        futures = []
+        state = {"left": len(pending), "done": False}
+
+        def on_done(f: Future):
+            ok = not f.cancelled() and f.exception() is None and f.result()
+            with self._lock:
+                state["left"] -= 1
+                if state["done"] or not (ok or state["left"] == 0):
+                    return
+                state["done"] = True
+            if ok:
+                for other in futures:
+                    other.cancel()
+            if not result.done():
+                result.set_result(bool(ok))
+
+        for w in pending:
+            futures.append(executor.submit(self._lookup, w))
+        for f in futures:
+            f.add_done_callback(on_done)
+        return result
+
+    # Blocking variant for callers that are not on the UI thread
+    def is_valid(self, word: str) -> bool:
+        return self.check(word).result()
@@ -0,0 +1,194 @@
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from MeaningCache import MeaningCache
+from Validator import API_URL, lookup_meaning
+
+# Bulk dictionary warm-up: validates a candidate list against the
+# dictionary endpoint over one pooled session, with bounded concurrency,
+# a request rate limit and retry with backoff. Verdicts go into the
+# MeaningCache store the game opens at startup, and every finished word
+# is appended to a checkpoint file so a crashed run resumes where it
+# stopped.
+#
+# Checkpoint format: one "WORD 1" / "WORD 0" line per definitive verdict.
+
+DEFAULT_CHECKPOINT = "warmup.checkpoint"
+
+# ---------------- Candidates ----------------
+def read_candidates(paths, length: int = 5, corpus: bool = False) -> list[str]:
+    """
+    Unique upper-case candidates in first-seen order.
+    Word lists are read one word per line; with corpus=True every
+    alphabetic token of the right length in free text is a candidate.
+    """
+    token = re.compile(rf"\b[A-Za-z]{{{length}}}\b")
+    seen = {}
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            for line in f:
+                if corpus:
+                    words = token.findall(line)
+                else:
+                    words = [line.strip()]
+                for w in words:
+                    if len(w) == length and w.isalpha() and w.isascii():
+                        seen.setdefault(w.upper(), None)
+    return list(seen)
+
+# ---------------- Checkpoint ----------------
+def load_checkpoint(path) -> dict[str, bool]:
+    done = {}
+    path = Path(path)
+    if not path.exists():
+        return done
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            # A torn last line from a crash is simply redone
+            if len(parts) == 2 and parts[1] in ("0", "1"):
+                done[parts[0]] = parts[1] == "1"
+    return done
+
+
+class RateLimiter:
+    """Thread-safe pacing: at most `rate` acquisitions per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def make_session(concurrency: int):
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def check_word(word: str, session, url: str, limiter: RateLimiter, timeout: float,
+               retries: int, backoff: float):
+    # Definitive verdict, or None once retries are exhausted
+    for attempt in range(retries + 1):
+        limiter.acquire()
+        ok = lookup_meaning(word, timeout, url, session)
+        if ok is not None:
+            return ok
+        if attempt < retries:
+            # Exponential backoff with jitter so workers do not retry in lockstep
+            time.sleep(backoff * (2 ** attempt) * (0.5 + random.random()))
+    return None
+
+
+def warm_up(candidates, cache: MeaningCache, checkpoint=DEFAULT_CHECKPOINT, url: str = API_URL,
+            concurrency: int = 8, rate: float = 20.0, timeout: float = 5.0,
+            retries: int = 4, backoff: float = 0.5, batch: int = 200, session=None) -> dict:
+    done = load_checkpoint(checkpoint)
+    # Verdicts checkpointed by a previous run may not have reached the store;
+    # ones that did keep their age (re-stamping would extend their TTL)
+    cache.set_many(done.items(), replace=False)
+    todo = [w for w in candidates if w not in done]
+
+    session = session or make_session(concurrency)
+    limiter = RateLimiter(rate)
+    stats = {"candidates": len(candidates), "resumed": len(candidates) - len(todo),
+             "checked": 0, "positive": 0, "negative": 0, "failed": 0}
+    pending = []
+
+    # At most `window` words in flight, so a corpus-sized list never turns
+    # into that many futures at once
+    window = 2 * concurrency
+    words = iter(todo)
+    t0 = time.perf_counter()
+    with open(checkpoint, "a", encoding="utf-8") as log, \
+            ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="wordle-warmup") as pool:
+        futures = {}
+        try:
+            while True:
+                for w in words:
+                    futures[pool.submit(check_word, w, session, url, limiter, timeout, retries, backoff)] = w
+                    if len(futures) >= window:
+                        break
+                if not futures:
+                    break
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    word, ok = futures.pop(fut), fut.result()
+                    if ok is None:
+                        stats["failed"] += 1
+                        continue
+                    stats["checked"] += 1
+                    stats["positive" if ok else "negative"] += 1
+                    log.write(f"{word} {int(ok)}\n")
+                    pending.append((word, ok))
+                    if len(pending) >= batch:
+                        log.flush()
+                        cache.set_many(pending)
+                        pending.clear()
+        except KeyboardInterrupt:
+            for f in futures:
+                f.cancel()
+            raise
+        finally:
+            log.flush()
+            cache.set_many(pending)
+    elapsed = time.perf_counter() - t0
+
+    stats["elapsed_sec"] = round(elapsed, 3)
+    stats["words_per_sec"] = round(len(todo) / elapsed, 1) if elapsed else None
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate candidate words in bulk and store the verdicts for the game")
+    parser.add_argument("candidates", nargs="+", help="candidate files (one word per line, or text with --corpus)")
+    parser.add_argument("--corpus", action="store_true", help="extract every word of --length from free text")
+    parser.add_argument("--length", type=int, default=5)
+    parser.add_argument("--url", default=API_URL, help="endpoint template with {word} (e.g. a local stub server)")
+    parser.add_argument("--cache", default="meaning_cache.sqlite3", help="verdict store read by the game")
+    parser.add_argument("--max-entries", type=int, default=None, help="cache size cap, kept in the store (default: grow to fit every candidate)")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT)
+    parser.add_argument("-c", "--concurrency", type=int, default=8, help="requests in flight")
+    parser.add_argument("--rate", type=float, default=20.0, help="max requests per second (0 = unlimited)")
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--retries", type=int, default=4)
+    parser.add_argument("--backoff", type=float, default=0.5, help="first retry delay in seconds, doubled each time")
+    args = parser.parse_args()
+
+    if "{word}" not in args.url:
+        parser.error("--url must contain {word}")
+
+    candidates = read_candidates(args.candidates, args.length, args.corpus)
+    cache = MeaningCache(args.cache)
+    # The cap is stored with the verdicts, so the game keeps it when it reopens the store
+    cache.resize(args.max_entries or max(cache.max_entries, 2 * len(candidates)))
+    try:
+        report = warm_up(candidates, cache, args.checkpoint, args.url, args.concurrency,
+                         args.rate, args.timeout, args.retries, args.backoff)
+    finally:
+        cache.close()
+    report["cache"] = args.cache
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+import bisect
+import mmap
+import os
+import struct
+import time
+import zlib
+from array import array
+from pathlib import Path
+
+from WordList import load_words
+
+# Compiled word list: a small header followed by every word packed into
+# one integer (5 bits per letter, first letter most significant), sorted
+# so membership is a binary search over the memory-mapped file.
+#
+# Header (native byte order; a foreign file fails the version check):
+#   magic "WIDX", version, word length, count, payload crc32,
+#   source size, source mtime_ns
+HEADER = struct.Struct("=4sHHIIQQ")
+MAGIC = b"WIDX"
+VERSION = 1
+
+def pack_word(word: str) -> int:
+    v = 0
+    for ch in word:
+        v = (v << 5) | (ord(ch) - 64)
+    return v
+
+def unpack_word(v: int, length: int) -> str:
+    out = []
+    for _ in range(length):
+        out.append(chr(64 + (v & 31)))
+        v >>= 5
+    return "".join(reversed(out))
+
+# 'I' fits up to 6 letters (30 bits), 'Q' up to 12
+def typecode_for(length: int) -> str:
+    return "I" if length * 5 <= 32 else "Q"
+
+# One shard per word length: WordList.txt -> WordList.5.idx, WordList.6.idx, ...
+def index_path_for(text_path, length: int = 5) -> Path:
+    return Path(text_path).with_suffix(f".{length}.idx")
+
+# Compile a text word list into the binary index format
+def compile_index(text_path, out_path=None, length: int = 5) -> Path:
+    text_path = Path(text_path)
+    out_path = Path(out_path) if out_path else index_path_for(text_path, length)
+
+    st = text_path.stat()
+    values = sorted({pack_word(w) for w in load_words(text_path, length)})
+    payload = array(typecode_for(length), values).tobytes()
+    header = HEADER.pack(MAGIC, VERSION, length, len(values), zlib.crc32(payload),
+                         st.st_size, st.st_mtime_ns)
+
+    tmp = out_path.with_suffix(out_path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(payload)
+    os.replace(tmp, out_path)
+    return out_path
+
+
+class WordIndex:
+    """
+    Memory-mapped view of a compiled word list.
+    Acts as a Sequence[str]: `word in index` is O(log n) with no
+    per-word Python objects; index[i] decodes one word on demand.
+    The file itself is read-only; edit() layers words added / removed
+    since it was compiled on top of it (see WordShards.reload).
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file cannot be mapped
+            self._file.close()
+            raise ValueError(f"Index {self.path} is empty")
+
+        magic, version, self.length, self.count, self.crc, self.source_size, self.source_mtime_ns = \
+            HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Index {self.path} has an unknown format")
+
+        self.typecode = typecode_for(self.length)
+        self._view = memoryview(self._mm)[HEADER.size:].cast(self.typecode)
+        if len(self._view) != self.count:
+            self.close()
+            raise ValueError(f"Index {self.path} is truncated")
+
+        # Edits: packed words added (sorted) and file positions removed
+        # (sorted). Added words follow the file's words in sequence order
+        self._added: list[int] = []
+        self._holes: list[int] = []
+
+    # Load text_path through its compiled index, rebuilding it when stale
+    @classmethod
+    def load(cls, text_path="WordList.txt", index_path=None, length: int = 5) -> "WordIndex":
+        text_path = Path(text_path)
+        if not text_path.exists():
+            raise FileNotFoundError(f"File not found: {text_path}")
+        index_path = Path(index_path) if index_path else index_path_for(text_path, length)
+
+        st = text_path.stat()
+        if index_path.exists():
+            try:
+                idx = cls(index_path)
+                if idx.is_current(st) and idx.length == length:
+                    return idx
+                idx.close()
+            except (OSError, ValueError):
+                pass
+
+        try:
+            compile_index(text_path, index_path, length)
+        except OSError:
+            # Read-only install: compile into the temp directory instead
+            import tempfile
+            index_path = Path(tempfile.gettempdir()) / f"{text_path.stem}.{length}.idx"
+            compile_index(text_path, index_path, length)
+        return cls(index_path)
+
+    def is_current(self, st=None) -> bool:
+        # Header matches the source file and the payload checksum holds
+        if st is not None and (st.st_size != self.source_size or st.st_mtime_ns != self.source_mtime_ns):
+            return False
+        return zlib.crc32(self._view) == self.crc
+
+    # ---------------- Sequence ----------------
+    def __len__(self) -> int:
+        return self.count - len(self._holes) + len(self._added)
+
+    def _position(self, i: int) -> int:
+        # File position of the i-th word still present (skip the holes before it)
+        for h in self._holes:
+            if h > i:
+                break
+            i += 1
+        return i
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            if not self.edited:
+                return [unpack_word(v, self.length) for v in self._view[i]]
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        kept = self.count - len(self._holes)
+        if not 0 <= i < kept + len(self._added):
+            raise IndexError("word index out of range")
+        if i >= kept:
+            return unpack_word(self._added[i - kept], self.length)
+        return unpack_word(self._view[self._position(i) if self._holes else i], self.length)
+
+    def __iter__(self):
+        length = self.length
+        if not self.edited:
+            for v in self._view:
+                yield unpack_word(v, length)
+            return
+        holes = set(self._holes)
+        for i, v in enumerate(self._view):
+            if i not in holes:
+                yield unpack_word(v, length)
+        for v in self._added:
+            yield unpack_word(v, length)
+
+    def _find(self, key: int) -> tuple[int, bool]:
+        # (file position, present in the file) for a packed word
+        i = bisect.bisect_left(self._view, key)
+        return i, i < self.count and self._view[i] == key
+
+    def __contains__(self, word) -> bool:
+        if not isinstance(word, str) or len(word) != self.length or not word.isalpha() or not word.isascii():
+            return False
+        key = pack_word(word.upper())
+        i, found = self._find(key)
+        if found:
+            return not self._holes or not _sorted_has(self._holes, i)
+        return bool(self._added) and _sorted_has(self._added, key)
+
+    def index_of(self, word: str) -> int:
+        # Stable id: file position, or past the end for an added word
+        key = pack_word(word)
+        i, found = self._find(key)
+        if found and not _sorted_has(self._holes, i):
+            return i
+        if _sorted_has(self._added, key):
+            return self.count + bisect.bisect_left(self._added, key)
+        raise ValueError(f"{word} is not in the index")
+
+    # ---------------- Edits ----------------
+    @property
+    def edited(self) -> bool:
+        return bool(self._added or self._holes)
+
+    def edit(self, added=(), removed=()) -> tuple[list[str], list[str]]:
+        """
+        Add / remove words in place, O(log n + edits) per word; the
+        compiled file is left alone. Returns the words that actually
+        changed (added, removed).
+        """
+        done_added, done_removed = [], []
+        for w in removed:
+            key = pack_word(w)
+            i, found = self._find(key)
+            if found and not _sorted_has(self._holes, i):
+                bisect.insort(self._holes, i)
+            elif _sorted_has(self._added, key):
+                self._added.remove(key)
+            else:
+                continue
+            done_removed.append(w)
+        for w in added:
+            key = pack_word(w)
+            i, found = self._find(key)
+            if found and _sorted_has(self._holes, i):
+                self._holes.remove(i)
+            elif not found and not _sorted_has(self._added, key):
+                bisect.insort(self._added, key)
+            else:
+                continue
+            done_added.append(w)
+        return done_added, done_removed
+
+    def close(self):
+        if getattr(self, "_view", None) is not None:
+            self._view.release()
+            self._view = None
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+
+def _sorted_has(items: list, x) -> bool:
+    i = bisect.bisect_left(items, x)
+    return i < len(items) and items[i] == x
+
+
+# Playable word lengths
+MIN_LENGTH, MAX_LENGTH = 4, 8
+
+
+class WordShards:
+    """
+    Per-length shards of one text word list. A shard is compiled and
+    memory-mapped the first time its length is asked for, so lengths
+    nobody plays cost nothing at startup.
+    """
+
+    def __init__(self, text_path="WordList.txt", lengths=range(MIN_LENGTH, MAX_LENGTH + 1)):
+        self.text_path = Path(text_path)
+        self.lengths = tuple(lengths)
+        self._shards: dict[int, WordIndex] = {}
+        self._source = self._stat()
+        # Words the text file dropped that reload() was asked to keep
+        self.held: set[str] = set()
+        # For reload(): every word of the loaded lengths, as last seen
+        self._known: set[str] = set()
+        self._known_lengths: set[int] = set()
+
+    def get(self, length: int) -> WordIndex:
+        # ValueError when the length is unsupported or has no words
+        shard = self._shards.get(length)
+        if shard is None:
+            if length not in self.lengths:
+                raise ValueError(f"Word length must be {self.lengths[0]}-{self.lengths[-1]}")
+            shard = self._shards[length] = WordIndex.load(self.text_path, length=length)
+        return shard
+
+    def __getitem__(self, length: int) -> WordIndex:
+        return self.get(length)
+
+    @property
+    def loaded(self) -> list[int]:
+        return sorted(self._shards)
+
+    # ---------------- Live reload ----------------
+    def _stat(self):
+        try:
+            st = self.text_path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    # One stat() call: has the text file been touched since the last (re)load?
+    def changed(self) -> bool:
+        return self._stat() != self._source
+
+    def reload(self, keep=()) -> dict[int, tuple[list[str], list[str]]]:
+        """
+        Bring the loaded shards in line with the text file, in place:
+        {length: (added, removed)} for every shard that changed. The file
+        is read and set-compared once (in C); words are only parsed and
+        packed where it differs, and each shard is edited by the
+        difference instead of recompiled. Words in keep are not removed
+        yet (they stay in self.held until a later reload without them).
+        Shards not loaded so far simply compile from the new file later.
+        """
+        source = self._stat()
+        try:
+            text = self.text_path.read_text(encoding="utf-8")
+        except OSError:
+            return {}   # mid-replace or gone: keep what we have, retry on the next change
+        self._source = source
+
+        # Words the loaded shards hold (filled once per shard, then kept in step)
+        for length, shard in self._shards.items():
+            if length not in self._known_lengths:
+                self._known.update(shard)
+                self._known_lengths.add(length)
+        fresh = {w for w in map(str.strip, text.upper().splitlines()) if len(w) in self._known_lengths}
+
+        edits = {}
+        for w in fresh - self._known:
+            if w.isalpha() and w.isascii():
+                edits.setdefault(len(w), ([], []))[0].append(w)
+        for w in self._known - fresh:
+            edits.setdefault(len(w), ([], []))[1].append(w)
+
+        changes = {}
+        self.held = set()
+        for length, (added, removed) in edits.items():
+            shard = self._shards[length]
+            if len(removed) >= len(shard) + len(added):
+                continue    # no words of this length left (or a half-written file)
+            self.held.update(w for w in removed if w in keep)
+            added, removed = shard.edit(sorted(added), [w for w in removed if w not in keep])
+            self._known.update(added)
+            self._known.difference_update(removed)
+            if added or removed:
+                changes[length] = (added, removed)
+        return changes
+
+    def close(self):
+        for shard in self._shards.values():
+            shard.close()
+        self._shards.clear()
+
+
+def main():
+    import argparse     # CLI only: kept off the game's startup path
+
+    parser = argparse.ArgumentParser(description="Compile a word list into a memory-mapped binary index")
+    parser.add_argument("words", nargs="?", default="WordList.txt")
+    parser.add_argument("-o", "--output", help="index path (default: <words>.<length>.idx)")
+    parser.add_argument("--length", type=int, default=5)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    out = compile_index(args.words, args.output, args.length)
+    elapsed = (time.perf_counter() - t0) * 1000
+    idx = WordIndex(out)
+    print(f"{out}: {len(idx)} words, {out.stat().st_size} bytes, compiled in {elapsed:.1f} ms")
+    idx.close()
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 import random
 from pathlib import Path
 
-# Load valid 5-letter words from a text file.
-def load_words(path="WordList.txt"):
+# Load valid words of the given length (5 by default) from a text file.
+def load_words(path="WordList.txt", length=5):
     file_path = Path(path)
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
@@ -11,14 +11,16 @@ def load_words(path="WordList.txt"):
     with file_path.open("r", encoding="utf-8") as f:
         for line in f:
             word = line.strip().upper()
-            if len(word) == 5 and word.isalpha():
+            # A-Z only: feedback codes and packed indexes assume ASCII letters
+            if len(word) == length and word.isalpha() and word.isascii():
                 words.append(word)
 
     if not words:
         raise ValueError(f"File {path} does not contain valid words")
     return words
 
-# Select a random word from the given list of words.
-def choose_random_word(words):
-    return random.choice(words)
+# Select a random word from the given list of words
+# (from rng when given, e.g. a seeded random.Random).
+def choose_random_word(words, rng=None):
+    return (rng or random).choice(words)
 
@@ -0,0 +1,101 @@
+import http.server
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+# Benchmarks for the game's hot paths (pytest-benchmark), headless:
+#   python -m pytest benchmarks --benchmark-only
+#   ... --benchmark-save=base                  record a baseline (.benchmarks/)
+#   ... --benchmark-compare --benchmark-compare-fail=min:50%
+#                                              fail on a 50% slowdown of any of them
+# A plain `python -m pytest` runs them too; add --benchmark-skip to leave them out.
+
+# Run pygame without a real window or sound device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if GAME_DIR not in sys.path:
+    sys.path.insert(0, GAME_DIR)
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    # pip install -r requirements.txt; the other tests still run without it
+    collect_ignore_glob = ["test_*.py"]
+
+
+# The game opens WordList.txt and friends relative to its own folder
+@pytest.fixture(scope="session", autouse=True)
+def game_dir():
+    cwd = os.getcwd()
+    os.chdir(GAME_DIR)
+    yield GAME_DIR
+    os.chdir(cwd)
+
+@pytest.fixture(scope="session")
+def words(game_dir):
+    from WordList import load_words
+    return load_words("WordList.txt")
+
+# Headless App with a couple of guesses on the board
+@pytest.fixture
+def app(game_dir):
+    from App import App
+
+    app = App(stats_path=None)
+    app.new_game()
+    _play(app.current, ("CRANE", "SLOTH"))
+    return app
+
+# Type and submit guesses on a screen, validated against the list only
+def _play(screen, guesses):
+    screen.use_api_validate = False
+    for guess in guesses:
+        for ch in guess:
+            screen._push_char(ch)
+        screen._submit_guess()
+        screen.update()
+
+@pytest.fixture
+def play():
+    return _play
+
+# Local stand-in for the dictionary API: every word has a meaning
+@pytest.fixture
+def dictionary_url():
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = b'[{"meanings": [{"partOfSpeech": "noun"}]}]'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/{{word}}"
+    server.shutdown()
+    server.server_close()
+
+# Main.py --startup-report in a fresh interpreter (wall ms to exit, report, stderr)
+def _launch(*flags) -> tuple[float, dict, str]:
+    main = os.path.join(GAME_DIR, "Main.py")
+    t0 = time.perf_counter()
+    proc = subprocess.run([sys.executable, *flags, main, "--startup-report", "--seed", "0"],
+                          capture_output=True, text=True, check=True, cwd=GAME_DIR)
+    return (time.perf_counter() - t0) * 1000, json.loads(proc.stdout), proc.stderr
+
+@pytest.fixture
+def launch():
+    return _launch
@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from ConstraintIndex import ConstraintIndex
+from Feedback import evaluate_guess
+
+# Synthetic lists show how per-guess cost scales with list size.
+# The first guess is a few word-parallel bitset ANDs over the whole list;
+# later guesses only walk the survivors, so compare them against
+# survivors_after_first rather than the list size.
+SIZES = (None, 10_000, 100_000, 250_000)
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda n: f"{n}_words" if n else "bundled")
+def game(request, words):
+    rng = random.Random(0)
+    if request.param is None:
+        pool = words
+    else:
+        letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        pool = ["".join(rng.choice(letters) for _ in range(5)) for _ in range(request.param)]
+    index = ConstraintIndex(pool)
+    games = [(rng.choice(pool), [rng.choice(pool) for _ in range(5)]) for _ in range(50)]
+    feedback = [[(g, evaluate_guess(g, ans)) for g in guesses] for ans, guesses in games]
+    return pool, index, feedback
+
+def test_build(benchmark, game):
+    pool, _, _ = game
+    benchmark.pedantic(ConstraintIndex, (pool,), rounds=3)
+
+# First guess narrows the full bitset
+def test_first_guess(benchmark, game):
+    _, index, feedback = game
+
+    def first():
+        for fb in feedback:
+            index.tracker().apply(*fb[0])
+
+    benchmark.extra_info["guesses"] = len(feedback)
+    benchmark(first)
+
+# Later ones only touch the survivors
+def test_later_guesses(benchmark, game):
+    _, index, feedback = game
+
+    def setup():
+        trackers = [index.tracker() for _ in feedback]
+        for tracker, fb in zip(trackers, feedback):
+            tracker.apply(*fb[0])
+        benchmark.extra_info["survivors_after_first"] = sum(t.remaining for t in trackers) // len(feedback)
+        return (trackers,), {}
+
+    def later(trackers):
+        for tracker, fb in zip(trackers, feedback):
+            for g, colors in fb[1:]:
+                tracker.apply(g, colors)
+
+    benchmark.extra_info["guesses"] = len(feedback) * 4
+    benchmark.pedantic(later, setup=setup, rounds=5)
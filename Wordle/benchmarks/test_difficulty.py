@@ -0,0 +1,21 @@
+import random
+
+from Difficulty import DifficultySelector, score_answers
+
+
+# Score a slice with the cheap "first" player
+def test_score(benchmark, words):
+    sample = words[:200]
+    benchmark.extra_info["answers"] = len(sample)
+    benchmark.pedantic(score_answers, (words, sample, "first", 1), {"processes": 1}, rounds=1)
+
+# Tiers over synthetic scores
+def test_selector_build(benchmark, words):
+    rng = random.Random(0)
+    scores = {w: rng.randrange(200, 700) / 100 for w in words}
+    benchmark(DifficultySelector, scores, seed=1)
+
+def test_draw(benchmark, words):
+    rng = random.Random(0)
+    sel = DifficultySelector({w: rng.randrange(200, 700) / 100 for w in words}, seed=1)
+    benchmark(sel.draw, "hard")
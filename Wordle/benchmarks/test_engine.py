@@ -0,0 +1,38 @@
+import random
+import tracemalloc
+
+from GameEngine import GameEngine
+
+
+# Memory per active game, with a couple of guesses on each board
+def test_bytes_per_game(benchmark, words):
+    rng = random.Random(0)
+    n = 20_000
+
+    def build():
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        games = []
+        for _ in range(n):
+            g = GameEngine(rng.choice(words))
+            g.apply_guess(rng.choice(words))
+            for ch in rng.choice(words)[:3]:
+                g.push_char(ch)
+            games.append(g)
+        benchmark.extra_info["bytes_per_game"] = round((tracemalloc.get_traced_memory()[0] - before) / n)
+        tracemalloc.stop()
+
+    benchmark.pedantic(build, rounds=1)
+
+def test_guesses(benchmark, words):
+    rng = random.Random(0)
+    games = [GameEngine(rng.choice(words)) for _ in range(1000)]
+
+    def play():
+        for g in games:
+            g.reset(g.answer)
+            for guess in ("CRANE", "SLOTH", g.answer):
+                g.apply_guess(guess)
+
+    benchmark.extra_info["guesses"] = 3 * len(games)
+    benchmark(play)
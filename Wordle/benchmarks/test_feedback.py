@@ -0,0 +1,33 @@
+import random
+
+import numpy as np
+import pytest
+
+from Feedback import FeedbackMatrix, encode, evaluate_guess
+
+
+@pytest.fixture(scope="module")
+def pairs(words):
+    rng = random.Random(0)
+    return [(rng.choice(words), rng.choice(words)) for _ in range(20_000)]
+
+@pytest.fixture(scope="module")
+def matrix(words):
+    return FeedbackMatrix(words, cache_dir=None)
+
+def test_evaluate_guess(benchmark, pairs, matrix):
+    # Must agree with the scalar rules before timing anything
+    for g, a in pairs:
+        assert matrix.pattern(g, a) == encode(evaluate_guess(g, a)), (g, a)
+    benchmark.extra_info["pairs"] = len(pairs)
+    benchmark(lambda: [evaluate_guess(g, a) for g, a in pairs])
+
+def test_matrix_lookup(benchmark, pairs, matrix):
+    gi = np.array([matrix.index[g] for g, _ in pairs])
+    ai = np.array([matrix.index[a] for _, a in pairs])
+    benchmark.extra_info["pairs"] = len(pairs)
+    benchmark(matrix.lookup, gi, ai)
+
+def test_matrix_build(benchmark, words, matrix):
+    benchmark.extra_info["words"] = len(words)
+    benchmark.pedantic(FeedbackMatrix.build, (matrix.codes,), rounds=3)
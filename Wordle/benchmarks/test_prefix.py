@@ -0,0 +1,39 @@
+import tracemalloc
+
+from PrefixTrie import PrefixTrie
+
+
+def test_build(benchmark, words):
+    trie = benchmark.pedantic(PrefixTrie, (words,), rounds=3)
+    # Heap of the plain set the screens used to build, for comparison
+    tracemalloc.start()
+    as_set = {w.strip().upper() for w in words}
+    set_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del as_set
+    benchmark.extra_info.update(nodes=len(trie), trie_bytes=trie.nbytes, set_heap_bytes=set_bytes)
+
+# One keystroke = one cursor step; type every word and erase it again
+def test_cursor(benchmark, words):
+    sample = words[:500]
+    cursor = PrefixTrie(words).cursor()
+
+    def type_words():
+        for w in sample:
+            for ch in w:
+                cursor.push(ch)
+            for _ in w:
+                cursor.pop()
+
+    benchmark.extra_info["steps"] = 2 * sum(len(w) for w in sample)
+    benchmark(type_words)
+
+# Whole _push_char / _backspace on a live screen (no render)
+def test_screen_keys(benchmark, app):
+    screen = app.current
+
+    def keys():
+        screen._push_char("Q")
+        screen._backspace()
+
+    benchmark(keys)
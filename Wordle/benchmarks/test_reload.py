@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from ConstraintIndex import ConstraintIndex
+from PrefixTrie import PrefixTrie
+from WordIndex import WordShards
+
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+# Live word-list edits on a large list: finding the difference reads
+# the file once; applying it should cost the same for any list size
+@pytest.fixture(scope="module")
+def word_list(tmp_path_factory):
+    rng = random.Random(0)
+    pool = sorted({"".join(rng.choice(LETTERS) for _ in range(5)) for _ in range(100_000)})
+    path = tmp_path_factory.mktemp("reload") / "words.txt"
+    path.write_text("\n".join(pool), encoding="utf-8")
+    shards = WordShards(path)
+    yield path, pool, shards
+    shards.close()
+
+def test_rebuild(benchmark, word_list):
+    _, _, shards = word_list
+    shard = shards.get(5)
+    benchmark.extra_info["words"] = len(shard)
+    benchmark.pedantic(lambda: (ConstraintIndex(shard), PrefixTrie(shard)), rounds=3)
+
+@pytest.fixture(params=(10, 1000), ids=lambda n: f"diff_{n}")
+def edits(request, word_list):
+    path, pool, shards = word_list
+    rng = random.Random(request.param)
+    present = set(pool)
+    fresh = set()
+    while len(fresh) < request.param // 2:
+        w = "".join(rng.choice(LETTERS) for _ in range(5))
+        if w not in present:
+            fresh.add(w)
+    dropped = set(rng.sample(pool, request.param // 2))
+    edited = [w for w in pool if w not in dropped] + sorted(fresh)
+    shard = shards.get(5)
+    yield path, pool, edited, shards, ConstraintIndex(shard), PrefixTrie(shard)
+    path.write_text("\n".join(pool), encoding="utf-8")
+    shards.reload()
+
+# Alternate between the edited and the original list, one reload per round
+def flip(path, pool, edited, rounds):
+    targets = iter([edited, pool] * rounds)
+
+    def setup():
+        path.write_text("\n".join(next(targets)), encoding="utf-8")
+        return (), {}
+
+    return setup
+
+def test_reload_diff(benchmark, edits):
+    path, pool, edited, shards, _, _ = edits
+    benchmark.pedantic(lambda: shards.reload()[5], setup=flip(path, pool, edited, 3), rounds=6)
+
+def test_update_indexes(benchmark, edits):
+    path, pool, edited, shards, index, trie = edits
+    diffs = []
+    for target in (edited, pool) * 3:
+        path.write_text("\n".join(target), encoding="utf-8")
+        diffs.append(shards.reload()[5])
+        added, removed = diffs[-1]
+        index.update(added, removed)
+        trie.update(added, removed)
+    # Replay the same edits (forward, back) against the indexes only
+    replays = iter(diffs)
+    benchmark.pedantic(lambda added, removed: (index.update(added, removed), trie.update(added, removed)),
+                       setup=lambda: (next(replays), {}), rounds=len(diffs))
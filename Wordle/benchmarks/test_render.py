@@ -0,0 +1,97 @@
+import pygame
+import pytest
+
+from GlyphCache import glyph_cache
+from Layout import game_layout
+
+
+def full_frame(screen):
+    screen._full_redraw = True
+    screen.render()
+
+def test_game_frame(benchmark, app):
+    glyph_cache.hits = glyph_cache.misses = 0
+    benchmark(full_frame, app.current)
+    benchmark.extra_info["glyph_cache"] = glyph_cache.stats()
+
+# Roughly the old behaviour: every glyph rendered again each frame
+def test_game_frame_uncached(benchmark, app):
+    def cold():
+        glyph_cache.clear()
+        full_frame(app.current)
+
+    benchmark(cold)
+
+# Typical input frame: one row repainted
+def test_keystroke_frame(benchmark, app):
+    screen = app.current
+    typed = [False]
+
+    def keystroke():
+        if typed[0]:
+            screen._backspace()
+        else:
+            screen._push_char("A")
+        typed[0] = not typed[0]
+        screen.render()
+
+    benchmark(keystroke)
+
+def test_result_frame(benchmark, app):
+    result = app.result_screen("victory", app.context["answer"])
+    benchmark(full_frame, result)
+
+# A window drag: every frame brings a new size (layout, fonts, tiles
+# built once for it); dragging back over known sizes reuses them all
+SIZES = [(900 + 5 * i, 600 + 3 * i) for i in range(100)]
+
+def drag(app, path):
+    for size in path:
+        app.resize(size)
+        pygame.display.update(app.current.render())
+
+def test_resize_new_sizes(benchmark, app):
+    benchmark.extra_info["frames"] = len(SIZES)
+    benchmark.pedantic(drag, (app, SIZES), rounds=1)
+    app.resize((1200, 800))
+
+def test_resize_known_sizes(benchmark, app):
+    drag(app, SIZES)
+    benchmark.extra_info["frames"] = 2 * len(SIZES)
+    benchmark(drag, app, SIZES[::-1] + SIZES)
+    app.resize((1200, 800))
+
+def test_layout_lookup(benchmark):
+    benchmark(game_layout, 1200, 800, 6, 5, 1)
+
+@pytest.fixture(params=(2, 4, 8), ids=lambda n: f"{n}_boards")
+def boards(request, app, play):
+    app.new_game(boards=request.param)
+    play(app.current, ("CRANE", "SLOTH"))
+    yield app.current
+    app.new_game(boards=1)
+
+def test_multiboard_frame(benchmark, boards):
+    benchmark(full_frame, boards)
+
+def test_multiboard_keystroke(benchmark, boards):
+    typed = [False]
+
+    def keystroke():
+        if typed[0]:
+            boards._backspace()
+        else:
+            boards._push_char("A")
+        typed[0] = not typed[0]
+        boards.render()
+
+    benchmark(keystroke)
+
+def test_multiboard_reset_and_score(benchmark, boards):
+    engine, guess = boards.engine, boards.answers[-1]
+
+    def score():
+        engine.reset(boards.answers)
+        engine.apply_guess(guess)
+
+    benchmark(score)
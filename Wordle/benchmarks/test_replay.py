@@ -0,0 +1,44 @@
+import random
+
+import pygame
+
+from App import App
+from Replay import HEADER, KEYDOWN, MAGIC, QUIT, RECORD, VERDICT_NOW, VERSION, Replayer
+
+
+# Synthetic session: five misses (each typed, erased and retyped) then
+# the answer, one input per frame, every verdict local
+def test_replay(benchmark, words, tmp_path):
+    seed = 7
+    app = App(seed=seed, stats_path=None)
+    answer = random.Random(seed).choice(app.words)
+    rng = random.Random(seed)
+    records, frame = [], 0
+
+    def key(k):
+        nonlocal frame
+        records.append(RECORD.pack(frame, KEYDOWN, k, 0, 0))
+        frame += 1
+
+    for guess in [rng.choice(words) for _ in range(5)] + [answer]:
+        for ch in guess:
+            key(pygame.K_a + ord(ch) - 65)
+        for _ in guess:
+            key(pygame.K_BACKSPACE)
+        for ch in guess:
+            key(pygame.K_a + ord(ch) - 65)
+        records.append(RECORD.pack(frame, VERDICT_NOW, 1, 0, 0))
+        key(pygame.K_RETURN)
+    records.append(RECORD.pack(frame, QUIT, 0, 0, 0))
+
+    path = tmp_path / "session.wrec"
+    path.write_bytes(HEADER.pack(MAGIC, VERSION, seed, 0, 0) + b"".join(records))
+
+    def replay():
+        app.rng.seed(seed)
+        app.new_game()
+        return app.run(Replayer(str(path)))
+
+    frames = benchmark(replay)
+    assert app.context["result_type"] == "victory"
+    benchmark.extra_info.update(frames_per_replay=frames, log_bytes=HEADER.size + len(records) * RECORD.size)
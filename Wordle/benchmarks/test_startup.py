@@ -0,0 +1,79 @@
+import os
+
+import pygame
+
+from App import App
+
+# Launch to first frame of a fresh `python Main.py` (interpreter start,
+# imports, window, first render)
+FIRST_FRAME_BUDGET_MS = 750
+
+
+def test_construct(benchmark, game_dir):
+    benchmark(App, stats_path=None)
+
+# Time-to-first-frame includes the word list and the window
+def test_first_frame(benchmark, game_dir):
+    def first_frame():
+        app = App(stats_path=None)
+        pygame.display.update(app.current.render())
+        return app
+
+    app = benchmark(first_frame)
+    benchmark.extra_info["shards_loaded"] = app.shards.loaded
+
+# The constraint index and prefix trie finish building after it
+def test_indexes_ready(benchmark, game_dir):
+    benchmark.pedantic(lambda: App(stats_path=None).indexes(), rounds=3)
+
+def test_restart(benchmark, app):
+    def restart():
+        app.new_game()
+        pygame.display.update(app.current.render())
+
+    benchmark(restart)
+
+# A real launch in a fresh process (interpreter start, imports, window, first render)
+def test_process_first_frame(benchmark, launch):
+    reports = []
+    benchmark.pedantic(lambda: reports.append(launch()[1]), rounds=3)
+    best = min(reports, key=lambda r: r["first_frame_ms"])
+    benchmark.extra_info.update(imports_ms=best["imports_ms"], first_frame_ms=best["first_frame_ms"],
+                                indexes_ready_ms=best["indexes_ready_ms"])
+
+# Regression test, not a benchmark: runs with --benchmark-skip too.
+# Best of three launches, so one cold disk cache doesn't fail it
+def test_first_frame_budget(launch):
+    first_frame = min(launch()[1]["first_frame_ms"] for _ in range(3))
+    assert first_frame < FIRST_FRAME_BUDGET_MS, f"first frame after {first_frame} ms"
+
+def test_imports(benchmark, launch, game_dir, top: int = 12):
+    """
+    `python -X importtime Main.py --startup-report`, summarized: the
+    heaviest imports the game pulls in (cumulative, the outermost module
+    below the game's own) and the game's own modules (self time), in ms.
+    """
+    _, report, stderr = benchmark.pedantic(launch, ("-X", "importtime"), rounds=1)
+    own = {os.path.splitext(f)[0] for f in os.listdir(game_dir) if f.endswith(".py")}
+    heaviest, game = {}, {}
+    path = []
+    # "import time: self [us] | cumulative | <indent>name", children first:
+    # read bottom-up so every module comes after the one that imported it
+    for line in reversed(stderr.splitlines()):
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        name = name.strip()
+        del path[depth:]
+        if name in own:
+            game[name] = round(int(self_us) / 1000, 2)
+        elif all(p in own for p in path):
+            heaviest[name] = round(int(cumulative_us) / 1000, 2)
+        path.append(name)
+    benchmark.extra_info.update(
+        first_frame_ms=report["first_frame_ms"],
+        modules_loaded=report["modules"],
+        heaviest=dict(sorted(heaviest.items(), key=lambda kv: -kv[1])[:top]),
+        game_modules=dict(sorted(game.items(), key=lambda kv: -kv[1])),
+    )
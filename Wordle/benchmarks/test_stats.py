@@ -0,0 +1,32 @@
+import random
+
+import pytest
+
+from Stats import Stats
+
+
+@pytest.fixture
+def stats_path(tmp_path):
+    return tmp_path / "stats.bin"
+
+def test_record(benchmark, stats_path):
+    rng = random.Random(0)
+    stats = Stats(stats_path, compact_every=10_000)
+    benchmark(lambda: stats.record(rng.randrange(2000), 5, 1, rng.randint(1, 6), rng.random() < 0.8, 60.0))
+    stats.close()
+    benchmark.extra_info["file_bytes"] = stats_path.stat().st_size
+
+# Reopening folds in at most compact_every records
+def test_load(benchmark, stats_path):
+    rng = random.Random(0)
+    stats = Stats(stats_path, compact_every=10_000)
+    for i in range(25_000):
+        stats.record(i % 2000, 5, 1, rng.randint(1, 6), rng.random() < 0.8, 60.0)
+    stats.close()
+    benchmark(lambda: Stats(stats_path).close())
+
+def test_summary(benchmark):
+    stats = Stats(None)
+    for i in range(1000):
+        stats.record(i, 5, 1, i % 6 + 1, i % 5 != 0, 60.0)
+    benchmark(stats.summary)
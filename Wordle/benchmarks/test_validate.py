@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from MeaningCache import MeaningCache
+from Validator import WordValidator
+
+
+# A screen's validator (blocking) against the list, the verdict cache
+# and (on a miss) the stub API; an in-memory cache keeps the real one clean
+@pytest.fixture
+def screen(app, dictionary_url):
+    screen = app.current
+    screen.validator = WordValidator(screen.words_set, MeaningCache(":memory:"), url=dictionary_url)
+    screen.use_api_validate = True
+    yield screen
+    screen.validator.cache.close()
+
+@pytest.fixture
+def outside(words):
+    rng = random.Random(0)
+    listed = set(words)
+    out = []
+    while len(out) < 600:
+        w = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(5))
+        if w not in listed and w not in out:
+            out.append(w)
+    return out
+
+def is_valid(screen, word: str) -> bool:
+    screen.validator.use_api = screen.use_api_validate
+    return screen.validator.is_valid(word)
+
+def test_list_hit(benchmark, screen, words):
+    sample = words[:300]
+    benchmark.extra_info["words"] = len(sample)
+    assert all(benchmark(lambda: [is_valid(screen, w) for w in sample]))
+
+def test_cache_hit(benchmark, screen, outside):
+    cached = outside[:300]
+    for w in cached:
+        screen.validator.cache[w] = True
+    benchmark.extra_info["words"] = len(cached)
+    assert all(benchmark(lambda: [is_valid(screen, w) for w in cached]))
+
+# A miss only happens once per word (the verdict is cached after it)
+def test_miss(benchmark, screen, outside):
+    missed = iter(outside)
+    result = benchmark.pedantic(is_valid, setup=lambda: ((screen, next(missed)), {}), rounds=300)
+    assert result
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from WordIndex import MAX_LENGTH, MIN_LENGTH, WordIndex, WordShards
+from WordList import load_words
+
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+# Text parse vs. memory-mapped index, on the bundled and a large list
+@pytest.fixture(scope="module", params=("bundled", "synthetic"))
+def word_file(request, words, tmp_path_factory):
+    if request.param == "bundled":
+        pool = words
+    else:
+        rng = random.Random(0)
+        pool = sorted({"".join(rng.choice(LETTERS) for _ in range(5)) for _ in range(300_000)})
+    path = tmp_path_factory.mktemp("wordindex") / f"{request.param}.txt"
+    path.write_text("\n".join(pool), encoding="utf-8")
+    WordIndex.load(path).close()  # compile once
+    return path, pool
+
+def test_text_load(benchmark, word_file):
+    path, pool = word_file
+    benchmark.extra_info["words"] = len(pool)
+    benchmark(lambda: set(load_words(path)))
+
+def test_index_load(benchmark, word_file):
+    path, _ = word_file
+    benchmark(lambda: WordIndex.load(path).close())
+
+def test_lookup(benchmark, word_file):
+    path, pool = word_file
+    rng = random.Random(0)
+    probes = [rng.choice(pool) for _ in range(10_000)]
+    idx = WordIndex.load(path)
+    benchmark.extra_info["probes"] = len(probes)
+    assert all(benchmark(lambda: [p in idx for p in probes]))
+    idx.close()
+
+# Mixed-length list: only the shards asked for should ever load
+def test_shard_load(benchmark, words, tmp_path):
+    import tracemalloc
+
+    rng = random.Random(0)
+    pool = list(words)
+    for n in range(MIN_LENGTH, MAX_LENGTH + 1):
+        pool += ["".join(rng.choice(LETTERS) for _ in range(n)) for _ in range(50_000)]
+    path = tmp_path / "words.txt"
+    path.write_text("\n".join(pool), encoding="utf-8")
+    for n in range(MIN_LENGTH, MAX_LENGTH + 1):
+        WordShards(path).get(n)     # compile every shard once
+
+    def setup():
+        return (WordShards(path),), {}
+
+    loaded = []
+    benchmark.pedantic(lambda shards: loaded.append(shards) or shards.get(5), setup=setup, rounds=5)
+    for shards in loaded:
+        shards.close()
+
+    tracemalloc.start()
+    shards = WordShards(path)
+    shards.get(5)
+    one_shard = tracemalloc.get_traced_memory()[0]
+    benchmark.extra_info["loaded_after_startup"] = shards.loaded
+    for n in range(MIN_LENGTH, MAX_LENGTH + 1):
+        shards.get(n)
+    all_shards = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    benchmark.extra_info.update(
+        heap_bytes_one_shard=one_shard,
+        heap_bytes_all_shards=all_shards,
+        mapped_bytes={str(n): shards[n].path.stat().st_size for n in shards.loaded},
+    )
+    shards.close()
@@ -0,0 +1,25 @@
+import random
+
+import pytest
+
+from WordList import load_words
+
+
+def test_small(benchmark):
+    benchmark(load_words, "WordList.txt")
+
+# A million lines (mixed lengths, case and junk, like a raw dictionary dump)
+@pytest.fixture(scope="module")
+def large(tmp_path_factory):
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    path = tmp_path_factory.mktemp("wordlist") / "large.txt"
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(1_000_000):
+            f.write("".join(rng.choice(letters) for _ in range(rng.randint(3, 9))) + "\n")
+    return path
+
+def test_large(benchmark, large):
+    benchmark.extra_info["lines"] = 1_000_000
+    benchmark.extra_info["words"] = len(load_words(large))
+    benchmark.pedantic(load_words, (large,), rounds=3)
@@ -0,0 +1,63 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from App import App
+from Layout import CACHE_SIZE
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class TieredAnswersTest(unittest.TestCase):
+    def setUp(self):
+        # The game reads WordList.txt and its difficulty catalog from its own folder
+        cwd = os.getcwd()
+        os.chdir(HERE)
+        self.addCleanup(os.chdir, cwd)
+        self.app = App(seed=1, boards=4, tier="hard", stats_path=None)
+        self.sel = self.app.selector()
+
+    # Hot-reload removals leave `keep` words of the tier
+    def remove_all_but(self, keep: int):
+        pool = self.sel.pools["hard"]
+        self.sel.update(removed=pool[keep:])
+        return set(pool[:keep])
+
+    def test_fewer_words_than_boards(self):
+        left = self.remove_all_but(2)
+        self.app.new_game()
+        answers = self.app.context["answers"]
+        self.assertEqual(set(answers), left)
+        self.assertEqual(len(self.app.current.answers), 2)
+
+    def test_no_words_left(self):
+        self.remove_all_but(0)
+        with self.assertRaises(ValueError):
+            self.app.new_game()
+
+    def test_enough_words(self):
+        self.remove_all_but(10)
+        self.app.new_game()
+        answers = self.app.context["answers"]
+        self.assertEqual(len(set(answers)), 4)
+
+
+
+class WindowDragTest(unittest.TestCase):
+    def test_font_cache_is_bounded(self):
+        cwd = os.getcwd()
+        os.chdir(HERE)
+        self.addCleanup(os.chdir, cwd)
+        res = App(stats_path=None).resources
+        for w in range(600, 1800, 4):       # one drag, 300 sizes
+            res.resize((w, w * 2 // 3))
+        self.assertLessEqual(len(res._sized_fonts), CACHE_SIZE)
+        # The fonts in use survive eviction
+        for font in res.fonts.values():
+            self.assertIn(font, res._sized_fonts.values())
+
+
+if __name__ == "__main__":
+    unittest.main()
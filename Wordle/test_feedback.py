@@ -0,0 +1,59 @@
+import os
+import random
+import unittest
+
+import numpy as np
+
+from Feedback import FeedbackMatrix, evaluate_codes, to_codes
+from GameEngine import decode, encode, evaluate_guess
+from WordList import load_words
+
+# (guess, answer) pairs that exercise the double-letter rules
+DOUBLE_LETTERS = [
+    ("EERIE", "THREE"), ("THREE", "EERIE"),
+    ("SPEED", "ABIDE"), ("ABIDE", "SPEED"),
+    ("LLAMA", "HELLO"), ("HELLO", "LLAMA"),
+    ("GEESE", "EERIE"), ("ROBOT", "FLOOR"), ("SASSY", "ASSES"),
+]
+
+
+class EvaluateCodesTest(unittest.TestCase):
+    def assert_agrees(self, pairs):
+        guesses = to_codes([g for g, _ in pairs], len(pairs[0][0]))
+        answers = to_codes([a for _, a in pairs], len(pairs[0][1]))
+        patterns = evaluate_codes(guesses, answers)
+        for i, (g, a) in enumerate(pairs):
+            expected = evaluate_guess(g, a)
+            self.assertEqual(decode(int(patterns[i, i]), len(g)), expected, (g, a))
+            self.assertEqual(int(patterns[i, i]), encode(expected), (g, a))
+
+    def test_double_letters(self):
+        self.assert_agrees(DOUBLE_LETTERS)
+
+    def test_random_sample(self):
+        words = load_words(os.path.join(os.path.dirname(os.path.abspath(__file__)), "WordList.txt"))
+        rng = random.Random(0)
+        self.assert_agrees([(rng.choice(words), rng.choice(words)) for _ in range(500)])
+
+    def test_other_lengths(self):
+        self.assert_agrees([("LETTER", "SETTLE"), ("PEPPER", "REPAPE")])
+
+    def test_empty_list_keeps_length(self):
+        self.assertEqual(to_codes([], 7).shape, (0, 7))
+        self.assertEqual(evaluate_codes(to_codes(["CRANE"]), to_codes([])).shape, (1, 0))
+
+
+class FeedbackMatrixTest(unittest.TestCase):
+    def test_pattern_matches_evaluate_guess(self):
+        words = sorted({w for pair in DOUBLE_LETTERS for w in pair} | {"CRANE", "SLOTH"})
+        matrix = FeedbackMatrix(words, cache_dir=None)
+        for g in words:
+            for a in words:
+                self.assertEqual(matrix.pattern(g, a), encode(evaluate_guess(g, a)), (g, a))
+        row = matrix.evaluate_many("EERIE", words)
+        self.assertEqual(list(row), [encode(evaluate_guess("EERIE", a)) for a in words])
+        self.assertEqual(row.dtype, np.uint8)
+
+
+if __name__ == "__main__":
+    unittest.main()
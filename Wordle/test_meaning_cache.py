@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+
+import MeaningCache as meaning_cache
+from MeaningCache import DAY, DEFAULT_MAX_ENTRIES, MeaningCache
+
+
+class MeaningCacheCapTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "verdicts.sqlite3")
+
+    def open(self, **kwargs) -> MeaningCache:
+        cache = MeaningCache(self.path, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_default_cap(self):
+        self.assertEqual(self.open().max_entries, DEFAULT_MAX_ENTRIES)
+
+    def test_warmed_store_survives_game_insert(self):
+        # WarmUp raises the cap and fills the store past 90% of it
+        warm = self.open()
+        warm.resize(100)
+        warm.set_many((f"W{i:03d}", True) for i in range(95))
+        warm.close()
+
+        # The game reopens it without a cap and stores one more verdict
+        game = self.open()
+        self.assertEqual(game.max_entries, 100)
+        game.set("EXTRA", False)
+        self.assertEqual(len(game), 96)
+        self.assertEqual(game.evictions, 0)
+        self.assertTrue(game.get("W000"))
+
+    def test_explicit_cap_is_not_stored(self):
+        self.open(max_entries=10).close()
+        self.assertEqual(self.open().max_entries, DEFAULT_MAX_ENTRIES)
+
+    def test_shrinking_evicts_least_recently_used(self):
+        cache = self.open()
+        cache.set_many((f"W{i:03d}", True) for i in range(20))
+        cache.get("W000")   # most recently used now
+        cache.resize(10)
+        self.assertEqual(len(cache), 9)     # down to 90% of the cap
+        self.assertTrue(cache.get("W000"))
+
+
+class MeaningCacheVerdictTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = MeaningCache(":memory:", ttl_positive=10 * DAY, ttl_negative=DAY)
+        self.addCleanup(self.cache.close)
+
+    # Pretend a verdict was stored `seconds` ago
+    def age(self, word: str, seconds: float):
+        self.cache._db.execute("UPDATE verdicts SET stored = stored - ? WHERE word = ?", (seconds, word))
+
+    def used(self, word: str) -> float:
+        return self.cache._db.execute("SELECT used FROM verdicts WHERE word = ?", (word,)).fetchone()[0]
+
+    def test_hit_and_miss_counters(self):
+        self.cache.set("CRANE", True)
+        self.cache.set("QQQQQ", False)
+        self.assertIs(self.cache.get("CRANE"), True)
+        self.assertIs(self.cache.get("QQQQQ"), False)
+        self.assertIsNone(self.cache.get("SLOTH"))
+        self.assertEqual(self.cache.get("SLOTH", "default"), "default")
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (2, 2, 2))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_negative_verdict_expires_first(self):
+        self.cache.set("CRANE", True)
+        self.cache.set("QQQQQ", False)
+        self.age("CRANE", 2 * DAY)
+        self.age("QQQQQ", 2 * DAY)
+        self.assertIs(self.cache.get("CRANE"), True)
+        self.assertIsNone(self.cache.get("QQQQQ"))
+        self.assertEqual(len(self.cache), 1)     # the expired row is gone
+
+    def test_positive_verdict_expires(self):
+        self.cache.set("CRANE", True)
+        self.age("CRANE", 11 * DAY)
+        self.assertIsNone(self.cache.get("CRANE"))
+        self.assertNotIn("CRANE", self.cache.positives())
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_hits_are_written_in_batches(self):
+        self.cache.set("CRANE", True)
+        stored = self.used("CRANE")
+        self.cache.get("CRANE")
+        self.assertEqual(self.used("CRANE"), stored)     # buffered, no write yet
+        for i in range(meaning_cache.TOUCH_BATCH):
+            self.cache.set(f"W{i:04d}", True)
+            self.cache.get(f"W{i:04d}")
+        self.assertGreater(self.used("CRANE"), stored)
+
+    def test_buffered_hits_count_for_eviction(self):
+        self.cache.resize(10)
+        for i in range(10):
+            self.cache.set(f"W{i:04d}", True)
+        self.cache.get("W0000")     # oldest row, but just used
+        self.cache.set("EXTRA", True)
+        self.assertIs(self.cache.get("W0000"), True)
+        self.assertIsNone(self.cache.get("W0001"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+
+from LoadGen import Client, run_local
+from Server import MAX_BODY, WordleServer
+from Validator import WordValidator
+
+WORDS = ["CRANE", "SLOTH", "PLUMB", "GLYPH", "TRAWL"]
+
+
+# Accepts any word, answering from another thread after `delay` seconds
+class SlowValidator:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def check(self, word: str) -> Future:
+        future = Future()
+        threading.Timer(self.delay, future.set_result, (True,)).start()
+        return future
+
+
+class WordleServerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # Offline: only the list validates, nothing touches the network
+        self.server = WordleServer(WORDS, WordValidator(set(WORDS), use_api=False), max_sessions=3)
+        self.port = await self.server.start("127.0.0.1", 0)
+        self.client = Client("127.0.0.1", self.port)
+        await self.client.connect()
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.server.stop()
+
+    async def new_game(self, answer: str = "CRANE") -> str:
+        status, game = await self.client.request("POST", "/new")
+        self.assertEqual(status, 200)
+        self.server.sessions[game["id"]].engine.reset(answer)
+        return game["id"]
+
+    # Raw request on its own connection: (status, JSON body)
+    async def raw(self, request: bytes):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(request)
+        await writer.drain()
+        data = await reader.read()
+        writer.close()
+        head, _, body = data.partition(b"\r\n\r\n")
+        return int(head.split()[1]), json.loads(body) if body else None
+
+    async def test_new_game(self):
+        status, game = await self.client.request("POST", "/new")
+        self.assertEqual(status, 200)
+        self.assertEqual((game["rows"], game["cols"]), (6, 5))
+        self.assertIn(game["id"], self.server.sessions)
+
+    async def test_guess_and_state(self):
+        sid = await self.new_game("CRANE")
+        status, res = await self.client.request("POST", "/guess", {"id": sid, "guess": "slOTH"})
+        self.assertEqual(status, 200)
+        self.assertTrue(res["valid"])
+        self.assertEqual(len(res["colors"]), 5)
+        self.assertIsNone(res["result"])
+
+        status, res = await self.client.request("POST", "/guess", {"id": sid, "guess": "crane"})
+        self.assertEqual(res["result"], "victory")
+
+        status, state = await self.client.request("GET", f"/state?id={sid}")
+        self.assertEqual(status, 200)
+        self.assertEqual([g["word"] for g in state["guesses"]], ["SLOTH", "CRANE"])
+        self.assertEqual(state["answer"], "CRANE")
+
+    async def test_unknown_word_is_not_a_guess(self):
+        sid = await self.new_game()
+        status, res = await self.client.request("POST", "/guess", {"id": sid, "guess": "QQQQQ"})
+        self.assertEqual((status, res), (200, {"valid": False}))
+        self.assertEqual(self.server.sessions[sid].engine.cur_row, 0)
+
+    async def test_unknown_session(self):
+        status, _ = await self.client.request("POST", "/guess", {"id": "nope", "guess": "CRANE"})
+        self.assertEqual(status, 404)
+        status, _ = await self.client.request("GET", "/state?id=nope")
+        self.assertEqual(status, 404)
+
+    async def test_bad_guesses(self):
+        sid = await self.new_game()
+        for guess in ("CRAN", "CR4NE", "ÉCLAT"):
+            status, _ = await self.client.request("POST", "/guess", {"id": sid, "guess": guess})
+            self.assertEqual(status, 400, guess)
+
+    async def test_malformed_bodies(self):
+        for body in (b"{", b"[]", b"42", b'{"id": 1, "guess": "CRANE"}'):
+            status, _ = await self.raw(b"POST /guess HTTP/1.1\r\nContent-Length: %d\r\n"
+                                       b"Connection: close\r\n\r\n%s" % (len(body), body))
+            self.assertEqual(status, 400, body)
+
+    async def test_bad_content_length(self):
+        for value in (b"abc", b"-5"):
+            status, _ = await self.raw(b"POST /guess HTTP/1.1\r\nContent-Length: %s\r\n\r\n" % value)
+            self.assertEqual(status, 400, value)
+
+    async def test_oversized_body(self):
+        status, _ = await self.raw(b"POST /guess HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % (MAX_BODY + 1))
+        self.assertEqual(status, 413)
+
+    async def test_oversized_line_drops_connection(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(b"GET /" + b"A" * 100_000 + b" HTTP/1.1\r\n\r\n")
+        await writer.drain()
+        self.assertEqual(await reader.read(), b"")
+        writer.close()
+        # The server itself keeps going
+        status, _ = await self.client.request("POST", "/new")
+        self.assertEqual(status, 200)
+
+    async def test_wrong_method(self):
+        status, _ = await self.client.request("GET", "/new")
+        self.assertEqual(status, 405)
+
+    async def test_least_recently_used_session_is_evicted(self):
+        first, second, third = [await self.new_game() for _ in range(3)]
+        await self.client.request("GET", f"/state?id={first}")     # first is now the most recent
+        await self.new_game()
+        self.assertNotIn(second, self.server.sessions)
+        self.assertIn(first, self.server.sessions)
+        self.assertIn(third, self.server.sessions)
+        self.assertEqual(self.server.evicted, 1)
+
+    async def test_idle_sessions_are_evicted(self):
+        old = await self.new_game()
+        self.server.sessions[old].last_seen -= self.server.idle_timeout + 1
+        fresh = await self.new_game()
+        self.assertEqual(self.server.evict_idle(), 1)
+        self.assertEqual(list(self.server.sessions), [fresh])
+
+    async def test_lookup_does_not_block_the_loop(self):
+        self.server.validator = SlowValidator(0.3)
+        sid = await self.new_game()
+        guess = asyncio.create_task(self.client.request("POST", "/guess", {"id": sid, "guess": "QUOTA"}))
+        await asyncio.sleep(0.05)
+
+        # Another player is served while the lookup is in flight
+        other = Client("127.0.0.1", self.port)
+        await other.connect()
+        t0 = time.perf_counter()
+        status, _ = await other.request("GET", "/stats")
+        await other.close()
+        self.assertEqual(status, 200)
+        self.assertLess(time.perf_counter() - t0, 0.2)
+        self.assertFalse(guess.done())
+
+        status, res = await guess
+        self.assertTrue(res["valid"])
+
+    async def test_stats(self):
+        await self.new_game()
+        status, stats = await self.client.request("GET", "/stats")
+        self.assertEqual(stats, {"sessions": 1, "created": 1, "evicted": 0})
+
+
+class LoadGenTest(unittest.IsolatedAsyncioTestCase):
+    async def test_run_local(self):
+        report = await run_local(WORDS, players=4, games=3, seed=1)
+        self.assertEqual(report["sessions"], 12)
+        self.assertGreaterEqual(report["guesses"], 12)
+        self.assertGreater(report["guess_p99_ms"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
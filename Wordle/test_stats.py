@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+from Stats import HEADER, RECORD, SNAPSHOT, Stats
+
+
+class StatsFileTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "stats.bin")
+
+    def open(self, **kwargs) -> Stats:
+        stats = Stats(self.path, **kwargs)
+        self.addCleanup(stats.close)
+        return stats
+
+    def test_rounds_survive_reopen(self):
+        stats = self.open()
+        stats.record(0, 5, 1, 3, True, 12.5)
+        stats.record(1, 5, 1, 6, False, 30.0)
+        stats.close()
+        again = self.open()
+        self.assertEqual((again.played, again.wins, again.streak, again.max_streak), (2, 1, 0, 1))
+        self.assertEqual(again.summary()["distribution"], {3: 1})
+
+    def test_foreign_file_is_moved_aside(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a stats file")
+        stats = self.open()
+        self.assertEqual(stats.played, 0)
+        with open(self.path + ".bak", "rb") as f:
+            self.assertEqual(f.read(), b"not a stats file")
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(4), b"WSTA")
+
+    def test_torn_record_is_dropped(self):
+        stats = self.open()
+        stats.record(0, 5, 1, 4, True, 10.0)
+        stats.close()
+        with open(self.path, "ab") as f:
+            f.write(RECORD.pack(1, 5, 1, 2, 1, 0)[:5])  # crash mid-write
+        again = self.open()
+        self.assertEqual((again.played, again.wins), (1, 1))
+        # Compacted on load: just the header and snapshot are left
+        self.assertEqual(os.path.getsize(self.path), HEADER.size + SNAPSHOT.size)
+        self.assertEqual(again.pending, 0)
+
+    def test_write_error_falls_back_to_memory(self):
+        stats = self.open()
+        stats.record(0, 5, 1, 3, True, 1.0)
+        stats.close()
+        broken = stats._file = open(self.path, "rb")    # writes raise an OSError
+        stats.record(1, 5, 1, 4, True, 1.0)
+        self.assertTrue(broken.closed)
+        self.assertIsNone(stats._file)
+        self.assertIsNone(stats.path)
+        stats.record(2, 5, 1, 5, True, 1.0)
+        self.assertEqual(stats.played, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import http.server
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import Validator
+from Validator import WordValidator
+
+VALID = b'[{"meanings": [{"partOfSpeech": "noun"}]}]'
+
+
+# Local dictionary endpoint: per-word (status, delay in seconds), 404 otherwise
+class StubDictionary:
+    def __init__(self, routes: dict):
+        self.routes = routes
+        self.requests = []
+        stub = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                word = self.path.strip("/").upper()
+                stub.requests.append(word)
+                status, delay = stub.routes.get(word, (404, 0))
+                time.sleep(delay)
+                body = VALID if status == 200 else b'{"title": "No Definitions Found"}'
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except OSError:
+                    pass    # client gave up (timeout test)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/{{word}}"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class WordValidatorTest(unittest.TestCase):
+    def stub(self, routes: dict) -> StubDictionary:
+        stub = StubDictionary(routes)
+        self.addCleanup(stub.close)
+        return stub
+
+    def validator(self, stub: StubDictionary, words=(), timeout: float = 2.0) -> WordValidator:
+        return WordValidator(set(words), cache={}, url=stub.url, timeout=timeout)
+
+    def test_listed_word_skips_network(self):
+        stub = self.stub({})
+        future = self.validator(stub, {"CRANE"}).check("CRANE")
+        self.assertTrue(future.done())
+        self.assertTrue(future.result())
+        self.assertEqual(stub.requests, [])
+
+    def test_fast_base_beats_slow_word(self):
+        # CATS itself answers after 1.5 s; its base CAT answers at once
+        stub = self.stub({"CATS": (200, 1.5), "CAT": (200, 0)})
+        t0 = time.perf_counter()
+        self.assertTrue(self.validator(stub).check("CATS").result(timeout=5))
+        self.assertLess(time.perf_counter() - t0, 1.0)
+
+    def test_first_success_cancels_queued_lookups(self):
+        # One worker: the word's own lookup wins, its base is still queued
+        stub = self.stub({"CATS": (200, 0)})
+        old, Validator._executor = Validator._executor, ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(setattr, Validator, "_executor", old)
+        self.assertTrue(self.validator(stub).check("CATS").result(timeout=5))
+        Validator._executor.shutdown(wait=True)
+        self.assertEqual(stub.requests, ["CATS"])
+
+    def test_all_negative(self):
+        stub = self.stub({})
+        self.assertFalse(self.validator(stub).check("DOGS").result(timeout=5))
+        self.assertEqual(sorted(stub.requests), ["DOG", "DOGS"])
+
+    def test_negative_answer_is_cached(self):
+        stub = self.stub({})
+        validator = self.validator(stub)
+        self.assertFalse(validator.check("GLYPH").result(timeout=5))
+        self.assertIs(validator.cache.get("GLYPH"), False)
+
+    def test_server_error_rejects_without_caching(self):
+        stub = self.stub({"QUIPS": (500, 0), "QUIP": (429, 0)})
+        validator = self.validator(stub)
+        self.assertFalse(validator.check("QUIPS").result(timeout=5))
+        self.assertEqual(validator.cache, {})
+
+    def test_timeout_rejects_without_caching(self):
+        stub = self.stub({"GLOOM": (200, 1.0)})
+        validator = self.validator(stub, timeout=0.2)
+        t0 = time.perf_counter()
+        self.assertFalse(validator.check("GLOOM").result(timeout=5))
+        self.assertLess(time.perf_counter() - t0, 1.0)
+        self.assertEqual(validator.cache, {})
+
+    def test_unreachable_endpoint_caches_nothing(self):
+        stub = self.stub({})
+        stub.close()    # nothing listens on the port any more
+        validator = WordValidator(set(), cache={}, url=stub.url, timeout=1.0)
+        self.assertFalse(validator.check("PLUMB").result(timeout=5))
+        self.assertEqual(validator.cache, {})
+
+    def test_failed_lookup_not_persisted(self):
+        from MeaningCache import MeaningCache
+
+        stub = self.stub({"TRAWL": (500, 0)})
+        cache = MeaningCache(":memory:")
+        self.addCleanup(cache.close)
+        validator = WordValidator(set(), cache=cache, url=stub.url)
+        self.assertFalse(validator.check("TRAWL").result(timeout=5))
+        self.assertIsNone(cache.get("TRAWL"))
+
+    def test_check_does_not_block(self):
+        stub = self.stub({"BRISK": (200, 0.5)})
+        t0 = time.perf_counter()
+        future = self.validator(stub).check("BRISK")
+        self.assertLess(time.perf_counter() - t0, 0.2)
+        self.assertFalse(future.done())
+        self.assertTrue(future.result(timeout=5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import WarmUp
+from MeaningCache import MeaningCache
+from test_validator import StubDictionary
+from WarmUp import load_checkpoint, warm_up
+
+
+class WarmUpTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.checkpoint = os.path.join(tmp.name, "warmup.checkpoint")
+        self.cache = MeaningCache(os.path.join(tmp.name, "verdicts.sqlite3"))
+        self.addCleanup(self.cache.close)
+
+    def stub(self, routes: dict) -> StubDictionary:
+        stub = StubDictionary(routes)
+        self.addCleanup(stub.close)
+        return stub
+
+    def warm_up(self, stub, candidates, **kwargs) -> dict:
+        kwargs = {"concurrency": 4, "rate": 0, "timeout": 2.0, "retries": 0, **kwargs}
+        return warm_up(candidates, self.cache, self.checkpoint, stub.url, **kwargs)
+
+    def test_verdicts_reach_store_and_checkpoint(self):
+        stub = self.stub({"CRANE": (200, 0), "SLOTH": (200, 0)})
+        report = self.warm_up(stub, ["CRANE", "SLOTH", "QQQQQ"])
+        self.assertEqual((report["positive"], report["negative"], report["failed"]), (2, 1, 0))
+        self.assertEqual(load_checkpoint(self.checkpoint), {"CRANE": True, "SLOTH": True, "QQQQQ": False})
+        self.assertIs(self.cache.get("CRANE"), True)
+        self.assertIs(self.cache.get("QQQQQ"), False)
+
+    def test_failed_lookup_is_neither_stored_nor_checkpointed(self):
+        stub = self.stub({"TRAWL": (500, 0)})
+        report = self.warm_up(stub, ["TRAWL"])
+        self.assertEqual(report["failed"], 1)
+        self.assertEqual(load_checkpoint(self.checkpoint), {})
+        self.assertIsNone(self.cache.get("TRAWL"))
+
+    def test_resume(self):
+        # A crashed run checkpointed two words; only GLYPH reached the store
+        with open(self.checkpoint, "w", encoding="utf-8") as f:
+            f.write("CRANE 1\nGLYPH 0\nSLO")     # torn last line
+        self.cache.set("GLYPH", False)
+        self.cache._db.execute("UPDATE verdicts SET stored = stored - 3600")
+        stored = self.cache._db.execute("SELECT stored FROM verdicts").fetchone()[0]
+
+        stub = self.stub({"SLOTH": (200, 0)})
+        report = self.warm_up(stub, ["CRANE", "GLYPH", "SLOTH"])
+        self.assertEqual(report["resumed"], 2)
+        self.assertEqual(stub.requests, ["SLOTH"])
+        self.assertIs(self.cache.get("CRANE"), True)
+        self.assertIs(self.cache.get("SLOTH"), True)
+        # Already stored: not re-stamped, so its negative TTL still runs from the first run
+        row = self.cache._db.execute("SELECT stored FROM verdicts WHERE word = 'GLYPH'").fetchone()
+        self.assertEqual(row[0], stored)
+
+    def test_in_flight_window_is_bounded(self):
+        outstanding, peak, lock = [0], [0], threading.Lock()
+
+        def finished(_):
+            with lock:
+                outstanding[0] -= 1
+
+        class CountingPool(ThreadPoolExecutor):
+            def submit(self, *args, **kwargs):
+                with lock:
+                    outstanding[0] += 1
+                    peak[0] = max(peak[0], outstanding[0])
+                future = super().submit(*args, **kwargs)
+                future.add_done_callback(finished)
+                return future
+
+        self.addCleanup(setattr, WarmUp, "ThreadPoolExecutor", ThreadPoolExecutor)
+        WarmUp.ThreadPoolExecutor = CountingPool
+        report = self.warm_up(self.stub({}), [f"W{i:04d}" for i in range(200)], concurrency=2)
+        self.assertEqual(report["negative"], 200)
+        self.assertLessEqual(peak[0], 4)    # 2 x concurrency
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import os
+import tempfile
+import unittest
+
+from WordIndex import WordIndex, compile_index
+from WordList import load_words
+
+
+class LoadWordsTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "words.txt")
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("crane\néclat\n Slate \nnaïve\ncr4ne\nslates\n")
+
+    def test_ascii_letters_only(self):
+        self.assertEqual(load_words(self.path), ["CRANE", "SLATE"])
+
+    def test_index_does_not_alias_accented_words(self):
+        index = WordIndex(compile_index(self.path))
+        self.addCleanup(index.close)
+        self.assertEqual(list(index), ["CRANE", "SLATE"])
+        self.assertNotIn("ICLAT", index)
+
+    def test_no_valid_words(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("éclat\nnaïve\n")
+        with self.assertRaises(ValueError):
+            load_words(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()